@@ -8,6 +8,7 @@ from .client import Arkiv, AsyncArkiv
 from .events import EventFilter
 from .events_async import AsyncEventFilter
 from .node import ArkivNode
+from .pipeline import TxPipeline
 from .query_builder import (
     AsyncQueryBuilder,
     Expr,
@@ -63,5 +64,6 @@ __all__ = [
     "StrAttr",
     "StrSort",
     "TransactionReceipt",
+    "TxPipeline",
     "UpdateEvent",
 ]
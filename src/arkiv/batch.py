@@ -260,8 +260,10 @@ class BatchBuilder(BatchBuilderBase["ArkivModule"]):
             raise RuntimeError("Cannot execute empty batch - no operations added")
 
         operations = self._build_operations()
-        self._receipt = self._module.execute(operations)
-        return self._receipt
+        receipt = self._module.execute(operations)
+        self._module._check_receipt_operations(operations, receipt)
+        self._receipt = receipt
+        return receipt
 
     def __enter__(self) -> BatchBuilder:
         """Enter context manager."""
@@ -308,8 +310,10 @@ class AsyncBatchBuilder(BatchBuilderBase["AsyncArkivModule"]):
             raise RuntimeError("Cannot execute empty batch - no operations added")
 
         operations = self._build_operations()
-        self._receipt = await self._module.execute(operations)
-        return self._receipt
+        receipt = await self._module.execute(operations)
+        self._module._check_receipt_operations(operations, receipt)
+        self._receipt = receipt
+        return receipt
 
     async def __aenter__(self) -> AsyncBatchBuilder:
         """Enter async context manager."""
@@ -16,7 +16,7 @@ from web3.types import Wei
 from .account import NamedAccount
 from .client_base import ArkivBase
 from .module import ArkivModule
-from .module_async import AsyncArkivModule
+from .module_async import AsyncArkivModule, ReceiptConfirmation
 
 # Set up logger for Arkiv client
 logger = logging.getLogger(__name__)
@@ -33,6 +33,8 @@ class Arkiv(ArkivBase, Web3):
         self,
         provider: BaseProvider | None = None,
         account: NamedAccount | LocalAccount | None = None,
+        receipt_poll_latency: float | None = None,
+        receipt_timeout: float | None = None,
         **kwargs: Any,
     ) -> None:
         """Initialize Arkiv client with Web3 provider.
@@ -64,6 +66,9 @@ class Arkiv(ArkivBase, Web3):
             account: Optional NamedAccount to use as the default signer.
                 If None and provider is None, creates 'default' account.
                 Auto-funded with test ETH if using local node and balance is zero.
+            receipt_poll_latency: Seconds between polls while waiting for transaction
+                receipts (default: 0.5, RECEIPT_POLL_LATENCY_DEFAULT).
+            receipt_timeout: Seconds to wait for a transaction receipt (default: 120).
             **kwargs: Additional arguments passed to Web3 constructor
 
         Note:
@@ -85,7 +90,11 @@ class Arkiv(ArkivBase, Web3):
         Web3.__init__(self, provider, **kwargs)
 
         # Initialize entity management module
-        self.arkiv = ArkivModule(self)
+        self.arkiv = ArkivModule(
+            self,
+            receipt_poll_latency=receipt_poll_latency,
+            receipt_timeout=receipt_timeout,
+        )
 
         # Set account if provided
         if account:
@@ -105,6 +114,7 @@ class Arkiv(ArkivBase, Web3):
         # Cleanup event filters first
         logger.debug("Cleaning up event filters...")
         self.arkiv.cleanup_filters()
+        self.arkiv._shutdown_prefetch_executor()
 
         # Then stop the node if managed
         self._cleanup_node()
@@ -169,6 +179,9 @@ class AsyncArkiv(ArkivBase, AsyncWeb3):
         self,
         provider: AsyncBaseProvider | None = None,
         account: NamedAccount | LocalAccount | None = None,
+        receipt_poll_latency: float | None = None,
+        receipt_timeout: float | None = None,
+        receipt_confirmation: ReceiptConfirmation = "poll",
         **kwargs: Any,
     ) -> None:
         """Initialize AsyncArkiv client with async Web3 provider.
@@ -200,6 +213,12 @@ class AsyncArkiv(ArkivBase, AsyncWeb3):
             account: Optional NamedAccount to use as the default signer.
                 If None and provider is None, creates 'default' account.
                 Auto-funded with test ETH if using local node and balance is zero.
+            receipt_poll_latency: Seconds between polls while waiting for transaction
+                receipts (default: 0.5, RECEIPT_POLL_LATENCY_DEFAULT).
+            receipt_timeout: Seconds to wait for a transaction receipt (default: 120).
+            receipt_confirmation: "poll" (default) or "subscribe" to check for
+                receipts on each new block of a newHeads subscription instead of
+                polling. Requires a WebSocket provider, otherwise polling is used.
             **kwargs: Additional arguments passed to AsyncWeb3 constructor
 
         Note:
@@ -221,7 +240,12 @@ class AsyncArkiv(ArkivBase, AsyncWeb3):
         AsyncWeb3.__init__(self, provider, **kwargs)
 
         # Initialize async entity management module
-        self.arkiv = AsyncArkivModule(self)
+        self.arkiv = AsyncArkivModule(
+            self,
+            receipt_poll_latency=receipt_poll_latency,
+            receipt_timeout=receipt_timeout,
+            receipt_confirmation=receipt_confirmation,
+        )
 
         # Cache for connection status (used by __repr__)
         self._cached_connected: bool | None = None
@@ -295,7 +319,7 @@ class AsyncArkiv(ArkivBase, AsyncWeb3):
         Args:
             account: The named account to initialize
         """
-        logger.debug(f"Initializing AsyncArkiv client with account: {account.name}")
+        logger.debug("Initializing AsyncArkiv client with account: %s", account.name)
         self.accounts[account.name] = account
         self.switch_to(account.name)
 
@@ -304,14 +328,19 @@ class AsyncArkiv(ArkivBase, AsyncWeb3):
             balance = await self.eth.get_balance(account.address)
             if balance == 0:
                 logger.info(
-                    f"Funding account {account.name} ({account.address}) with test ETH..."
+                    "Funding account %s (%s) with test ETH...",
+                    account.name,
+                    account.address,
                 )
                 self.node.fund_account(account)
 
         balance = await self.eth.get_balance(account.address)
         balance_eth = self.from_wei(balance, "ether")
         logger.info(
-            f"Account balance for {account.name} ({account.address}): {balance_eth} ETH"
+            "Account balance for %s (%s): %s ETH",
+            account.name,
+            account.address,
+            balance_eth,
         )
 
     async def _disconnect_provider(self) -> None:
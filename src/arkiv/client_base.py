@@ -87,10 +87,10 @@ class ArkivBase:
 
         # Build provider based on transport
         if transport == "ws":
-            logger.info(f"Transport '{transport}': creating WebSocketProvider")
+            logger.info("Transport '%s': creating WebSocketProvider", transport)
             provider = ProviderBuilder().node(node).ws().build()
         else:  # http
-            logger.info(f"Transport '{transport}': creating HTTPProvider")
+            logger.info("Transport '%s': creating HTTPProvider", transport)
             provider = ProviderBuilder().node(node).build()
 
         return node, provider
@@ -119,14 +119,16 @@ class ArkivBase:
             # Create default account if none provided (for local node prototyping)
             if account is None:
                 logger.debug(
-                    f"Creating default account '{self.ACCOUNT_NAME_DEFAULT}' for local node..."
+                    "Creating default account '%s' for local node...",
+                    self.ACCOUNT_NAME_DEFAULT,
                 )
                 account = NamedAccount.create(self.ACCOUNT_NAME_DEFAULT)
 
         # If account is a LocalAccount, wrap it in NamedAccount with default name
         if isinstance(account, LocalAccount):
             logger.debug(
-                f"Wrapping provided LocalAccount in NamedAccount with name '{self.ACCOUNT_NAME_DEFAULT}'"
+                "Wrapping provided LocalAccount in NamedAccount with name '%s'",
+                self.ACCOUNT_NAME_DEFAULT,
             )
             account = NamedAccount(self.ACCOUNT_NAME_DEFAULT, account)
 
@@ -139,7 +141,7 @@ class ArkivBase:
         Args:
             account: NamedAccount to set up
         """
-        logger.debug(f"Initializing Arkiv client with account: {account.name}")
+        logger.debug("Initializing Arkiv client with account: %s", account.name)
         self.accounts[account.name] = account
         self.switch_to(account.name)
 
@@ -148,14 +150,19 @@ class ArkivBase:
             balance = self._get_balance(account.address)
             if balance == 0:
                 logger.info(
-                    f"Funding account {account.name} ({account.address}) with test ETH..."
+                    "Funding account %s (%s) with test ETH...",
+                    account.name,
+                    account.address,
                 )
                 self.node.fund_account(account)
 
         balance = self._get_balance(account.address)
         balance_eth = self.from_wei(balance, "ether")
         logger.info(
-            f"Account balance for {account.name} ({account.address}): {balance_eth} ETH"
+            "Account balance for %s (%s): %s ETH",
+            account.name,
+            account.address,
+            balance_eth,
         )
 
     def switch_to(self, account_name: str) -> None:
@@ -168,11 +175,13 @@ class ArkivBase:
         Raises:
             NamedAccountNotFoundException: If account name not found
         """
-        logger.info(f"Switching to account: {account_name}")
+        logger.info("Switching to account: %s", account_name)
 
         if account_name not in self.accounts:
             logger.error(
-                f"Account '{account_name}' not found. Available accounts: {list(self.accounts.keys())}"
+                "Account '%s' not found. Available accounts: %s",
+                account_name,
+                list(self.accounts.keys()),
             )
             raise NamedAccountNotFoundException(
                 f"Unknown account name: '{account_name}'"
@@ -180,7 +189,9 @@ class ArkivBase:
 
         # Remove existing signing middleware if present
         if self.current_signer is not None:
-            logger.debug(f"Removing existing signing middleware: {self.current_signer}")
+            logger.debug(
+                "Removing existing signing middleware: %s", self.current_signer
+            )
             try:
                 self._middleware_remove(self.current_signer)
             except ValueError:
@@ -190,14 +201,14 @@ class ArkivBase:
 
         # Inject signer account
         account = self.accounts[account_name]
-        logger.debug(f"Injecting signing middleware for account: {account.address}")
+        logger.debug("Injecting signing middleware for account: %s", account.address)
         self._middleware_inject(account, account_name)
 
         # Configure default account
         self._set_default_account(account.address)
         self.current_signer = account_name
         logger.info(
-            f"Successfully switched to account '{account_name}' ({account.address})"
+            "Successfully switched to account '%s' (%s)", account_name, account.address
         )
 
     def _cleanup_node(self) -> None:
@@ -220,8 +231,10 @@ class ArkivBase:
                 else "async with AsyncArkiv() as arkiv:"
             )
             logger.warning(
-                f"{client_type} client with managed node is being destroyed but node is still running. "
-                f"Call arkiv.node.stop() or use context manager: '{context_mgr}'"
+                "%s client with managed node is being destroyed but node is still running. "
+                "Call arkiv.node.stop() or use context manager: '%s'",
+                client_type,
+                context_mgr,
             )
 
     # Abstract methods to be implemented by subclasses
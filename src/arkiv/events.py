@@ -14,6 +14,8 @@ It supports two polling strategies:
    - Polls for new logs on each interval
 
 The implementation automatically detects which method to use based on provider capabilities.
+Filter-based polling of all filters of a client is done by one shared FilterPoller
+thread that fetches the changes of all filters in a single JSON-RPC batch request.
 """
 
 from __future__ import annotations
@@ -23,11 +25,14 @@ import threading
 import time
 from typing import TYPE_CHECKING
 
+from eth_typing import HexStr
+from web3 import Web3
 from web3._utils.filters import LogFilter
+from web3._utils.method_formatters import filter_result_formatter
 from web3.contract import Contract
 from web3.types import LogReceipt
 
-from arkiv.utils import get_tx_hash, to_event
+from arkiv.utils import get_tx_hash, make_batch_request, to_event
 
 from .events_base import EventFilterBase
 from .types import (
@@ -72,6 +77,7 @@ class EventFilter(EventFilterBase[SyncCallback]):
         callback: SyncCallback,
         from_block: str | int = "latest",
         auto_start: bool = True,
+        poller: FilterPoller | None = None,
     ) -> None:
         """
         Initialize event filter for HTTP polling.
@@ -82,6 +88,8 @@ class EventFilter(EventFilterBase[SyncCallback]):
             callback: Callback function for the event (sync)
             from_block: Starting block for the filter
             auto_start: If True, starts polling immediately
+            poller: Shared poller for filter-based polling, if None the filter
+                    polls in its own thread
         """
         # Initialize base class (but don't auto-start yet)
         super().__init__(contract, event_type, callback, from_block, auto_start=False)
@@ -95,19 +103,25 @@ class EventFilter(EventFilterBase[SyncCallback]):
 
         # Try filter-based approach first (fallback to log polling if it fails)
         self._use_filter = True
+        self._poller = poller
 
         if auto_start:
             self.start()
 
+    @property
+    def filter_id(self) -> HexStr | None:
+        """Node filter id used for filter-based polling, None if not installed."""
+        return self._filter.filter_id if self._filter is not None else None
+
     def start(self) -> None:
         """
         Start HTTP polling for events.
         """
         if self._running:
-            logger.warning(f"Filter for {self.event_type} is already running")
+            logger.warning("Filter for %s is already running", self.event_type)
             return
 
-        logger.info(f"Starting event filter for {self.event_type}")
+        logger.info("Starting event filter for %s", self.event_type)
 
         # Try to create a Web3 filter first (works with most local nodes)
         # If it fails (403 Forbidden from Kaolin), we'll use log polling instead
@@ -118,9 +132,11 @@ class EventFilter(EventFilterBase[SyncCallback]):
             )
             self._filter = filter_result
             self._use_filter = True
-            logger.info(f"Using filter-based polling for {self.event_type}")
+            logger.info("Using filter-based polling for %s", self.event_type)
         except Exception as e:
-            logger.warning(f"Filter creation failed ({e}), falling back to log polling")
+            logger.warning(
+                "Filter creation failed (%s), falling back to log polling", e
+            )
             self._use_filter = False
             # Initialize last_block for log polling
             if self.from_block == "latest":
@@ -128,47 +144,73 @@ class EventFilter(EventFilterBase[SyncCallback]):
             else:
                 self._last_block = int(self.from_block) - 1
 
-        # Start polling thread
         self._running = True
+        if self._use_filter and self._poller is not None:
+            self._poller.register(self)
+            logger.info("Event filter for '%s' started", self.event_type)
+            return
+
+        # Start polling thread
         self._thread = threading.Thread(target=self._poll_loop, daemon=True)
         self._thread.start()
 
-        logger.info(f"Event filter for '{self.event_type}' started")
+        logger.info("Event filter for '%s' started", self.event_type)
 
     def stop(self) -> None:
         """
         Stop polling for events.
         """
         if not self._running:
-            logger.warning(f"Filter for '{self.event_type}' is not running")
+            logger.warning("Filter for '%s' is not running", self.event_type)
             return
 
-        logger.info(f"Stopping event filter for '{self.event_type}'")
+        logger.info("Stopping event filter for '%s'", self.event_type)
         self._running = False
 
+        if self._poller is not None:
+            self._poller.unregister(self)
+
         # Wait for thread to finish
         if self._thread:
             self._thread.join(timeout=5.0)
             self._thread = None
 
-        logger.info(f"Event filter for '{self.event_type}' stopped")
+        logger.info("Event filter for '%s' stopped", self.event_type)
 
     def uninstall(self) -> None:
         """Uninstall the filter and cleanup resources."""
-        logger.info(f"Uninstalling event filter for '{self.event_type}'")
+        logger.info("Uninstalling event filter for '%s'", self.event_type)
+
+        filter_id = self.detach()
+        if filter_id is not None:
+            try:
+                self.contract.w3.eth.uninstall_filter(filter_id)
+            except Exception as e:
+                logger.warning("Error uninstalling filter %s: %s", filter_id, e)
+
+        logger.info("Event filter for %s uninstalled", self.event_type)
+
+    def detach(self) -> HexStr | None:
+        """
+        Stop polling and drop the filter without uninstalling it on the node.
+
+        Lets the caller uninstall the node filter, e.g. together with others
+        in a single batch request.
 
+        Returns:
+            The node filter id to uninstall, None if no filter was installed
+        """
         # Stop polling if running
         if self._running:
             self.stop()
 
-        # Clear filter reference (Web3 filters don't have uninstall method)
+        filter_id = self.filter_id
         self._filter = None
-
-        logger.info(f"Event filter for {self.event_type} uninstalled")
+        return filter_id
 
     def _poll_loop(self) -> None:
         """Background polling loop for HTTP provider events."""
-        logger.debug(f"Poll loop started for {self.event_type}")
+        logger.debug("Poll loop started for %s", self.event_type)
 
         while self._running:
             try:
@@ -181,7 +223,7 @@ class EventFilter(EventFilterBase[SyncCallback]):
                                 self._process_log(log)
                             except Exception as e:
                                 logger.error(
-                                    f"Error processing event: {e}", exc_info=True
+                                    "Error processing event: %s", e, exc_info=True
                                 )
                 else:
                     # Log polling approach (works with Kaolin and other restricted RPC providers)
@@ -191,10 +233,10 @@ class EventFilter(EventFilterBase[SyncCallback]):
                 time.sleep(self._poll_interval)
 
             except Exception as e:
-                logger.error(f"Error in poll loop: {e}", exc_info=True)
+                logger.error("Error in poll loop: %s", e, exc_info=True)
                 time.sleep(self._poll_interval)
 
-        logger.debug(f"Poll loop ended for {self.event_type}")
+        logger.debug("Poll loop ended for %s", self.event_type)
 
     def _poll_logs(self) -> None:
         """
@@ -231,19 +273,36 @@ class EventFilter(EventFilterBase[SyncCallback]):
                 try:
                     self._process_log(log)
                 except Exception as e:
-                    logger.error(f"Error processing event: {e}", exc_info=True)
+                    logger.error("Error processing event: %s", e, exc_info=True)
 
             # Update last processed block
             self._last_block = current_block
 
             if logs:
                 logger.debug(
-                    f"Processed {len(logs)} {self.event_type} events "
-                    f"from blocks {from_block} to {current_block}"
+                    "Processed %d %s events from blocks %s to %s",
+                    len(logs),
+                    self.event_type,
+                    from_block,
+                    current_block,
                 )
 
         except Exception as e:
-            logger.error(f"Error polling logs: {e}", exc_info=True)
+            logger.error("Error polling logs: %s", e, exc_info=True)
+
+    def _process_filter_changes(self, entries: list[LogReceipt]) -> None:
+        """Process raw eth_getFilterChanges entries fetched by a FilterPoller."""
+        log_filter = self._filter
+        if not self._running or log_filter is None:
+            return
+
+        # Same filtering and formatting as LogFilter.get_new_entries()
+        for entry in entries:
+            try:
+                if log_filter.is_valid_entry(entry):
+                    self._process_log(log_filter.format_entry(entry))
+            except Exception as e:
+                logger.error("Error processing event: %s", e, exc_info=True)
 
     def _process_log(self, log: LogReceipt) -> None:
         """
@@ -257,8 +316,134 @@ class EventFilter(EventFilterBase[SyncCallback]):
             event = to_event(self.contract, log)
             tx_hash = get_tx_hash(log)
 
-            logger.info(f"Starting callback for hash: {tx_hash} and event: {event}")
+            logger.info("Starting callback for hash: %s and event: %s", tx_hash, event)
             self.callback(event, tx_hash)  # type: ignore[arg-type]
 
         except Exception as e:
-            logger.error(f"Error in callback: {e}", exc_info=True)
+            logger.error("Error in callback: %s", e, exc_info=True)
+
+
+class FilterPoller:
+    """
+    Shared polling thread for the filter-based event filters of a client.
+
+    Instead of one thread sending one eth_getFilterChanges request per filter,
+    a single thread fetches the changes of all registered filters in one JSON-RPC
+    batch request per poll interval. An error for one filter is logged without
+    affecting the changes fetched for the others. The thread is started when the
+    first filter is registered and stopped when the last one is unregistered.
+    """
+
+    def __init__(self, w3: Web3, poll_interval: float = 1.0) -> None:
+        """
+        Initialize the filter poller.
+
+        Args:
+            w3: Web3 client the filters are installed on
+            poll_interval: Seconds between polls
+        """
+        self._w3 = w3
+        self._poll_interval = poll_interval
+        self._filters: list[EventFilter] = []
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the polling thread is active."""
+        return self._thread is not None
+
+    def register(self, event_filter: EventFilter) -> None:
+        """Add a filter to the polled filters, starting the thread if needed."""
+        with self._lock:
+            if event_filter in self._filters:
+                return
+
+            self._filters.append(event_filter)
+            if self._thread is None:
+                # Each thread gets its own stop event, a stopping thread may
+                # still be finishing its last poll when a new one is started
+                self._stop_event = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._poll_loop,
+                    args=(self._stop_event,),
+                    name="arkiv-filter-poller",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def unregister(self, event_filter: EventFilter) -> None:
+        """Remove a filter from the polled filters, stopping the thread if idle."""
+        with self._lock:
+            if event_filter in self._filters:
+                self._filters.remove(event_filter)
+            if self._filters or self._thread is None:
+                return
+
+            thread, self._thread = self._thread, None
+            self._stop_event.set()
+
+        # Callbacks run on the poller thread and may stop their own filter
+        if thread is not threading.current_thread():
+            thread.join(timeout=5.0)
+
+    def _poll_loop(self, stop_event: threading.Event) -> None:
+        """Background loop polling all registered filters."""
+        logger.debug("Filter poller started")
+
+        while not stop_event.is_set():
+            with self._lock:
+                event_filters = list(self._filters)
+
+            try:
+                self._poll(event_filters)
+            except Exception as e:
+                logger.error("Error in filter poller: %s", e, exc_info=True)
+
+            stop_event.wait(self._poll_interval)
+
+        logger.debug("Filter poller stopped")
+
+    def _poll(self, event_filters: list[EventFilter]) -> None:
+        """Fetch the changes of all filters and dispatch them to their callbacks."""
+        # Skip filters uninstalled since the snapshot was taken
+        polled = [
+            (f, filter_id)
+            for f in event_filters
+            if (filter_id := f.filter_id) is not None
+        ]
+        if not polled:
+            return
+
+        if len(polled) > 1:
+            # Responses are checked one by one: the node has already drained the
+            # changes of all other filters when a single filter fails
+            responses = make_batch_request(
+                self._w3,
+                [("eth_getFilterChanges", (filter_id,)) for _, filter_id in polled],
+            )
+            if responses is not None:
+                for (event_filter, filter_id), response in zip(
+                    polled, responses, strict=True
+                ):
+                    if "error" in response:
+                        logger.error(
+                            "Error fetching changes of filter %s: %s",
+                            filter_id,
+                            response["error"],
+                        )
+                        continue
+                    event_filter._process_filter_changes(
+                        filter_result_formatter(response.get("result") or [])
+                    )
+                return
+
+        # Single filter, or the node rejected the batch as a whole
+        for event_filter, filter_id in polled:
+            try:
+                entries = self._w3.eth.get_filter_changes(filter_id)
+            except Exception as e:
+                logger.error("Error fetching changes of filter %s: %s", filter_id, e)
+                continue
+            event_filter._process_filter_changes(entries)
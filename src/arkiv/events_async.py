@@ -22,6 +22,7 @@ import asyncio
 import logging
 from typing import TYPE_CHECKING, Any
 
+from web3 import AsyncWeb3
 from web3._utils.filters import LogFilter
 from web3.contract import Contract
 from web3.types import LogReceipt
@@ -120,19 +121,21 @@ class AsyncEventFilter(EventFilterBase[AsyncCallback]):
         Start async HTTP polling for events.
         """
         if self._running:
-            logger.warning(f"Filter for {self.event_type} is already running")
+            logger.warning("Filter for %s is already running", self.event_type)
             return
 
-        logger.info(f"Starting async event filter for {self.event_type}")
+        logger.info("Starting async event filter for %s", self.event_type)
 
         # Try to create a Web3 filter first (works with most local nodes)
         # If it fails (403 Forbidden from Kaolin), we'll use log polling instead
         try:
             self._filter = await self._create_filter()
             self._use_filter = True
-            logger.info(f"Using filter-based polling for {self.event_type}")
+            logger.info("Using filter-based polling for %s", self.event_type)
         except Exception as e:
-            logger.warning(f"Filter creation failed ({e}), falling back to log polling")
+            logger.warning(
+                "Filter creation failed (%s), falling back to log polling", e
+            )
             self._use_filter = False
             # Initialize last_block for log polling
             if self.from_block == "latest":
@@ -144,17 +147,17 @@ class AsyncEventFilter(EventFilterBase[AsyncCallback]):
         self._running = True
         self._task = asyncio.create_task(self._poll_loop())
 
-        logger.info(f"Async event filter for {self.event_type} started")
+        logger.info("Async event filter for %s started", self.event_type)
 
     async def stop(self) -> None:
         """
         Stop async polling for events.
         """
         if not self._running:
-            logger.warning(f"Filter for {self.event_type} is not running")
+            logger.warning("Filter for %s is not running", self.event_type)
             return
 
-        logger.info(f"Stopping async event filter for {self.event_type}")
+        logger.info("Stopping async event filter for %s", self.event_type)
         self._running = False
 
         # Cancel and wait for task to finish
@@ -166,24 +169,30 @@ class AsyncEventFilter(EventFilterBase[AsyncCallback]):
                 pass
             self._task = None
 
-        logger.info(f"Async event filter for {self.event_type} stopped")
+        logger.info("Async event filter for %s stopped", self.event_type)
 
     async def uninstall(self) -> None:
         """Uninstall the filter and cleanup resources."""
-        logger.info(f"Uninstalling async event filter for {self.event_type}")
+        logger.info("Uninstalling async event filter for %s", self.event_type)
 
         # Stop polling if running
         if self._running:
             await self.stop()
 
-        # Clear filter reference (Web3 filters don't have uninstall method)
+        # Remove the filter from the node, it would otherwise only expire there
+        filter_id = self._filter.filter_id if self._filter is not None else None
         self._filter = None
+        if filter_id is not None:
+            try:
+                await self.contract.w3.eth.uninstall_filter(filter_id)  # type: ignore[misc]
+            except Exception as e:
+                logger.warning("Error uninstalling filter %s: %s", filter_id, e)
 
-        logger.info(f"Async event filter for {self.event_type} uninstalled")
+        logger.info("Async event filter for %s uninstalled", self.event_type)
 
     async def _poll_loop(self) -> None:
         """Background async polling loop for HTTP provider events."""
-        logger.debug(f"Async poll loop started for {self.event_type}")
+        logger.debug("Async poll loop started for %s", self.event_type)
 
         while self._running:
             try:
@@ -196,7 +205,7 @@ class AsyncEventFilter(EventFilterBase[AsyncCallback]):
                                 await self._process_log(log)
                             except Exception as e:
                                 logger.error(
-                                    f"Error processing event: {e}", exc_info=True
+                                    "Error processing event: %s", e, exc_info=True
                                 )
                 else:
                     # Log polling approach (works with Kaolin and other restricted RPC providers)
@@ -206,13 +215,13 @@ class AsyncEventFilter(EventFilterBase[AsyncCallback]):
                 await asyncio.sleep(self._poll_interval)
 
             except asyncio.CancelledError:
-                logger.debug(f"Async poll loop cancelled for {self.event_type}")
+                logger.debug("Async poll loop cancelled for %s", self.event_type)
                 break
             except Exception as e:
-                logger.error(f"Error in async poll loop: {e}", exc_info=True)
+                logger.error("Error in async poll loop: %s", e, exc_info=True)
                 await asyncio.sleep(self._poll_interval)
 
-        logger.debug(f"Async poll loop ended for {self.event_type}")
+        logger.debug("Async poll loop ended for %s", self.event_type)
 
     async def _poll_logs(self) -> None:
         """
@@ -249,19 +258,22 @@ class AsyncEventFilter(EventFilterBase[AsyncCallback]):
                 try:
                     await self._process_log(log)
                 except Exception as e:
-                    logger.error(f"Error processing event: {e}", exc_info=True)
+                    logger.error("Error processing event: %s", e, exc_info=True)
 
             # Update last processed block
             self._last_block = current_block
 
             if logs:
                 logger.debug(
-                    f"Processed {len(logs)} {self.event_type} events "
-                    f"from blocks {from_block} to {current_block}"
+                    "Processed %d %s events from blocks %s to %s",
+                    len(logs),
+                    self.event_type,
+                    from_block,
+                    current_block,
                 )
 
         except Exception as e:
-            logger.error(f"Error polling logs: {e}", exc_info=True)
+            logger.error("Error polling logs: %s", e, exc_info=True)
 
     async def _process_log(self, log: LogReceipt) -> None:
         """
@@ -275,8 +287,9 @@ class AsyncEventFilter(EventFilterBase[AsyncCallback]):
             log_address = log.get("address")
             if log_address and log_address.lower() != self.contract.address.lower():
                 logger.debug(
-                    f"Skipping log from different contract: {log_address} "
-                    f"(expected {self.contract.address})"
+                    "Skipping log from different contract: %s (expected %s)",
+                    log_address,
+                    self.contract.address,
                 )
                 return
 
@@ -284,9 +297,93 @@ class AsyncEventFilter(EventFilterBase[AsyncCallback]):
             event = to_event(self.contract, log)
             tx_hash = get_tx_hash(log)
 
-            logger.info(f"Starting callback for hash: {tx_hash} and event: {event}")
+            logger.info("Starting callback for hash: %s and event: %s", tx_hash, event)
 
             await self.callback(event, tx_hash)  # type: ignore[arg-type]
 
         except Exception as e:
-            logger.error(f"Error in async callback: {e}", exc_info=True)
+            logger.error("Error in async callback: %s", e, exc_info=True)
+
+
+class NewHeadsListener:
+    """
+    Shared newHeads subscription of an async client.
+
+    Subscription messages of a persistent provider are read from a single stream,
+    concurrent readers would consume (and drop) each other's messages. One reader
+    task is therefore subscribed while any waiter is registered, and wakes up all
+    waiters on each new block.
+    """
+
+    def __init__(self, w3: AsyncWeb3) -> None:
+        """
+        Initialize the listener.
+
+        Args:
+            w3: Async Web3 client with a persistent connection provider
+        """
+        self._w3 = w3
+        self._lock = asyncio.Lock()
+        self._new_head = asyncio.Condition()
+        self._head_count = 0
+        self._waiters = 0
+        self._subscription_id: Any = None
+        self._task: asyncio.Task[None] | None = None
+        self._error: BaseException | None = None
+
+    @property
+    def head_count(self) -> int:
+        """Get the number of new heads received so far."""
+        return self._head_count
+
+    async def acquire(self) -> None:
+        """Register a waiter, subscribing to newHeads if needed."""
+        async with self._lock:
+            if self._task is None:
+                self._subscription_id = await self._w3.eth.subscribe("newHeads")
+                self._error = None
+                self._task = asyncio.create_task(self._read(self._subscription_id))
+            self._waiters += 1
+
+    async def release(self) -> None:
+        """Unregister a waiter, unsubscribing when it was the last one."""
+        async with self._lock:
+            self._waiters -= 1
+            if self._waiters > 0 or self._task is None:
+                return
+
+            task, self._task = self._task, None
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            try:
+                await self._w3.eth.unsubscribe(self._subscription_id)
+            except Exception as e:
+                logger.warning("Error unsubscribing from newHeads: %s", e)
+
+    async def wait(self, head_count: int) -> None:
+        """
+        Wait until more than head_count new heads have been received.
+
+        Raises:
+            Exception: The error that stopped the subscription reader
+        """
+        async with self._new_head:
+            await self._new_head.wait_for(
+                lambda: self._head_count > head_count or self._error is not None
+            )
+        if self._error is not None:
+            raise self._error
+
+    async def _read(self, subscription_id: Any) -> None:
+        """Read subscription messages and notify waiters on each new head."""
+        try:
+            async for message in self._w3.socket.process_subscriptions():
+                if message["subscription"] == subscription_id:
+                    async with self._new_head:
+                        self._head_count += 1
+                        self._new_head.notify_all()
+            raise RuntimeError("newHeads subscription ended")
+        except Exception as e:
+            self._error = e
+            async with self._new_head:
+                self._new_head.notify_all()
@@ -124,8 +124,11 @@ class EventFilterBase(ABC, Generic[CallbackT]):
         )
 
         logger.info(
-            f"Created filter for event {event_name} from block {self.from_block} "
-            f"at address {self.contract.address}: {filter}"
+            "Created filter for event %s from block %s at address %s: %s",
+            event_name,
+            self.from_block,
+            self.contract.address,
+            filter,
         )
         return filter
 
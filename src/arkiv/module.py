@@ -3,27 +3,39 @@
 from __future__ import annotations
 
 import logging
+import operator
+import threading
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
 from typing import TYPE_CHECKING, Any
 
 from eth_typing import ChecksumAddress, HexStr
-from web3 import Web3
-from web3.types import TxParams, TxReceipt
+from web3.exceptions import Web3RPCError
+from web3.types import TxParams, TxReceipt, Wei
 
 from arkiv.account import NamedAccount
 
 from .batch import BatchBuilder
-from .events import EventFilter
-from .module_base import ArkivModuleBase
+from .contract import FUNCTIONS_ABI
+from .events import EventFilter, FilterPoller
+from .module_base import (
+    ENTITY_KEYS_BATCH_SIZE_DEFAULT,
+    QUERY_BATCH_SIZE_DEFAULT,
+    ArkivModuleBase,
+)
+from .pipeline import TxPipeline
 from .query_builder import QueryBuilder
 from .query_iterator import QueryIterator
 from .types import (
     ALL,
-    NONE,
+    KEY,
     QUERY_OPTIONS_DEFAULT,
     Attributes,
     ChangeOwnerCallback,
     ChangeOwnerOp,
     CreateCallback,
+    CreateOp,
     DeleteOp,
     Entity,
     EntityKey,
@@ -36,9 +48,12 @@ from .types import (
     TransactionReceipt,
     TxHash,
     UpdateCallback,
+    UpdateOp,
 )
 from .utils import (
+    make_batch_request,
     to_create_op,
+    to_created_entity,
     to_query_result,
     to_rpc_query_options,
     to_tx_params,
@@ -47,16 +62,43 @@ from .utils import (
 
 # Deal with potential circular imports between client.py and module.py
 if TYPE_CHECKING:
-    from .client import Arkiv  # noqa: F401 - used in Generic type parameter
+    from .client import Arkiv
 
 logger = logging.getLogger(__name__)
 
+# Max number of threads used to uninstall event filters in cleanup_filters()
+CLEANUP_WORKERS_MAX = 8
+
+# Max number of threads prefetching query pages, shared by all query iterators
+PREFETCH_WORKERS_MAX = 4
+
 TX_SUCCESS = 1
 
 
 class ArkivModule(ArkivModuleBase["Arkiv"]):
     """Basic Arkiv module for entity management operations."""
 
+    def __init__(
+        self,
+        client: Arkiv,
+        receipt_poll_latency: float | None = None,
+        receipt_timeout: float | None = None,
+    ) -> None:
+        # Docstring inherited from ArkivModuleBase.__init__
+        super().__init__(client, receipt_poll_latency, receipt_timeout)
+
+        # web3.py keeps one HTTP session per thread, long-lived prefetch threads
+        # reuse their connections instead of connecting again for every iterator
+        self._prefetch_executor: ThreadPoolExecutor | None = None
+        self._prefetch_lock = threading.Lock()
+
+        # One thread polls all filter-based event filters in batch requests
+        self._filter_poller = FilterPoller(client)
+
+        # Concurrent get_entity() calls for the same entity share one RPC call
+        self._inflight_entities: dict[tuple[Any, ...], Future[Entity]] = {}
+        self._inflight_lock = threading.Lock()
+
     def execute(
         self, operations: Operations, tx_params: TxParams | None = None
     ) -> TransactionReceipt:
@@ -69,13 +111,29 @@ class ArkivModule(ArkivModuleBase["Arkiv"]):
         tx_params = to_tx_params(operations, tx_params)
 
         # Send transaction and get tx hash
-        tx_hash_bytes = self.client.eth.send_transaction(tx_params)
-        tx_hash = TxHash(HexStr(tx_hash_bytes.to_0x_hex()))
+        tx_hash_bytes = self._eth.send_transaction(tx_params)
 
         # Wait for transaction to complete and return receipt
-        tx_receipt: TxReceipt = self.client.eth.wait_for_transaction_receipt(tx_hash)
+        tx_receipt: TxReceipt = self._eth.wait_for_transaction_receipt(
+            tx_hash_bytes,
+            timeout=self.receipt_timeout,
+            poll_latency=self.receipt_poll_latency,
+        )
+        tx_hash = TxHash(HexStr(tx_hash_bytes.to_0x_hex()))
         return self._check_tx_and_get_receipt(tx_hash, tx_receipt)
 
+    def execute_many(
+        self,
+        operations_list: Sequence[Operations],
+        tx_params: TxParams | None = None,
+    ) -> list[TransactionReceipt]:
+        # Docstring inherited from ArkivModuleBase.execute_many
+        with self.pipeline() as pipeline:
+            for operations in operations_list:
+                pipeline.send_operations(operations, tx_params)
+
+        return pipeline.receipts
+
     def create_entity(
         self,
         payload: bytes | None = None,
@@ -92,16 +150,29 @@ class ArkivModule(ArkivModuleBase["Arkiv"]):
             attributes=attributes,
             expires_in=expires_in,
         )
-        operations = Operations(creates=[create_op])
-        receipt = self.execute(operations, tx_params)
+        entity_keys, receipt = self.create_entities((create_op,), tx_params)
+        return entity_keys[0], receipt
 
-        # Verify receipt
-        creates = receipt.creates
-        self._check_operations(receipt.creates, "create", 1)
+    def create_entity_with_result(
+        self,
+        payload: bytes | None = None,
+        content_type: str | None = None,
+        attributes: Attributes | None = None,
+        expires_in: int | None = None,
+        tx_params: TxParams | None = None,
+    ) -> tuple[Entity, TransactionReceipt]:
+        # Docstring inherited from ArkivModuleBase.create_entity_with_result
+        create_op = to_create_op(
+            payload=payload,
+            content_type=content_type,
+            attributes=attributes,
+            expires_in=expires_in,
+        )
+        _, receipt = self.create_entities((create_op,), tx_params)
 
-        # Return entity key and receipt
-        entity_key = creates[0].key
-        return entity_key, receipt
+        # Build entity from submitted data and receipt (no extra query)
+        entity = to_created_entity(create_op, receipt.creates[0], receipt.block_number)
+        return entity, receipt
 
     def update_entity(
         self,
@@ -121,11 +192,32 @@ class ArkivModule(ArkivModuleBase["Arkiv"]):
             attributes=attributes,
             expires_in=expires_in,
         )
-        operations = Operations(updates=[update_op])
+        return self.update_entities((update_op,), tx_params)
+
+    def create_entities(
+        self,
+        creates: Sequence[CreateOp],
+        tx_params: TxParams | None = None,
+    ) -> tuple[list[EntityKey], TransactionReceipt]:
+        # Docstring inherited from ArkivModuleBase.create_entities
+        operations = Operations(creates=creates)
+        receipt = self.execute(operations, tx_params)
+
+        # Verify receipt and return entity keys in input order
+        self._check_operations(receipt.creates, "create", len(creates))
+        return [create.key for create in receipt.creates], receipt
+
+    def update_entities(
+        self,
+        updates: Sequence[UpdateOp],
+        tx_params: TxParams | None = None,
+    ) -> TransactionReceipt:
+        # Docstring inherited from ArkivModuleBase.update_entities
+        operations = Operations(updates=updates)
         receipt = self.execute(operations, tx_params)
 
         # Verify and return receipt
-        self._check_operations(receipt.updates, "update", 1)
+        self._check_operations(receipt.updates, "update", len(updates))
         return receipt
 
     def extend_entity(
@@ -137,11 +229,19 @@ class ArkivModule(ArkivModuleBase["Arkiv"]):
         # Docstring inherited from ArkivModuleBase.extend_entity
         # Create the extend operation and execute TX
         extend_op = ExtendOp(key=entity_key, extend_by=extend_by)
-        operations = Operations(extensions=[extend_op])
+        return self.extend_entities((extend_op,), tx_params)
+
+    def extend_entities(
+        self,
+        extensions: Sequence[ExtendOp],
+        tx_params: TxParams | None = None,
+    ) -> TransactionReceipt:
+        # Docstring inherited from ArkivModuleBase.extend_entities
+        operations = Operations(extensions=extensions)
         receipt = self.execute(operations, tx_params)
 
         # Verify and return receipt
-        self._check_operations(receipt.extensions, "extend", 1)
+        self._check_operations(receipt.extensions, "extend", len(extensions))
         return receipt
 
     def change_owner(
@@ -153,7 +253,7 @@ class ArkivModule(ArkivModuleBase["Arkiv"]):
         # Docstring inherited from ArkivModuleBase.extend_entity
         # Create the change owner operation and execute TX
         change_owner_op = ChangeOwnerOp(key=entity_key, new_owner=new_owner)
-        operations = Operations(change_owners=[change_owner_op])
+        operations = Operations(change_owners=(change_owner_op,))
         receipt = self.execute(operations, tx_params)
 
         # Verify and return receipt
@@ -168,11 +268,19 @@ class ArkivModule(ArkivModuleBase["Arkiv"]):
         # Docstring inherited from ArkivModuleBase.delete_entity
         # Create the delete operation and execute TX
         delete_op = DeleteOp(key=entity_key)
-        operations = Operations(deletes=[delete_op])
+        return self.delete_entities((delete_op,), tx_params)
+
+    def delete_entities(
+        self,
+        deletes: Sequence[DeleteOp],
+        tx_params: TxParams | None = None,
+    ) -> TransactionReceipt:
+        # Docstring inherited from ArkivModuleBase.delete_entities
+        operations = Operations(deletes=deletes)
         receipt = self.execute(operations, tx_params)
 
         # Verify and return receipt
-        self._check_operations(receipt.deletes, "delete", 1)
+        self._check_operations(receipt.deletes, "delete", len(deletes))
         return receipt
 
     def transfer_eth(
@@ -191,48 +299,166 @@ class ArkivModule(ArkivModuleBase["Arkiv"]):
         Returns:
             Transaction hash of the transfer
         """
-        to_address: ChecksumAddress = to.address if isinstance(to, NamedAccount) else to
-        tx_hash_bytes = self.client.eth.send_transaction(
-            {
-                "to": to_address,
-                "value": Web3.to_wei(amount_wei, "wei"),
-                "gas": 21000,  # Standard gas for ETH transfer
-            }
+        tx_hash_bytes = self._eth.send_transaction(
+            self._to_transfer_tx_params(to, amount_wei)
         )
         tx_hash = TxHash(HexStr(tx_hash_bytes.to_0x_hex()))
-        logger.info(f"TX sent: Transferring {amount_wei} wei to {to}: {tx_hash}")
+        logger.info("TX sent: Transferring %s wei to %s: %s", amount_wei, to, tx_hash)
 
         if wait_for_confirmation:
             logger.info("Waiting for TX confirmation ...")
-            tx_receipt: TxReceipt = self.client.eth.wait_for_transaction_receipt(
-                tx_hash
+            tx_receipt: TxReceipt = self._eth.wait_for_transaction_receipt(
+                tx_hash_bytes,
+                timeout=self.receipt_timeout,
+                poll_latency=self.receipt_poll_latency,
             )
             tx_status: int = tx_receipt["status"]
             if tx_status != TX_SUCCESS:
                 raise RuntimeError(f"Transaction failed with status {tx_status}")
 
-            logger.info(f"TX confirmed: {tx_receipt}")
+            logger.info("TX confirmed: %s", tx_receipt)
 
         return tx_hash
 
+    def transfer_eth_many(
+        self,
+        transfers: list[tuple[NamedAccount | ChecksumAddress, int]],
+        wait_for_confirmation: bool = True,
+    ) -> list[TxHash]:
+        """
+        Transfer ETH to several addresses using pipelined transactions.
+
+        All transfers are sent back-to-back with client-side assigned nonces
+        before any confirmation is awaited, so they can be mined in the same block.
+
+        Args:
+            transfers: List of (recipient, amount in wei) tuples
+            wait_for_confirmation: Wait for all transfers to be confirmed
+
+        Returns:
+            Transaction hashes of the transfers, in input order
+        """
+        pipeline = self.pipeline()
+        for to, amount_wei in transfers:
+            pipeline.send(self._to_transfer_tx_params(to, amount_wei))
+        logger.info("TX sent: %s pipelined transfer(s)", len(transfers))
+
+        if wait_for_confirmation:
+            pipeline.wait()
+
+        return pipeline.tx_hashes
+
+    @staticmethod
+    def _to_transfer_tx_params(
+        to: NamedAccount | ChecksumAddress, amount_wei: int
+    ) -> TxParams:
+        """Build the transaction parameters for an ETH transfer."""
+        # amount is already in wei, no unit conversion needed
+        if type(amount_wei) is not int:
+            # Accept integer-like values (e.g. numpy integers), reject floats
+            try:
+                amount_wei = operator.index(amount_wei)
+            except TypeError:
+                raise TypeError(
+                    f"amount_wei must be an int but is: {type(amount_wei).__name__}"
+                ) from None
+        if amount_wei < 0:
+            raise ValueError(f"amount_wei cannot be negative: {amount_wei}")
+
+        to_address: ChecksumAddress = to.address if isinstance(to, NamedAccount) else to
+        return {
+            "to": to_address,
+            "value": Wei(amount_wei),
+            "gas": 21000,  # Standard gas for ETH transfer
+        }
+
     def entity_exists(self, entity_key: EntityKey, at_block: int | None = None) -> bool:
         # Docstring inherited from ArkivModuleBase.entity_exists
+        cache_key = ("exists", entity_key.lower(), at_block)
+        if at_block is not None:
+            cached: bool | None = self._get_cached(cache_key)
+            if cached is not None:
+                return cached
+
+        # Only check for a match, skip converting the response to a QueryPage
         try:
-            options = QueryOptions(attributes=NONE, at_block=at_block)
-            query_result: QueryPage = self.query_entities_page(
-                f"$key = {entity_key}", options=options
+            rpc_options = self._to_entity_exists_rpc_options(at_block)
+            raw_results = self._eth.query(
+                self._to_entity_key_query(entity_key), rpc_options
             )
-            return len(query_result.entities) > 0
-        except Exception:
+        except Web3RPCError:
+            # The node rejected the query, e.g. for an invalid entity key
             return False
 
+        exists = self._has_query_data(raw_results)
+        if at_block is not None:
+            self._set_cached(cache_key, exists)
+        return exists
+
     def get_entity(
         self, entity_key: EntityKey, fields: int = ALL, at_block: int | None = None
     ) -> Entity:
         # Docstring inherited from ArkivModuleBase.get_entity
+        cache_key = self._entity_cache_key(entity_key, fields, at_block)
+        if at_block is not None:
+            cached: Entity | None = self._get_cached(cache_key)
+            if cached is not None:
+                return cached
+
+        with self._inflight_lock:
+            inflight = self._inflight_entities.get(cache_key)
+            if inflight is None:
+                future: Future[Entity] = Future()
+                self._inflight_entities[cache_key] = future
+        if inflight is not None:
+            # The result is shared with the fetching thread, return a copy
+            copied: Entity = self._copy_entity(inflight.result())
+            return copied
+
+        try:
+            result_entity = self._fetch_entity(entity_key, fields, at_block)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result_entity)
+        finally:
+            with self._inflight_lock:
+                del self._inflight_entities[cache_key]
+
+        if at_block is not None:
+            self._set_cached(cache_key, result_entity)
+        return result_entity
+
+    def get_entity_if_exists(
+        self, entity_key: EntityKey, fields: int = ALL, at_block: int | None = None
+    ) -> Entity | None:
+        # Docstring inherited from ArkivModuleBase.get_entity_if_exists
+        if at_block is not None:
+            cached: Entity | None = self._get_cached(
+                self._entity_cache_key(entity_key, fields, at_block)
+            )
+            if cached is not None:
+                return cached
+
+        options = QueryOptions(attributes=fields, at_block=at_block)
+        try:
+            query_result = self.query_entities_page(
+                self._to_entity_key_query(entity_key), options=options
+            )
+        except Web3RPCError:
+            # The node rejected the query, e.g. for an invalid entity key
+            return None
+
+        return self._to_entity_if_exists(entity_key, fields, at_block, query_result)
+
+    def _fetch_entity(
+        self, entity_key: EntityKey, fields: int, at_block: int | None
+    ) -> Entity:
+        """Fetch a single entity with one query."""
         options = QueryOptions(attributes=fields, at_block=at_block)
         query_result: QueryPage = self.query_entities_page(
-            f"$key = {entity_key}", options=options
+            self._to_entity_key_query(entity_key), options=options
         )
 
         if not query_result:
@@ -241,8 +467,76 @@ class ArkivModule(ArkivModuleBase["Arkiv"]):
         if len(query_result.entities) != 1:
             raise ValueError(f"Expected 1 entity, got {len(query_result.entities)}")
 
-        result_entity = query_result.entities[0]
-        return result_entity
+        return query_result.entities[0]
+
+    def get_entities(
+        self,
+        entity_keys: Sequence[EntityKey],
+        fields: int = ALL,
+        at_block: int | None = None,
+        batch_size: int = ENTITY_KEYS_BATCH_SIZE_DEFAULT,
+    ) -> list[Entity]:
+        # Docstring inherited from ArkivModuleBase.get_entities
+        entities = self._fetch_entities_by_key(
+            entity_keys, fields | KEY, at_block, batch_size
+        )
+        return self._to_ordered_entities(entity_keys, entities)
+
+    def entities_exist(
+        self,
+        entity_keys: Sequence[EntityKey],
+        at_block: int | None = None,
+        batch_size: int = ENTITY_KEYS_BATCH_SIZE_DEFAULT,
+    ) -> list[bool]:
+        # Docstring inherited from ArkivModuleBase.entities_exist
+        entities = self._fetch_entities_by_key(entity_keys, KEY, at_block, batch_size)
+        return [entity_key.lower() in entities for entity_key in entity_keys]
+
+    def _fetch_entities_by_key(
+        self,
+        entity_keys: Sequence[EntityKey],
+        fields: int,
+        at_block: int | None,
+        batch_size: int,
+    ) -> dict[str, Entity]:
+        """Fetch entities for the keys in batches, indexed by lowercase key."""
+        entities: dict[str, Entity] = {}
+        if at_block is not None:
+            # Entities at a fixed block are immutable, only fetch uncached keys
+            entities, entity_keys = self._get_cached_entities(
+                entity_keys, fields, at_block
+            )
+
+        fetched: dict[str, Entity] = {}
+        options = QueryOptions(
+            attributes=fields, at_block=at_block, max_results_per_page=batch_size
+        )
+        queries = [
+            self._to_entity_keys_query(batch)
+            for batch in self._to_entity_key_batches(entity_keys, batch_size)
+        ]
+        pages: list[QueryPage] = []
+        if queries and options.at_block is None:
+            # Read all batches from the same block as the first one
+            pages.append(self.query_entities_page(queries[0], options))
+            options = replace(options, at_block=pages[0].block_number)
+
+        # Fetch the remaining batches in JSON-RPC batch requests
+        remaining = [(query, options) for query in queries[len(pages) :]]
+        pages.extend(self.query_entities_pages(remaining))
+        for query, page in zip(queries, pages, strict=True):
+            self._add_entities_by_key(fetched, page.entities)
+            if page.has_more():
+                # Only if the node caps the page size below batch_size
+                more_options = replace(options, cursor=page.cursor)
+                self._add_entities_by_key(
+                    fetched, self.query_entities(query, more_options)
+                )
+
+        if at_block is not None:
+            self._set_cached_entities(fetched, fields, at_block)
+        entities.update(fetched)
+        return entities
 
     def query_entities_page(
         self, query: str, options: QueryOptions = QUERY_OPTIONS_DEFAULT
@@ -250,12 +544,36 @@ class ArkivModule(ArkivModuleBase["Arkiv"]):
         # Docstring inherited from ArkivModuleBase.query_entities
         options.validate(query)
         rpc_options = to_rpc_query_options(options)
-        raw_results = self.client.eth.query(query, rpc_options)
+        raw_results = self._eth.query(query, rpc_options)
 
         return to_query_result(options.attributes, raw_results)
 
+    def query_entities_pages(
+        self,
+        queries: Sequence[tuple[str, QueryOptions]],
+        batch_size: int = QUERY_BATCH_SIZE_DEFAULT,
+    ) -> list[QueryPage]:
+        # Docstring inherited from ArkivModuleBase.query_entities_pages
+        pages: list[QueryPage] = []
+        for batch_queries in self._to_query_batches(queries, batch_size):
+            with self.client.batch_requests() as batch:
+                # Attached eth methods are bound outside of batching, bind again
+                query_method = FUNCTIONS_ABI["query"].__get__(self._eth)
+                for query, options in batch_queries:
+                    batch.add(query_method(query, to_rpc_query_options(options)))
+                raw_results = batch.execute()
+
+            for (_, options), raw_result in zip(
+                batch_queries, raw_results, strict=True
+            ):
+                pages.append(to_query_result(options.attributes, raw_result))
+        return pages
+
     def query_entities(
-        self, query: str, options: QueryOptions = QUERY_OPTIONS_DEFAULT
+        self,
+        query: str,
+        options: QueryOptions = QUERY_OPTIONS_DEFAULT,
+        prefetch: bool = False,
     ) -> QueryIterator:
         """
         Provides an iterator over entity results for the provided query.
@@ -266,6 +584,8 @@ class ArkivModule(ArkivModuleBase["Arkiv"]):
         Args:
             query: SQL-like where clause
             options: QueryOptions for the query execution
+            prefetch: Fetch the next page in a background thread while the
+                current page is processed (default: False)
 
         Returns:
             QueryIterator that yields Entity objects across all pages.
@@ -295,6 +615,7 @@ class ArkivModule(ArkivModuleBase["Arkiv"]):
             client=self.client,
             query=query,
             options=options,
+            prefetch=prefetch,
         )
 
     def select(self, *fields: int) -> QueryBuilder:
@@ -432,33 +753,95 @@ class ArkivModule(ArkivModuleBase["Arkiv"]):
         This is automatically called when the Arkiv client exits its context,
         but can be called manually if needed.
         """
-        if not self._active_filters:
+        event_filters = self._take_active_filters()
+        if not event_filters:
             logger.debug("No active filters to cleanup")
             return
 
-        logger.info(
-            f"Cleaning up {len(self._active_filters)} active event filter(s)..."
-        )
+        logger.info("Cleaning up %d active event filter(s)...", len(event_filters))
 
-        for event_filter in self._active_filters:
-            try:
-                event_filter.uninstall()
-            except Exception as e:
-                logger.warning(f"Error cleaning up filter: {e}")
+        # Stop in parallel, stopping a filter joins its polling thread
+        max_workers = min(CLEANUP_WORKERS_MAX, len(event_filters))
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="arkiv-filter-cleanup"
+        ) as executor:
+            filter_ids = list(executor.map(self._detach_filter, event_filters))
 
-        self._active_filters.clear()
+        self._uninstall_node_filters([f for f in filter_ids if f is not None])
         logger.info("All event filters cleaned up")
 
+    @property
+    def prefetch_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the executor fetching query pages in the background.
+
+        Shared by all prefetching query iterators of the client. It is created
+        on first use and shut down when the client is cleaned up.
+        """
+        with self._prefetch_lock:
+            if self._prefetch_executor is None:
+                self._prefetch_executor = ThreadPoolExecutor(
+                    max_workers=PREFETCH_WORKERS_MAX,
+                    thread_name_prefix="arkiv-query-prefetch",
+                )
+            return self._prefetch_executor
+
+    def _shutdown_prefetch_executor(self) -> None:
+        """Stop the prefetch threads, they are recreated when needed again."""
+        with self._prefetch_lock:
+            executor, self._prefetch_executor = self._prefetch_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    @staticmethod
+    def _detach_filter(event_filter: EventFilter) -> HexStr | None:
+        """Stop an event filter, logging instead of raising errors."""
+        try:
+            return event_filter.detach()
+        except Exception as e:
+            logger.warning("Error cleaning up filter: %s", e)
+            return None
+
+    def _uninstall_node_filters(self, filter_ids: list[HexStr]) -> None:
+        """Uninstall filters on the node with a single (batch) request."""
+        if len(filter_ids) > 1:
+            try:
+                responses = make_batch_request(
+                    self.client,
+                    [("eth_uninstallFilter", (filter_id,)) for filter_id in filter_ids],
+                )
+            except Exception as e:
+                logger.warning("Error uninstalling filters in a batch: %s", e)
+                responses = None
+
+            if responses is not None:
+                # An error for one filter does not affect the others
+                for filter_id, response in zip(filter_ids, responses, strict=True):
+                    if "error" in response:
+                        logger.warning(
+                            "Error uninstalling filter %s: %s",
+                            filter_id,
+                            response["error"],
+                        )
+                return
+
+        # Single filter, or the batch failed as a whole
+        for filter_id in filter_ids:
+            try:
+                self._eth.uninstall_filter(filter_id)
+            except Exception as e:
+                logger.warning("Error uninstalling filter %s: %s", filter_id, e)
+
     def get_block_timing(self) -> Any:
-        block_timing_response = self.client.eth.get_block_timing()
-        logger.info(f"Block timing response: {block_timing_response}")
+        block_timing_response = self._eth.get_block_timing()
+        logger.info("Block timing response: %s", block_timing_response)
 
         return block_timing_response
 
     @property
-    def active_filters(self) -> list[EventFilter]:
-        """Get a copy of currently active event filters."""
-        return list(self._active_filters)
+    def active_filters(self) -> tuple[EventFilter, ...]:
+        """Get a read-only snapshot of currently active event filters."""
+        return tuple(self._active_filters)
 
     def batch(self) -> BatchBuilder:
         """
@@ -500,6 +883,30 @@ class ArkivModule(ArkivModuleBase["Arkiv"]):
         """
         return BatchBuilder(self)
 
+    def pipeline(self) -> TxPipeline:
+        """
+        Create a pipeline for submitting independent transactions without waiting.
+
+        Unlike a batch, which packs operations into one atomic transaction, a
+        pipeline sends one transaction per call with client-side assigned nonces
+        and waits for all confirmations at the end. Use it when transactions are
+        independent and should not fail or succeed together.
+
+        Returns:
+            TxPipeline: A pipeline for sending transactions. Call wait() to
+                        confirm them, or use as a context manager.
+
+        Example:
+            >>> with arkiv.pipeline() as pipeline:
+            ...     for key in entity_keys:
+            ...         pipeline.send_operations(
+            ...             Operations(extensions=[ExtendOp(key, extend_by=3600)])
+            ...         )
+            >>> # All transactions are confirmed on exit
+            >>> print(f"Confirmed {len(pipeline.receipts)} transactions")
+        """
+        return TxPipeline(self)
+
     def _watch_entity_event(
         self,
         event_type: EventType,
@@ -583,8 +990,9 @@ class ArkivModule(ArkivModuleBase["Arkiv"]):
             callback=callback,
             from_block=from_block,
             auto_start=auto_start,
+            poller=self._filter_poller,
         )
 
         # Track the filter for cleanup
-        self._active_filters.append(event_filter)
+        self._add_active_filter(event_filter)
         return event_filter
@@ -2,21 +2,31 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import TYPE_CHECKING, Any
+from collections.abc import Sequence
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, Literal
 
 from eth_typing import ChecksumAddress, HexStr
-from web3.types import TxParams, TxReceipt
+from hexbytes import HexBytes
+from web3.exceptions import TimeExhausted, TransactionNotFound, Web3RPCError
+from web3.types import Nonce, TxParams, TxReceipt
 
 from arkiv.query_iterator import AsyncQueryIterator
 
 from .batch import AsyncBatchBuilder
-from .events_async import AsyncEventFilter
-from .module_base import ArkivModuleBase
+from .contract import FUNCTIONS_ABI
+from .events_async import AsyncEventFilter, NewHeadsListener
+from .module_base import (
+    ENTITY_KEYS_BATCH_SIZE_DEFAULT,
+    QUERY_BATCH_SIZE_DEFAULT,
+    ArkivModuleBase,
+)
 from .query_builder import AsyncQueryBuilder
 from .types import (
     ALL,
-    NONE,
+    KEY,
     QUERY_OPTIONS_DEFAULT,
     AsyncChangeOwnerCallback,
     AsyncCreateCallback,
@@ -25,6 +35,7 @@ from .types import (
     AsyncUpdateCallback,
     Attributes,
     ChangeOwnerOp,
+    CreateOp,
     DeleteOp,
     Entity,
     EntityKey,
@@ -35,9 +46,11 @@ from .types import (
     QueryPage,
     TransactionReceipt,
     TxHash,
+    UpdateOp,
 )
 from .utils import (
     to_create_op,
+    to_created_entity,
     to_query_result,
     to_rpc_query_options,
     to_tx_params,
@@ -46,14 +59,50 @@ from .utils import (
 
 # Deal with potential circular imports between client.py and module_async.py
 if TYPE_CHECKING:
-    from .client import AsyncArkiv  # noqa: F401 - used in Generic type parameter
+    from .client import AsyncArkiv
 
 logger = logging.getLogger(__name__)
 
 
+# How transaction receipts are awaited, see AsyncArkivModule
+ReceiptConfirmation = Literal["poll", "subscribe"]
+
+
 class AsyncArkivModule(ArkivModuleBase["AsyncArkiv"]):
     """Async Arkiv module for entity management operations."""
 
+    def __init__(
+        self,
+        client: AsyncArkiv,
+        receipt_poll_latency: float | None = None,
+        receipt_timeout: float | None = None,
+        receipt_confirmation: ReceiptConfirmation = "poll",
+    ) -> None:
+        """Initialize async Arkiv module with client reference.
+
+        Args:
+            client: AsyncArkiv client instance
+            receipt_poll_latency: Seconds between receipt polls (see ArkivModuleBase)
+            receipt_timeout: Seconds to wait for a transaction receipt
+            receipt_confirmation: "poll" to poll for receipts, or "subscribe" to
+                check for receipts on each new block of a newHeads subscription.
+                "subscribe" requires a WebSocket provider (falls back to polling
+                otherwise) and that no other code consumes the provider's
+                subscription messages concurrently.
+        """
+        super().__init__(client, receipt_poll_latency, receipt_timeout)
+        self.receipt_confirmation: ReceiptConfirmation = receipt_confirmation
+
+        # Serializes sending (not waiting), concurrent sends would otherwise
+        # get the same pending nonce from the signing middleware
+        self._send_lock = asyncio.Lock()
+
+        # One newHeads subscription shared by all concurrent receipt waits
+        self._new_heads = NewHeadsListener(client)
+
+        # Concurrent get_entity() calls for the same entity share one RPC call
+        self._inflight_entities: dict[tuple[Any, ...], asyncio.Task[Entity]] = {}
+
     async def execute(  # type: ignore[override]
         self, operations: Operations, tx_params: TxParams | None = None
     ) -> TransactionReceipt:
@@ -66,15 +115,106 @@ class AsyncArkivModule(ArkivModuleBase["AsyncArkiv"]):
         tx_params = to_tx_params(operations, tx_params)
 
         # Send transaction and get tx hash
-        tx_hash_bytes = await self.client.eth.send_transaction(tx_params)
-        tx_hash = TxHash(HexStr(tx_hash_bytes.to_0x_hex()))
+        async with self._send_lock:
+            tx_hash_bytes = await self._eth.send_transaction(tx_params)
 
         # Wait for transaction to complete and return receipt
-        tx_receipt: TxReceipt = await self.client.eth.wait_for_transaction_receipt(
-            tx_hash
-        )
+        tx_receipt = (await self._wait_for_receipts([tx_hash_bytes]))[0]
+        tx_hash = TxHash(HexStr(tx_hash_bytes.to_0x_hex()))
         return self._check_tx_and_get_receipt(tx_hash, tx_receipt)
 
+    async def execute_many(  # type: ignore[override]
+        self,
+        operations_list: Sequence[Operations],
+        tx_params: TxParams | None = None,
+    ) -> list[TransactionReceipt]:
+        # Docstring inherited from ArkivModuleBase.execute_many
+        self._check_has_account()
+        if not operations_list:
+            return []
+
+        # Send in nonce order with client-side nonces, without waiting
+        tx_hashes_bytes = []
+        async with self._send_lock:
+            nonce = await self._eth.get_transaction_count(
+                self._eth.default_account, "pending"
+            )
+            for offset, operations in enumerate(operations_list):
+                params = to_tx_params(operations, tx_params)
+                params["nonce"] = Nonce(nonce + offset)
+                tx_hashes_bytes.append(await self._eth.send_transaction(params))
+
+        # Then wait for all receipts together
+        tx_receipts = await self._wait_for_receipts(tx_hashes_bytes)
+        return [
+            self._check_tx_and_get_receipt(
+                TxHash(HexStr(tx_hash_bytes.to_0x_hex())), tx_receipt
+            )
+            for tx_hash_bytes, tx_receipt in zip(
+                tx_hashes_bytes, tx_receipts, strict=True
+            )
+        ]
+
+    async def _wait_for_receipts(
+        self, tx_hashes_bytes: Sequence[HexBytes]
+    ) -> list[TxReceipt]:
+        """Wait for the receipts of the transactions, in the provided order."""
+        if (
+            self.receipt_confirmation == "subscribe"
+            and self.client.provider.has_persistent_connection
+        ):
+            try:
+                return await asyncio.wait_for(
+                    self._wait_for_receipts_on_new_heads(tx_hashes_bytes),
+                    timeout=self.receipt_timeout,
+                )
+            except asyncio.TimeoutError as e:  # noqa: UP041 - not TimeoutError on 3.10
+                raise TimeExhausted(
+                    f"Transaction receipts not available after "
+                    f"{self.receipt_timeout} seconds"
+                ) from e
+
+        # Poll for all receipts concurrently
+        tx_receipts: list[TxReceipt] = await asyncio.gather(
+            *(
+                self._eth.wait_for_transaction_receipt(
+                    tx_hash_bytes,
+                    timeout=self.receipt_timeout,
+                    poll_latency=self.receipt_poll_latency,
+                )
+                for tx_hash_bytes in tx_hashes_bytes
+            )
+        )
+        return tx_receipts
+
+    async def _wait_for_receipts_on_new_heads(
+        self, tx_hashes_bytes: Sequence[HexBytes]
+    ) -> list[TxReceipt]:
+        """Check for missing receipts once initially and then on every new head."""
+        tx_receipts: dict[int, TxReceipt] = {}
+        await self._new_heads.acquire()
+        try:
+            while True:
+                # Heads arriving while receipts are checked are not missed
+                head_count = self._new_heads.head_count
+                for index, tx_hash_bytes in enumerate(tx_hashes_bytes):
+                    if index in tx_receipts:
+                        continue
+                    try:
+                        tx_receipts[index] = await self._eth.get_transaction_receipt(
+                            tx_hash_bytes
+                        )
+                    except TransactionNotFound:
+                        pass
+
+                if len(tx_receipts) == len(tx_hashes_bytes):
+                    return [tx_receipts[i] for i in range(len(tx_hashes_bytes))]
+
+                # Wait for the next block
+                await self._new_heads.wait(head_count)
+        finally:
+            await self._new_heads.release()
+
     async def create_entity(  # type: ignore[override]
         self,
         payload: bytes | None = None,
@@ -91,16 +231,29 @@ class AsyncArkivModule(ArkivModuleBase["AsyncArkiv"]):
             attributes=attributes,
             expires_in=expires_in,
         )
-        operations = Operations(creates=[create_op])
-        receipt = await self.execute(operations, tx_params)
+        entity_keys, receipt = await self.create_entities((create_op,), tx_params)
+        return entity_keys[0], receipt
 
-        # Verify we got at least one create
-        creates = receipt.creates
-        self._check_operations(receipt.creates, "create", 1)
+    async def create_entity_with_result(  # type: ignore[override]
+        self,
+        payload: bytes | None = None,
+        content_type: str | None = None,
+        attributes: Attributes | None = None,
+        expires_in: int | None = None,
+        tx_params: TxParams | None = None,
+    ) -> tuple[Entity, TransactionReceipt]:
+        # Docstring inherited from ArkivModuleBase.create_entity_with_result
+        create_op = to_create_op(
+            payload=payload,
+            content_type=content_type,
+            attributes=attributes,
+            expires_in=expires_in,
+        )
+        _, receipt = await self.create_entities((create_op,), tx_params)
 
-        # Return entity key and receipt
-        entity_key = creates[0].key
-        return entity_key, receipt
+        # Build entity from submitted data and receipt (no extra query)
+        entity = to_created_entity(create_op, receipt.creates[0], receipt.block_number)
+        return entity, receipt
 
     async def update_entity(  # type: ignore[override]
         self,
@@ -120,11 +273,32 @@ class AsyncArkivModule(ArkivModuleBase["AsyncArkiv"]):
             attributes=attributes,
             expires_in=expires_in,
         )
-        operations = Operations(updates=[update_op])
+        return await self.update_entities((update_op,), tx_params)
+
+    async def create_entities(  # type: ignore[override]
+        self,
+        creates: Sequence[CreateOp],
+        tx_params: TxParams | None = None,
+    ) -> tuple[list[EntityKey], TransactionReceipt]:
+        # Docstring inherited from ArkivModuleBase.create_entities
+        operations = Operations(creates=creates)
+        receipt = await self.execute(operations, tx_params)
+
+        # Verify receipt and return entity keys in input order
+        self._check_operations(receipt.creates, "create", len(creates))
+        return [create.key for create in receipt.creates], receipt
+
+    async def update_entities(  # type: ignore[override]
+        self,
+        updates: Sequence[UpdateOp],
+        tx_params: TxParams | None = None,
+    ) -> TransactionReceipt:
+        # Docstring inherited from ArkivModuleBase.update_entities
+        operations = Operations(updates=updates)
         receipt = await self.execute(operations, tx_params)
 
-        # Verify receipt and return receipt
-        self._check_operations(receipt.updates, "update", 1)
+        # Verify and return receipt
+        self._check_operations(receipt.updates, "update", len(updates))
         return receipt
 
     async def extend_entity(  # type: ignore[override]
@@ -136,11 +310,19 @@ class AsyncArkivModule(ArkivModuleBase["AsyncArkiv"]):
         # Docstring inherited from ArkivModuleBase.extend_entity
         # Create the extend operation and execute TX
         extend_op = ExtendOp(key=entity_key, extend_by=extend_by)
-        operations = Operations(extensions=[extend_op])
+        return await self.extend_entities((extend_op,), tx_params)
+
+    async def extend_entities(  # type: ignore[override]
+        self,
+        extensions: Sequence[ExtendOp],
+        tx_params: TxParams | None = None,
+    ) -> TransactionReceipt:
+        # Docstring inherited from ArkivModuleBase.extend_entities
+        operations = Operations(extensions=extensions)
         receipt = await self.execute(operations, tx_params)
 
         # Verify and return receipt
-        self._check_operations(receipt.extensions, "extend", 1)
+        self._check_operations(receipt.extensions, "extend", len(extensions))
         return receipt
 
     async def change_owner(  # type: ignore[override]
@@ -152,7 +334,7 @@ class AsyncArkivModule(ArkivModuleBase["AsyncArkiv"]):
         # Docstring inherited from ArkivModuleBase.change_owner
         # Create the change owner operation and execute TX
         change_owner_op = ChangeOwnerOp(key=entity_key, new_owner=new_owner)
-        operations = Operations(change_owners=[change_owner_op])
+        operations = Operations(change_owners=(change_owner_op,))
         receipt = await self.execute(operations, tx_params)
 
         # Verify and return receipt
@@ -167,33 +349,113 @@ class AsyncArkivModule(ArkivModuleBase["AsyncArkiv"]):
         # Docstring inherited from ArkivModuleBase.delete_entity
         # Create the delete operation and execute TX
         delete_op = DeleteOp(key=entity_key)
-        operations = Operations(deletes=[delete_op])
+        return await self.delete_entities((delete_op,), tx_params)
+
+    async def delete_entities(  # type: ignore[override]
+        self,
+        deletes: Sequence[DeleteOp],
+        tx_params: TxParams | None = None,
+    ) -> TransactionReceipt:
+        # Docstring inherited from ArkivModuleBase.delete_entities
+        operations = Operations(deletes=deletes)
         receipt = await self.execute(operations, tx_params)
 
         # Verify and return receipt
-        self._check_operations(receipt.deletes, "delete", 1)
+        self._check_operations(receipt.deletes, "delete", len(deletes))
         return receipt
 
     async def entity_exists(  # type: ignore[override]
         self, entity_key: EntityKey, at_block: int | None = None
     ) -> bool:
         # Docstring inherited from ArkivModuleBase.entity_exists
+        cache_key = ("exists", entity_key.lower(), at_block)
+        if at_block is not None:
+            cached: bool | None = self._get_cached(cache_key)
+            if cached is not None:
+                return cached
+
+        # Only check for a match, skip converting the response to a QueryPage
         try:
-            options = QueryOptions(attributes=NONE, at_block=at_block)
-            query_result: QueryPage = await self.query_entities_page(
-                f"$key = {entity_key}", options=options
+            rpc_options = self._to_entity_exists_rpc_options(at_block)
+            raw_results = await self._eth.query(
+                self._to_entity_key_query(entity_key), rpc_options
             )
-            return len(query_result.entities) > 0
-        except Exception:
+        except Web3RPCError:
+            # The node rejected the query, e.g. for an invalid entity key
             return False
 
+        exists = self._has_query_data(raw_results)
+        if at_block is not None:
+            self._set_cached(cache_key, exists)
+        return exists
+
     async def get_entity(  # type: ignore[override]
         self, entity_key: EntityKey, fields: int = ALL, at_block: int | None = None
     ) -> Entity:
         # Docstring inherited from ArkivModuleBase.get_entity
+        cache_key = self._entity_cache_key(entity_key, fields, at_block)
+        if at_block is not None:
+            cached: Entity | None = self._get_cached(cache_key)
+            if cached is not None:
+                return cached
+
+        task = self._inflight_entities.get(cache_key)
+        if task is None:
+            # The fetch runs in its own task, shared by all callers until it is done
+            task = asyncio.ensure_future(
+                self._fetch_entity(entity_key, fields, at_block)
+            )
+            self._inflight_entities[cache_key] = task
+            task.add_done_callback(
+                lambda done: self._remove_inflight_entity(cache_key, done)
+            )
+
+        # Shielded, a cancelled caller must not cancel the fetch of the others.
+        # Each caller gets its own copy of the shared result.
+        result_entity: Entity = self._copy_entity(await asyncio.shield(task))
+        if at_block is not None:
+            self._set_cached(cache_key, result_entity)
+        return result_entity
+
+    def _remove_inflight_entity(
+        self, cache_key: tuple[Any, ...], task: asyncio.Task[Entity]
+    ) -> None:
+        """Remove a finished entity fetch from the in-flight fetches."""
+        if self._inflight_entities.get(cache_key) is task:
+            del self._inflight_entities[cache_key]
+        if not task.cancelled():
+            # Mark the exception as retrieved in case all callers were cancelled
+            task.exception()
+
+    async def get_entity_if_exists(  # type: ignore[override]
+        self, entity_key: EntityKey, fields: int = ALL, at_block: int | None = None
+    ) -> Entity | None:
+        # Docstring inherited from ArkivModuleBase.get_entity_if_exists
+        if at_block is not None:
+            cached: Entity | None = self._get_cached(
+                self._entity_cache_key(entity_key, fields, at_block)
+            )
+            if cached is not None:
+                return cached
+
+        options = QueryOptions(attributes=fields, at_block=at_block)
+        try:
+            query_result = await self.query_entities_page(
+                self._to_entity_key_query(entity_key), options=options
+            )
+        except Web3RPCError:
+            # The node rejected the query, e.g. for an invalid entity key
+            return None
+
+        return self._to_entity_if_exists(entity_key, fields, at_block, query_result)
+
+    async def _fetch_entity(
+        self, entity_key: EntityKey, fields: int, at_block: int | None
+    ) -> Entity:
+        """Fetch a single entity with one query."""
         options = QueryOptions(attributes=fields, at_block=at_block)
         query_result: QueryPage = await self.query_entities_page(
-            f"$key = {entity_key}", options=options
+            self._to_entity_key_query(entity_key), options=options
         )
 
         if not query_result:
@@ -202,8 +464,82 @@ class AsyncArkivModule(ArkivModuleBase["AsyncArkiv"]):
         if len(query_result.entities) != 1:
             raise ValueError(f"Expected 1 entity, got {len(query_result.entities)}")
 
-        result_entity = query_result.entities[0]
-        return result_entity
+        return query_result.entities[0]
+
+    async def get_entities(  # type: ignore[override]
+        self,
+        entity_keys: Sequence[EntityKey],
+        fields: int = ALL,
+        at_block: int | None = None,
+        batch_size: int = ENTITY_KEYS_BATCH_SIZE_DEFAULT,
+    ) -> list[Entity]:
+        # Docstring inherited from ArkivModuleBase.get_entities
+        entities = await self._fetch_entities_by_key(
+            entity_keys, fields | KEY, at_block, batch_size
+        )
+        return self._to_ordered_entities(entity_keys, entities)
+
+    async def entities_exist(  # type: ignore[override]
+        self,
+        entity_keys: Sequence[EntityKey],
+        at_block: int | None = None,
+        batch_size: int = ENTITY_KEYS_BATCH_SIZE_DEFAULT,
+    ) -> list[bool]:
+        # Docstring inherited from ArkivModuleBase.entities_exist
+        entities = await self._fetch_entities_by_key(
+            entity_keys, KEY, at_block, batch_size
+        )
+        return [entity_key.lower() in entities for entity_key in entity_keys]
+
+    async def _fetch_entities_by_key(
+        self,
+        entity_keys: Sequence[EntityKey],
+        fields: int,
+        at_block: int | None,
+        batch_size: int,
+    ) -> dict[str, Entity]:
+        """Fetch entities for the keys in batches, indexed by lowercase key."""
+        entities: dict[str, Entity] = {}
+        if at_block is not None:
+            # Entities at a fixed block are immutable, only fetch uncached keys
+            entities, entity_keys = self._get_cached_entities(
+                entity_keys, fields, at_block
+            )
+
+        fetched: dict[str, Entity] = {}
+        options = QueryOptions(
+            attributes=fields, at_block=at_block, max_results_per_page=batch_size
+        )
+        queries = [
+            self._to_entity_keys_query(batch)
+            for batch in self._to_entity_key_batches(entity_keys, batch_size)
+        ]
+        pages: list[QueryPage] = []
+        if queries and options.at_block is None:
+            # Read all batches from the same block as the first one
+            pages.append(await self.query_entities_page(queries[0], options))
+            options = replace(options, at_block=pages[0].block_number)
+
+        # Fetch the remaining batches in JSON-RPC batch requests
+        remaining = [(query, options) for query in queries[len(pages) :]]
+        pages.extend(await self.query_entities_pages(remaining))
+        for query, page in zip(queries, pages, strict=True):
+            self._add_entities_by_key(fetched, page.entities)
+            if page.has_more():
+                # Only if the node caps the page size below batch_size
+                more_options = replace(options, cursor=page.cursor)
+                self._add_entities_by_key(
+                    fetched,
+                    [
+                        entity
+                        async for entity in self.query_entities(query, more_options)
+                    ],
+                )
+
+        if at_block is not None:
+            self._set_cached_entities(fetched, fields, at_block)
+        entities.update(fetched)
+        return entities
 
     async def query_entities_page(  # type: ignore[override]
         self,
@@ -213,12 +549,36 @@ class AsyncArkivModule(ArkivModuleBase["AsyncArkiv"]):
         # Docstring inherited from ArkivModuleBase.query_entities
         options.validate(query)
         rpc_options = to_rpc_query_options(options)
-        raw_results = await self.client.eth.query(query, rpc_options)
+        raw_results = await self._eth.query(query, rpc_options)
 
         return to_query_result(options.attributes, raw_results)
 
+    async def query_entities_pages(  # type: ignore[override]
+        self,
+        queries: Sequence[tuple[str, QueryOptions]],
+        batch_size: int = QUERY_BATCH_SIZE_DEFAULT,
+    ) -> list[QueryPage]:
+        # Docstring inherited from ArkivModuleBase.query_entities_pages
+        pages: list[QueryPage] = []
+        for batch_queries in self._to_query_batches(queries, batch_size):
+            async with self.client.batch_requests() as batch:
+                # Attached eth methods are bound outside of batching, bind again
+                query_method = FUNCTIONS_ABI["query"].__get__(self._eth)
+                for query, options in batch_queries:
+                    batch.add(query_method(query, to_rpc_query_options(options)))
+                raw_results = await batch.async_execute()
+
+            for (_, options), raw_result in zip(
+                batch_queries, raw_results, strict=True
+            ):
+                pages.append(to_query_result(options.attributes, raw_result))
+        return pages
+
     def query_entities(
-        self, query: str, options: QueryOptions = QUERY_OPTIONS_DEFAULT
+        self,
+        query: str,
+        options: QueryOptions = QUERY_OPTIONS_DEFAULT,
+        prefetch: bool = False,
     ) -> AsyncQueryIterator:
         """
         Provides an iterator over entity results for the provided query.
@@ -229,6 +589,8 @@ class AsyncArkivModule(ArkivModuleBase["AsyncArkiv"]):
         Args:
             query: SQL-like where clause
             options: QueryOptions for the query execution
+            prefetch: Fetch the next page in a background task while the
+                current page is processed (default: False)
 
         Returns:
             QueryIterator that yields Entity objects across all pages.
@@ -258,6 +620,7 @@ class AsyncArkivModule(ArkivModuleBase["AsyncArkiv"]):
             client=self.client,
             query=query,
             options=options,
+            prefetch=prefetch,
         )
 
     def select(self, *fields: int) -> AsyncQueryBuilder:
@@ -396,33 +759,38 @@ class AsyncArkivModule(ArkivModuleBase["AsyncArkiv"]):
         This is automatically called when the AsyncArkiv client exits its context,
         but can be called manually if needed.
         """
-        if not self._active_filters:
+        event_filters = self._take_active_filters()
+        if not event_filters:
             logger.debug("No active filters to cleanup")
             return
 
         logger.info(
-            f"Cleaning up {len(self._active_filters)} active async event filter(s)..."
+            "Cleaning up %d active async event filter(s)...", len(event_filters)
         )
 
-        for event_filter in self._active_filters:
-            try:
-                await event_filter.uninstall()
-            except Exception as e:
-                logger.warning(f"Error cleaning up async filter: {e}")
+        # Uninstall concurrently, stopping a filter awaits its polling task
+        await asyncio.gather(*(self._uninstall_filter(f) for f in event_filters))
 
-        self._active_filters.clear()
         logger.info("All async event filters cleaned up")
 
+    @staticmethod
+    async def _uninstall_filter(event_filter: AsyncEventFilter) -> None:
+        """Uninstall an async event filter, logging instead of raising errors."""
+        try:
+            await event_filter.uninstall()
+        except Exception as e:
+            logger.warning("Error cleaning up async filter: %s", e)
+
     async def get_block_timing(self) -> Any:
-        block_timing_response = await self.client.eth.get_block_timing()
-        logger.info(f"Block timing response: {block_timing_response}")
+        block_timing_response = await self._eth.get_block_timing()
+        logger.info("Block timing response: %s", block_timing_response)
 
         return block_timing_response
 
     @property
-    def active_filters(self) -> list[AsyncEventFilter]:
-        """Get a copy of currently active async event filters."""
-        return list(self._active_filters)
+    def active_filters(self) -> tuple[AsyncEventFilter, ...]:
+        """Get a read-only snapshot of currently active async event filters."""
+        return tuple(self._active_filters)
 
     def batch(self) -> AsyncBatchBuilder:
         """
@@ -556,6 +924,6 @@ class AsyncArkivModule(ArkivModuleBase["AsyncArkiv"]):
             await event_filter.start()
 
         # Track the filter for cleanup
-        self._active_filters.append(event_filter)
+        self._add_active_filter(event_filter)
 
         return event_filter
@@ -19,6 +19,11 @@ Key Design Decisions:
 4. Shared utility methods (_check_operations, _check_tx_and_get_receipt, etc.) are
    implemented directly in this base class.
 
+5. A few of these utilities are protected helpers for the SDK's own classes built on
+   top of a module (TxPipeline, BatchBuilder): _check_has_account,
+   _check_tx_and_get_receipt and _check_receipt_operations. Their docstrings say so,
+   they are kept stable for these callers but are not part of the public API.
+
 This approach:
 - Satisfies mypy's type checking (using type: ignore[override] for async)
 - Avoids documentation duplication - single source of truth for all docstrings
@@ -30,7 +35,10 @@ This approach:
 from __future__ import annotations
 
 import logging
-from collections.abc import Sequence
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from dataclasses import replace
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from eth_typing import ChecksumAddress
@@ -38,17 +46,23 @@ from web3.types import TxParams, TxReceipt
 
 from arkiv.types import (
     ALL,
+    NONE,
     QUERY_OPTIONS_DEFAULT,
     Attributes,
+    CreateOp,
+    DeleteOp,
     Entity,
+    EntityCacheInfo,
     EntityKey,
+    ExtendOp,
     Operations,
     QueryOptions,
     QueryPage,
     TransactionReceipt,
     TxHash,
+    UpdateOp,
 )
-from arkiv.utils import to_receipt
+from arkiv.utils import to_receipt, to_rpc_query_options
 
 from .contract import ARKIV_ADDRESS, EVENTS_ABI, FUNCTIONS_ABI
 
@@ -57,6 +71,12 @@ if TYPE_CHECKING:
 
 TX_SUCCESS = 1
 
+# Max number of entity keys combined into a single query by bulk reads
+ENTITY_KEYS_BATCH_SIZE_DEFAULT = 50
+
+# Max number of queries sent in a single JSON-RPC batch request
+QUERY_BATCH_SIZE_DEFAULT = 25
+
 logger = logging.getLogger(__name__)
 
 # Generic type variable for the client (Arkiv or AsyncArkiv)
@@ -82,28 +102,104 @@ class ArkivModuleBase(Generic[ClientT]):
     CONTENT_TYPE_DEFAULT = (
         "application/octet-stream"  # Default content type for payloads
     )
+    RECEIPT_POLL_LATENCY_DEFAULT = 0.5  # Seconds between receipt polls
+    RECEIPT_TIMEOUT_DEFAULT = 120.0  # Seconds to wait for a receipt
+    ENTITY_CACHE_SIZE_DEFAULT = 256  # Max cached reads for fixed blocks (0 = off)
 
-    def __init__(self, client: ClientT) -> None:
+    def __init__(
+        self,
+        client: ClientT,
+        receipt_poll_latency: float | None = None,
+        receipt_timeout: float | None = None,
+    ) -> None:
         """Initialize Arkiv module with client reference.
 
         Args:
             client: Arkiv or AsyncArkiv client instance
+            receipt_poll_latency: Seconds between polls while waiting for a
+                transaction receipt (default: RECEIPT_POLL_LATENCY_DEFAULT)
+            receipt_timeout: Seconds to wait for a transaction receipt before
+                raising TimeExhausted (default: RECEIPT_TIMEOUT_DEFAULT)
         """
         self.client = client
 
+        # web3.py polls for receipts every 0.1s by default, i.e. ~20 RPCs per block
+        self.receipt_poll_latency: float = (
+            receipt_poll_latency
+            if receipt_poll_latency is not None
+            else self.RECEIPT_POLL_LATENCY_DEFAULT
+        )
+        self.receipt_timeout: float = (
+            receipt_timeout
+            if receipt_timeout is not None
+            else self.RECEIPT_TIMEOUT_DEFAULT
+        )
+
         # Attach custom Arkiv RPC methods to the eth object
         # Type checking: client has 'eth' attribute from Web3/AsyncWeb3
         client.eth.attach_methods(FUNCTIONS_ABI)  # type: ignore[attr-defined]
-        for method_name in FUNCTIONS_ABI.keys():
-            logger.debug(f"Custom RPC method: eth.{method_name}")
 
         # Create contract instance for events (using EVENTS_ABI)
         self.contract = client.eth.contract(address=ARKIV_ADDRESS, abi=EVENTS_ABI)  # type: ignore[attr-defined]
-        for event in self.contract.all_events():
-            logger.debug(f"Entity event {event.topic}: {event.signature}")
+
+        # Listing all contract events is costly (~0.3ms), only do it for debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            for method_name in FUNCTIONS_ABI.keys():
+                logger.debug("Custom RPC method: eth.%s", method_name)
+            for event in self.contract.all_events():
+                logger.debug("Entity event %s: %s", event.topic, event.signature)
+
+        # Resolve the eth module once, it is used on every RPC call
+        self._eth: Any = client.eth  # type: ignore[attr-defined]
 
         # Track active event filters for cleanup (type will be EventFilter or AsyncEventFilter)
-        self._active_filters: list[Any] = []
+        # Guarded by a lock, filters may be added and cleaned up from different threads.
+        # Strong references (insertion ordered), a stopped filter the caller dropped
+        # may still have a filter installed on the node that cleanup must remove.
+        self._active_filters: dict[Any, None] = {}
+        self._filters_lock = threading.Lock()
+
+        # LRU cache for reads pinned to a block (entity state at a block is immutable)
+        self.entity_cache_size: int = self.ENTITY_CACHE_SIZE_DEFAULT
+        self._entity_cache: OrderedDict[tuple[Any, ...], Any] = OrderedDict()
+        # Guards the cache and its statistics, reads may run in several threads
+        # (e.g. query prefetch, parallel writes) of the same client
+        self._entity_cache_lock = threading.Lock()
+        self._entity_cache_hits = 0
+        self._entity_cache_misses = 0
+
+    def _add_active_filter(self, event_filter: Any) -> None:
+        """Track an event filter for cleanup."""
+        with self._filters_lock:
+            self._active_filters[event_filter] = None
+
+    def _take_active_filters(self) -> list[Any]:
+        """Remove and return all tracked event filters (to uninstall them)."""
+        with self._filters_lock:
+            event_filters, self._active_filters = self._active_filters, {}
+        return list(event_filters)
+
+    @property
+    def active_filter_count(self) -> int:
+        """Get the number of active event filters without copying them."""
+        return len(self._active_filters)
+
+    def clear_entity_cache(self) -> None:
+        """Clear cached get_entity() and entity_exists() results for fixed blocks."""
+        with self._entity_cache_lock:
+            self._entity_cache.clear()
+            self._entity_cache_hits = 0
+            self._entity_cache_misses = 0
+
+    def entity_cache_info(self) -> EntityCacheInfo:
+        """Get hit/miss statistics and size of the entity read cache."""
+        with self._entity_cache_lock:
+            return EntityCacheInfo(
+                hits=self._entity_cache_hits,
+                misses=self._entity_cache_misses,
+                max_size=self.entity_cache_size,
+                size=len(self._entity_cache),
+            )
 
     def is_available(self) -> bool:
         """Check if Arkiv functionality is available. Should always be true for Arkiv clients."""
@@ -165,6 +261,43 @@ class ArkivModuleBase(Generic[ClientT]):
         """
         raise NotImplementedError("Subclasses must implement execute()")
 
+    def execute_many(
+        self,
+        operations_list: Sequence[Operations],
+        tx_params: TxParams | None = None,
+    ) -> list[TransactionReceipt]:
+        """
+        Execute several independent operations, one transaction each.
+
+        All transactions are submitted back-to-back with client-side nonces and
+        only then waited for, so they are typically included in the same block
+        instead of one block per transaction.
+
+        Args:
+            operations_list: Operations to execute, one transaction per entry
+            tx_params: Optional transaction parameters applied to every
+                transaction (any provided nonce is replaced)
+
+        Returns:
+            TransactionReceipts in the order of operations_list
+
+        Raises:
+            RuntimeError: If any transaction fails (status != 1)
+            ValueError: If no account is configured or operations are invalid
+
+        Example:
+            >>> receipts = client.arkiv.execute_many([
+            ...     Operations(extensions=[ExtendOp(key=key_1, extend_by=3600)]),
+            ...     Operations(deletes=[DeleteOp(key=key_2)]),
+            ... ])
+
+        Note:
+            - When using AsyncArkiv, use 'await' before calling this method
+            - Each transaction is atomic on its own, but not across transactions
+            - Use execute() to apply all operations in one atomic transaction
+        """
+        raise NotImplementedError("Subclasses must implement execute_many()")
+
     def create_entity(
         self,
         payload: bytes | None = None,
@@ -207,6 +340,54 @@ class ArkivModuleBase(Generic[ClientT]):
         """
         raise NotImplementedError("Subclasses must implement create_entity()")
 
+    def create_entity_with_result(
+        self,
+        payload: bytes | None = None,
+        content_type: str | None = None,
+        attributes: Attributes | None = None,
+        expires_in: int | None = None,
+        tx_params: TxParams | None = None,
+    ) -> tuple[Entity, TransactionReceipt]:
+        """
+        Create a new entity and return it without reading it back from the node.
+
+        Same as create_entity(), but returns the created Entity instead of its key.
+        No query is made: the entity is built locally from the submitted data and
+        the receipt, which saves the get_entity() round-trip after a create. Use
+        get_entity() if the node's view of the entity is needed.
+
+        Args:
+            payload: Optional data payload for the entity (default: empty bytes)
+            content_type: Optional content type for the payload (default: "application/octet-stream")
+            attributes: Optional key-value attributes as metadata
+            expires_in: Entity lifetime in seconds
+            tx_params: Optional transaction parameters (gas, gasPrice, etc.)
+
+        Returns:
+            Tuple of (Entity, TransactionReceipt):
+            - Entity: The created entity
+            - TransactionReceipt: Receipt with transaction details and emitted events
+
+        Raises:
+            RuntimeError: If the transaction fails or receipt validation fails
+            ValueError: If invalid parameters are provided
+
+        Example:
+            >>> entity, receipt = client.arkiv.create_entity_with_result(
+            ...     payload=b"Hello, Arkiv!", expires_in=1000
+            ... )
+            >>> print(f"Created {entity.key}, expires at {entity.expires_at_block}")
+
+        Note:
+            - When using AsyncArkiv, use 'await' before calling this method
+            - owner is the transaction sender, created_at_block and
+              last_modified_at_block are the receipt's block number
+            - transaction_index is not populated (TX_INDEX_IN_BLOCK is not in fields)
+        """
+        raise NotImplementedError(
+            "Subclasses must implement create_entity_with_result()"
+        )
+
     def update_entity(
         self,
         entity_key: EntityKey,
@@ -251,6 +432,72 @@ class ArkivModuleBase(Generic[ClientT]):
         """
         raise NotImplementedError("Subclasses must implement update_entity()")
 
+    def create_entities(
+        self,
+        creates: Sequence[CreateOp],
+        tx_params: TxParams | None = None,
+    ) -> tuple[list[EntityKey], TransactionReceipt]:
+        """
+        Create multiple entities in a single transaction.
+
+        Args:
+            creates: Create operations, e.g. built with CreateOp(...)
+            tx_params: Optional transaction parameters (gas, gasPrice, etc.)
+
+        Returns:
+            Tuple of (list[EntityKey], TransactionReceipt):
+            - list[EntityKey]: Keys of the created entities, in input order
+            - TransactionReceipt: Receipt with transaction details and emitted events
+
+        Raises:
+            RuntimeError: If the transaction fails or receipt validation fails
+            ValueError: If no create operations are provided
+
+        Example:
+            >>> entity_keys, receipt = client.arkiv.create_entities(
+            ...     [
+            ...         CreateOp(
+            ...             payload=f"item {i}".encode(),
+            ...             content_type="text/plain",
+            ...             attributes=Attributes({"index": i}),
+            ...             expires_in=1000,
+            ...         )
+            ...         for i in range(100)
+            ...     ]
+            ... )
+
+        Note:
+            - When using AsyncArkiv, use 'await' before calling this method
+            - All creates succeed or fail together (atomic)
+            - For mixed operation types use batch() instead
+        """
+        raise NotImplementedError("Subclasses must implement create_entities()")
+
+    def update_entities(
+        self,
+        updates: Sequence[UpdateOp],
+        tx_params: TxParams | None = None,
+    ) -> TransactionReceipt:
+        """
+        Update multiple entities in a single transaction.
+
+        Args:
+            updates: Update operations, e.g. built with UpdateOp(...)
+            tx_params: Optional transaction parameters (gas, gasPrice, etc.)
+
+        Returns:
+            TransactionReceipt with transaction details and update events
+
+        Raises:
+            RuntimeError: If the transaction fails or any entity doesn't exist
+            ValueError: If no update operations are provided
+
+        Note:
+            - When using AsyncArkiv, use 'await' before calling this method
+            - All updates succeed or fail together (atomic)
+        """
+        raise NotImplementedError("Subclasses must implement update_entities()")
+
     def change_owner(
         self,
         entity_key: EntityKey,
@@ -319,6 +566,31 @@ class ArkivModuleBase(Generic[ClientT]):
         """
         raise NotImplementedError("Subclasses must implement extend_entity()")
 
+    def extend_entities(
+        self,
+        extensions: Sequence[ExtendOp],
+        tx_params: TxParams | None = None,
+    ) -> TransactionReceipt:
+        """
+        Extend the lifetime of multiple entities in a single transaction.
+
+        Args:
+            extensions: Extend operations, e.g. built with ExtendOp(...)
+            tx_params: Optional transaction parameters
+
+        Returns:
+            TransactionReceipt with transaction details and extension events
+
+        Raises:
+            RuntimeError: If the transaction fails or any entity doesn't exist
+            ValueError: If no extend operations are provided
+
+        Note:
+            - When using AsyncArkiv, use 'await' before calling this method
+            - All extensions succeed or fail together (atomic)
+        """
+        raise NotImplementedError("Subclasses must implement extend_entities()")
+
     def delete_entity(
         self,
         entity_key: EntityKey,
@@ -348,6 +620,31 @@ class ArkivModuleBase(Generic[ClientT]):
         """
         raise NotImplementedError("Subclasses must implement delete_entity()")
 
+    def delete_entities(
+        self,
+        deletes: Sequence[DeleteOp],
+        tx_params: TxParams | None = None,
+    ) -> TransactionReceipt:
+        """
+        Delete multiple entities in a single transaction.
+
+        Args:
+            deletes: Delete operations, e.g. built with DeleteOp(...)
+            tx_params: Optional transaction parameters
+
+        Returns:
+            TransactionReceipt with transaction details and deletion events
+
+        Raises:
+            RuntimeError: If the transaction fails or any entity doesn't exist
+            ValueError: If no delete operations are provided
+
+        Note:
+            - When using AsyncArkiv, use 'await' before calling this method
+            - All deletes succeed or fail together (atomic)
+        """
+        raise NotImplementedError("Subclasses must implement delete_entities()")
+
     def entity_exists(self, entity_key: EntityKey, at_block: int | None = None) -> bool:
         """
         Check if an entity exists in storage.
@@ -366,7 +663,9 @@ class ArkivModuleBase(Generic[ClientT]):
         Note:
             - When using AsyncArkiv, use 'await' before calling this method
             - Returns False for expired entities
-            - Returns False if any error occurs during query
+            - Returns False if the node rejects the query (e.g. an invalid key),
+              connection errors are raised
+            - Results for an explicit at_block are cached (see clear_entity_cache)
         """
         raise NotImplementedError("Subclasses must implement entity_exists()")
 
@@ -405,9 +704,113 @@ class ArkivModuleBase(Generic[ClientT]):
             - When using AsyncArkiv, use 'await' before calling this method
             - Requesting fewer fields can improve performance
             - Use NONE to check existence without fetching data
+            - Results for an explicit at_block are cached (see clear_entity_cache)
+            - Concurrent calls for the same entity, fields and at_block share one
+              RPC call and its result or error
         """
         raise NotImplementedError("Subclasses must implement get_entity()")
 
+    def get_entity_if_exists(
+        self, entity_key: EntityKey, fields: int = ALL, at_block: int | None = None
+    ) -> Entity | None:
+        """
+        Get an entity by its entity key, or None if it does not exist.
+
+        Replaces the entity_exists() + get_entity() pair with a single query.
+
+        Args:
+            entity_key: The entity key to retrieve
+            fields: Bitfield indicating which fields to retrieve (default: ALL)
+            at_block: Optional block number to query at (default: latest)
+
+        Returns:
+            Entity object with the requested fields populated, or None if the
+            entity does not exist
+
+        Raises:
+            ValueError: If multiple entities are returned
+
+        Example:
+            >>> entity = client.arkiv.get_entity_if_exists(entity_key)
+            >>> if entity is not None:
+            ...     print(f"Payload: {entity.payload}")
+
+        Note:
+            - When using AsyncArkiv, use 'await' before calling this method
+            - Returns None for expired entities
+            - Returns None if the node rejects the query (e.g. an invalid key),
+              connection errors are raised
+            - Results for an explicit at_block are cached (see clear_entity_cache)
+        """
+        raise NotImplementedError("Subclasses must implement get_entity_if_exists()")
+
+    def get_entities(
+        self,
+        entity_keys: Sequence[EntityKey],
+        fields: int = ALL,
+        at_block: int | None = None,
+        batch_size: int = ENTITY_KEYS_BATCH_SIZE_DEFAULT,
+    ) -> list[Entity]:
+        """
+        Get multiple entities by their entity keys.
+
+        The keys are combined into "$key = ... OR $key = ..." queries of up to
+        batch_size keys each, so N entities are fetched with about N / batch_size
+        queries instead of N. After the first query, the remaining queries are sent
+        in JSON-RPC batch requests. All batches are read at the same block.
+
+        Args:
+            entity_keys: The entity keys to retrieve
+            fields: Bitfield indicating which fields to retrieve (default: ALL).
+                    KEY is always included to match results to the requested keys.
+            at_block: Optional block number to query at (default: latest)
+            batch_size: Maximum number of keys per query (default: 50)
+
+        Returns:
+            Entities in the order of the provided entity keys
+
+        Raises:
+            ValueError: If any entity is not found or batch_size is not positive
+
+        Example:
+            >>> entities = client.arkiv.get_entities([key_1, key_2, key_3])
+            >>> for entity in entities:
+            ...     print(f"{entity.key}: {entity.payload}")
+
+        Note:
+            - When using AsyncArkiv, use 'await' before calling this method
+        """
+        raise NotImplementedError("Subclasses must implement get_entities()")
+
+    def entities_exist(
+        self,
+        entity_keys: Sequence[EntityKey],
+        at_block: int | None = None,
+        batch_size: int = ENTITY_KEYS_BATCH_SIZE_DEFAULT,
+    ) -> list[bool]:
+        """
+        Check if multiple entities exist in storage.
+
+        Uses the same batched key queries as get_entities(), fetching keys only.
+
+        Args:
+            entity_keys: The entity keys to check
+            at_block: Optional block number to check at (default: latest)
+            batch_size: Maximum number of keys per query (default: 50)
+
+        Returns:
+            One flag per provided entity key, True if the entity exists
+
+        Example:
+            >>> exists = client.arkiv.entities_exist([key_1, key_2])
+            >>> missing = [k for k, e in zip([key_1, key_2], exists) if not e]
+
+        Note:
+            - When using AsyncArkiv, use 'await' before calling this method
+            - Returns False for expired entities
+        """
+        raise NotImplementedError("Subclasses must implement entities_exist()")
+
     def query_entities_page(
         self, query: str, options: QueryOptions = QUERY_OPTIONS_DEFAULT
     ) -> QueryPage:
@@ -455,6 +858,54 @@ class ArkivModuleBase(Generic[ClientT]):
         """
         raise NotImplementedError("Subclasses must implement query_entities()")
 
+    def query_entities_pages(
+        self,
+        queries: Sequence[tuple[str, QueryOptions]],
+        batch_size: int = QUERY_BATCH_SIZE_DEFAULT,
+    ) -> list[QueryPage]:
+        """
+        Execute several queries using JSON-RPC batch requests.
+
+        The queries are sent together in batch requests of up to batch_size
+        queries instead of one HTTP round-trip per query.
+
+        Args:
+            queries: Pairs of query string and QueryOptions (see query_entities_page)
+            batch_size: Maximum number of queries per batch request (default: 25)
+
+        Returns:
+            List of QueryPage results, in the order of the provided queries
+
+        Raises:
+            ValueError: If a query or its options are invalid or batch_size < 1
+            Web3RPCError: If the node rejects any of the queries
+
+        Example:
+            >>> pages = client.arkiv.query_entities_pages([
+            ...     ("$attributes.type = 'user'", QueryOptions(attributes=KEY)),
+            ...     ("$attributes.type = 'group'", QueryOptions(attributes=KEY)),
+            ... ])
+
+        Note:
+            - When using AsyncArkiv, use 'await' before calling this method
+            - Each query returns its first page only (use the page cursors
+              with query_entities_page to fetch more)
+        """
+        raise NotImplementedError("Subclasses must implement query_entities_pages()")
+
+    @staticmethod
+    def _to_query_batches(
+        queries: Sequence[tuple[str, QueryOptions]], batch_size: int
+    ) -> list[Sequence[tuple[str, QueryOptions]]]:
+        """Validate queries and split them into batches of at most batch_size."""
+        if batch_size < 1:
+            raise ValueError(f"Batch size must be positive: {batch_size}")
+
+        for query, options in queries:
+            options.validate(query)
+
+        return [queries[i : i + batch_size] for i in range(0, len(queries), batch_size)]
+
     @staticmethod
     def to_seconds(
         seconds: int = 0, minutes: int = 0, hours: int = 0, days: int = 0
@@ -501,19 +952,180 @@ class ArkivModuleBase(Generic[ClientT]):
     # be defined here, but they have more significant differences between sync/async
     # (e.g., AsyncIterator vs Iterator, AsyncEventFilter vs EventFilter).
 
+    @staticmethod
     def _check_operations(
-        self, operations: Sequence[Any], operation_name: str, expected_count: int
+        operations: Sequence[Any], operation_name: str, expected_count: int
     ) -> None:
-        """Check that the number of operations matches the expected count."""
+        """Check that the number of operations matches the expected count.
+
+        Receipt events come from the node, so this is kept as a runtime check
+        (not an assert). On success it is a single length comparison.
+        """
         if len(operations) != expected_count:
             raise RuntimeError(
                 f"Expected {expected_count} '{operation_name}' operations but got {len(operations)}"
             )
 
+    @staticmethod
+    def _check_receipt_operations(
+        operations: Operations, receipt: TransactionReceipt
+    ) -> None:
+        """Check that the receipt contains one event per submitted operation.
+
+        Protected helper, also used by BatchBuilder to verify executed batches.
+        """
+        check = ArkivModuleBase._check_operations
+        check(receipt.creates, "create", len(operations.creates))
+        check(receipt.updates, "update", len(operations.updates))
+        check(receipt.extensions, "extend", len(operations.extensions))
+        check(receipt.change_owners, "change_owner", len(operations.change_owners))
+        check(receipt.deletes, "delete", len(operations.deletes))
+
+    def _get_cached(self, cache_key: tuple[Any, ...]) -> Any | None:
+        """Get a cached read result and mark it as recently used."""
+        with self._entity_cache_lock:
+            value = self._entity_cache.get(cache_key)
+            if value is not None:
+                self._entity_cache.move_to_end(cache_key)
+                self._entity_cache_hits += 1
+            else:
+                self._entity_cache_misses += 1
+        return self._copy_entity(value)
+
+    @staticmethod
+    def _copy_entity(value: Any) -> Any:
+        """Copy an entity's attributes dict, so callers cannot edit a shared entity."""
+        if isinstance(value, Entity) and value.attributes is not None:
+            return replace(value, attributes=Attributes(dict(value.attributes)))
+        return value
+
+    @staticmethod
+    def _entity_cache_key(
+        entity_key: str, fields: int, at_block: int | None
+    ) -> tuple[Any, ...]:
+        """Build the cache key of an entity read (keys are case insensitive)."""
+        return ("entity", entity_key.lower(), fields, at_block)
+
+    def _get_cached_entities(
+        self, entity_keys: Sequence[EntityKey], fields: int, at_block: int
+    ) -> tuple[dict[str, Entity], list[EntityKey]]:
+        """Split keys into cached entities (by lowercase key) and keys to fetch."""
+        entities: dict[str, Entity] = {}
+        missing_keys: list[EntityKey] = []
+        for entity_key in entity_keys:
+            cache_key = self._entity_cache_key(entity_key, fields, at_block)
+            entity: Entity | None = self._get_cached(cache_key)
+            if entity is None:
+                missing_keys.append(entity_key)
+            else:
+                entities[entity_key.lower()] = entity
+        return entities, missing_keys
+
+    def _set_cached_entities(
+        self, entities: dict[str, Entity], fields: int, at_block: int
+    ) -> None:
+        """Cache entities fetched at a fixed block, indexed by lowercase key."""
+        for entity_key, entity in entities.items():
+            self._set_cached(
+                self._entity_cache_key(entity_key, fields, at_block), entity
+            )
+
+    def _set_cached(self, cache_key: tuple[Any, ...], value: Any) -> None:
+        """Cache a read result, evicting the least recently used entries."""
+        if self.entity_cache_size <= 0:
+            return
+
+        value = self._copy_entity(value)
+        with self._entity_cache_lock:
+            self._entity_cache[cache_key] = value
+            self._entity_cache.move_to_end(cache_key)
+            while len(self._entity_cache) > self.entity_cache_size:
+                self._entity_cache.popitem(last=False)
+
+    @staticmethod
+    def _to_entity_key_batches(
+        entity_keys: Sequence[EntityKey], batch_size: int
+    ) -> list[Sequence[EntityKey]]:
+        """Split entity keys into batches of at most batch_size keys."""
+        if batch_size < 1:
+            raise ValueError(f"Batch size must be positive: {batch_size}")
+
+        return [
+            entity_keys[i : i + batch_size]
+            for i in range(0, len(entity_keys), batch_size)
+        ]
+
+    @staticmethod
+    def _add_entities_by_key(
+        entities_by_key: dict[str, Entity], entities: Iterable[Entity]
+    ) -> None:
+        """Index fetched entities by lowercase key."""
+        for entity in entities:
+            if entity.key is not None:
+                entities_by_key[entity.key.lower()] = entity
+
+    @staticmethod
+    def _to_entity_key_query(entity_key: EntityKey) -> str:
+        """Build a query matching the provided entity key."""
+        return f"$key = {entity_key}"
+
+    @staticmethod
+    def _to_entity_keys_query(entity_keys: Sequence[EntityKey]) -> str:
+        """Build a query matching any of the provided entity keys."""
+        to_query = ArkivModuleBase._to_entity_key_query
+        return " OR ".join(to_query(entity_key) for entity_key in entity_keys)
+
+    @staticmethod
+    def _to_ordered_entities(
+        entity_keys: Sequence[EntityKey], entities: dict[str, Entity]
+    ) -> list[Entity]:
+        """Order fetched entities (by lowercase key) like the requested keys."""
+        result: list[Entity] = []
+        for entity_key in entity_keys:
+            entity = entities.get(entity_key.lower())
+            if entity is None:
+                raise ValueError(f"Entity not found: {entity_key}")
+            result.append(entity)
+        return result
+
+    @staticmethod
+    def _to_entity_exists_rpc_options(at_block: int | None) -> dict[str, Any]:
+        """Build RPC query options for an existence check (no data, single result)."""
+        return to_rpc_query_options(
+            QueryOptions(attributes=NONE, at_block=at_block, max_results_per_page=1)
+        )
+
+    def _to_entity_if_exists(
+        self,
+        entity_key: EntityKey,
+        fields: int,
+        at_block: int | None,
+        query_result: QueryPage,
+    ) -> Entity | None:
+        """Get the entity of a key query result, caching it for a fixed block."""
+        if len(query_result.entities) > 1:
+            raise ValueError(f"Expected 1 entity, got {len(query_result.entities)}")
+
+        entity = query_result.entities[0] if query_result.entities else None
+        if at_block is not None:
+            self._set_cached(("exists", entity_key.lower(), at_block), bool(entity))
+            if entity is not None:
+                self._set_cached(
+                    self._entity_cache_key(entity_key, fields, at_block), entity
+                )
+        return entity
+
+    @staticmethod
+    def _has_query_data(rpc_query_response: Any) -> bool:
+        """Check if a raw RPC query response contains any entity."""
+        return bool(rpc_query_response and rpc_query_response.get("data"))
+
     def _check_has_account(self) -> None:
         """
         Check if client has a default account configured.
 
+        Protected helper, also used by TxPipeline before sending transactions.
+
         Raises:
             ValueError: If no default account is set on the client
 
@@ -521,12 +1133,12 @@ class ArkivModuleBase(Generic[ClientT]):
             This check is performed before sending transactions to ensure
             the client has proper credentials to sign transactions.
         """
-        # Access eth.default_account through type-ignored attribute access
+        # Access eth.default_account through the untyped eth reference
         # since we know both Arkiv and AsyncArkiv have this via Web3/AsyncWeb3
-        default_account = getattr(self.client.eth, "default_account", None)  # type: ignore[attr-defined]
+        default_account = getattr(self._eth, "default_account", None)
 
         # Log account information
-        logger.debug(f"Default account: {default_account}")
+        logger.debug("Default account: %s", default_account)
 
         # Check if account is None or Empty (web3.py's Empty object evaluates to False)
         # We use 'not default_account' which works for both None and Empty
@@ -539,7 +1151,10 @@ class ArkivModuleBase(Generic[ClientT]):
     def _check_tx_and_get_receipt(
         self, tx_hash: TxHash, tx_receipt: TxReceipt
     ) -> TransactionReceipt:
-        """Check transaction status and return Arkiv transaction receipt."""
+        """Check transaction status and return Arkiv transaction receipt.
+
+        Protected helper, also used by TxPipeline to confirm pipelined transactions.
+        """
         tx_status: int = tx_receipt["status"]
         if tx_status != TX_SUCCESS:
             raise RuntimeError(f"Transaction failed with status {tx_status}")
@@ -547,5 +1162,5 @@ class ArkivModuleBase(Generic[ClientT]):
         # Parse and return receipt
         receipt: TransactionReceipt = to_receipt(self.contract, tx_hash, tx_receipt)
 
-        logger.debug(f"Arkiv receipt: {receipt}")
+        logger.debug("Arkiv receipt: %s", receipt)
         return receipt
@@ -270,7 +270,7 @@ class ArkivNode:
         from testcontainers.core.container import DockerContainer
         from testcontainers.core.wait_strategies import HttpWaitStrategy
 
-        logger.info(f"Starting Arkiv node from image: {self._image}")
+        logger.info("Starting Arkiv node from image: %s", self._image)
 
         # Create container
         container = (
@@ -288,7 +288,7 @@ class ArkivNode:
         self._http_url = f"http://{host}:{container.get_exposed_port(self._http_port)}"
         self._ws_url = f"ws://{host}:{container.get_exposed_port(self._ws_port)}"
 
-        logger.info(f"Arkiv node endpoints: {self._http_url} | {self._ws_url}")
+        logger.info("Arkiv node endpoints: %s | %s", self._http_url, self._ws_url)
 
         # Wait for services to be ready
         container.waiting_for(HttpWaitStrategy(self._http_port).for_status_code(200))
@@ -367,7 +367,7 @@ class ArkivNode:
             msg = f"Failed to import account: {output.decode()}"
             raise RuntimeError(msg)
 
-        logger.info(f"Imported account {account.name} ({address})")
+        logger.info("Imported account %s (%s)", account.name, address)
 
         # Fund the account
         exit_code, output = self.container.exec(["golembase", "account", "fund"])
@@ -375,7 +375,7 @@ class ArkivNode:
             msg = f"Failed to fund account: {output.decode()}"
             raise RuntimeError(msg)
 
-        logger.info(f"Funded account {address}")
+        logger.info("Funded account %s", address)
 
         # Check and log the balance
         exit_code, output = self.container.exec(
@@ -383,9 +383,9 @@ class ArkivNode:
         )
         if exit_code == 0:
             balance = output.decode().strip()
-            logger.info(f"Account {address} balance: {balance}")
+            logger.info("Account %s balance: %s", address, balance)
         else:
-            logger.warning(f"Could not verify balance for {address}")
+            logger.warning("Could not verify balance for %s", address)
 
     def _get_command(self) -> str:
         """
@@ -436,10 +436,10 @@ class ArkivNode:
         for attempt in range(timeout):
             try:
                 if asyncio.run(check_connection()):
-                    logger.info(f"WebSocket ready (attempt {attempt + 1})")
+                    logger.info("WebSocket ready (attempt %d)", attempt + 1)
                     return
             except Exception as e:
-                logger.debug(f"WebSocket check attempt {attempt + 1} failed: {e}")
+                logger.debug("WebSocket check attempt %d failed: %s", attempt + 1, e)
 
             time.sleep(1)
 
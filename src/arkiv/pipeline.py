@@ -0,0 +1,196 @@
+"""Pipelined submission of independent transactions.
+
+A transaction pipeline assigns nonces client-side so that several independent
+transactions from the same account can be submitted back-to-back without
+waiting for each one to be mined. All transactions are then confirmed together,
+typically within a single block instead of one block per transaction.
+
+Example:
+    >>> with client.arkiv.pipeline() as pipeline:
+    ...     for key in entity_keys:
+    ...         pipeline.send_operations(
+    ...             Operations(extensions=[ExtendOp(key=key, extend_by=3600)])
+    ...         )
+    >>> # All transactions sent, then confirmed on exit
+    >>> receipts = pipeline.receipts
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from typing import TYPE_CHECKING, Literal
+
+from eth_typing import HexStr
+from hexbytes import HexBytes
+from web3.types import Nonce, TxParams, TxReceipt, Wei
+
+from .module_base import TX_SUCCESS
+from .types import Operations, TransactionReceipt, TxHash
+from .utils import to_tx_params
+
+if TYPE_CHECKING:
+    from .module import ArkivModule
+
+logger = logging.getLogger(__name__)
+
+# Fee fields, pipeline fee defaults only apply to transactions setting none of them
+FEE_FIELDS = frozenset({"gasPrice", "maxFeePerGas", "maxPriorityFeePerGas"})
+
+
+class TxPipeline:
+    """Submits independent transactions with client-side nonce management.
+
+    The pending nonce of the client's default account is fetched once, on the
+    first send. Every following transaction gets the next nonce, so transactions
+    are fired without waiting for confirmations. Call wait() (or leave the
+    context manager) to wait for all receipts.
+
+    Usage:
+        >>> with client.arkiv.pipeline() as pipeline:
+        ...     pipeline.send_operations(operations_1)
+        ...     pipeline.send_operations(operations_2)
+        >>> receipts = pipeline.receipts
+
+        >>> # Or without context manager
+        >>> pipeline = client.arkiv.pipeline()
+        >>> pipeline.send({"to": address, "value": 42, "gas": 21000})
+        >>> tx_receipts = pipeline.wait()
+    """
+
+    def __init__(self, module: ArkivModule) -> None:
+        """Initialize pipeline with module reference.
+
+        Args:
+            module: ArkivModule instance used to send and confirm transactions.
+        """
+        self._module = module
+        self._eth = module.client.eth
+        self._nonce: int | None = None
+        self._fee_params: TxParams = {}
+        self._pending: deque[tuple[HexBytes, TxHash, bool]] = deque()
+        self._tx_hashes: list[TxHash] = []
+        self._receipts: list[TransactionReceipt] = []
+
+    @property
+    def tx_hashes(self) -> list[TxHash]:
+        """Get hashes of all transactions sent through this pipeline."""
+        return list(self._tx_hashes)
+
+    @property
+    def receipts(self) -> list[TransactionReceipt]:
+        """Get Arkiv receipts of confirmed operation transactions (after wait)."""
+        return list(self._receipts)
+
+    def send(self, tx_params: TxParams) -> TxHash:
+        """Send a transaction with the next pipeline nonce, without waiting.
+
+        Args:
+            tx_params: Transaction parameters. Any provided nonce is replaced.
+
+        Returns:
+            Transaction hash of the sent transaction.
+        """
+        self._module._check_has_account()
+        return self._send(tx_params, is_arkiv_tx=False)
+
+    def send_operations(
+        self, operations: Operations, tx_params: TxParams | None = None
+    ) -> TxHash:
+        """Send Arkiv operations with the next pipeline nonce, without waiting.
+
+        Args:
+            operations: Operations to include in the transaction.
+            tx_params: Optional additional transaction parameters.
+
+        Returns:
+            Transaction hash of the sent transaction.
+        """
+        self._module._check_has_account()
+        return self._send(to_tx_params(operations, tx_params), is_arkiv_tx=True)
+
+    def wait(self) -> list[TxReceipt]:
+        """Wait for all pending transactions to be confirmed.
+
+        Transactions are confirmed in submission order. Arkiv operation
+        transactions are also converted to Arkiv receipts (see receipts).
+        A transaction stays pending until its receipt is available, so wait()
+        can be called again after an error to confirm the remaining ones.
+
+        Returns:
+            Raw transaction receipts of the transactions waited for.
+
+        Raises:
+            RuntimeError: If any transaction failed.
+            TimeExhausted: If a receipt is not available within the timeout.
+        """
+        eth = self._eth
+        tx_receipts: list[TxReceipt] = []
+        while self._pending:
+            tx_hash_bytes, tx_hash, is_arkiv_tx = self._pending[0]
+            tx_receipt: TxReceipt = eth.wait_for_transaction_receipt(
+                tx_hash_bytes,
+                timeout=self._module.receipt_timeout,
+                poll_latency=self._module.receipt_poll_latency,
+            )
+            # Mined, a failed transaction must not hold back the remaining ones
+            self._pending.popleft()
+            if is_arkiv_tx:
+                self._receipts.append(
+                    self._module._check_tx_and_get_receipt(tx_hash, tx_receipt)
+                )
+            elif tx_receipt["status"] != TX_SUCCESS:
+                raise RuntimeError(
+                    f"Transaction failed with status {tx_receipt['status']}"
+                )
+            tx_receipts.append(tx_receipt)
+
+        logger.info("Pipeline confirmed %d transaction(s)", len(tx_receipts))
+        return tx_receipts
+
+    def _send(self, tx_params: TxParams, is_arkiv_tx: bool) -> TxHash:
+        eth = self._eth
+        if self._nonce is None:
+            self._nonce = eth.get_transaction_count(eth.default_account, "pending")
+            self._fee_params = self._get_fee_params()
+
+        params: TxParams = {**tx_params, "nonce": Nonce(self._nonce)}
+        if not FEE_FIELDS.intersection(params):
+            params |= self._fee_params
+        tx_hash_bytes = eth.send_transaction(params)
+        self._nonce += 1
+
+        tx_hash = TxHash(HexStr(tx_hash_bytes.to_0x_hex()))
+        self._pending.append((tx_hash_bytes, tx_hash, is_arkiv_tx))
+        self._tx_hashes.append(tx_hash)
+        return tx_hash
+
+    def _get_fee_params(self) -> TxParams:
+        """Resolve chain id and EIP-1559 fees once for all pipeline transactions.
+
+        Otherwise the signing middleware fetches them again for every transaction.
+        Uses the same max fee formula as web3.py (priority fee + 2 * base fee).
+        """
+        eth = self._eth
+        fee_params: TxParams = {"chainId": eth.chain_id}
+        base_fee = eth.get_block("latest").get("baseFeePerGas")
+        if base_fee is not None:
+            priority_fee = eth.max_priority_fee
+            fee_params["maxPriorityFeePerGas"] = priority_fee
+            fee_params["maxFeePerGas"] = Wei(priority_fee + 2 * base_fee)
+        return fee_params
+
+    def __enter__(self) -> TxPipeline:
+        """Enter context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object,
+    ) -> Literal[False]:
+        """Exit context manager, waiting for all sent transactions on success."""
+        if exc_type is None and self._pending:
+            self.wait()
+        return False
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from collections.abc import Iterator
+from concurrent.futures import Future
+from dataclasses import replace
 from typing import TYPE_CHECKING
 
 from .types import Entity, QueryOptions, QueryPage
@@ -41,9 +44,18 @@ class QueryIterator:
         - The iterator maintains consistency by pinning to a specific block
         - Once exhausted, the iterator cannot be reused (create a new one)
         - All pages are fetched from the same blockchain state (block_number)
+        - With prefetch enabled, the next page is fetched in a background
+          thread (shared by all iterators of the client) while the current
+          page is consumed
     """
 
-    def __init__(self, client: Arkiv, query: str, options: QueryOptions):
+    def __init__(
+        self,
+        client: Arkiv,
+        query: str,
+        options: QueryOptions,
+        prefetch: bool = False,
+    ):
         """
         Initialize the query iterator.
 
@@ -51,6 +63,7 @@ class QueryIterator:
             client: Arkiv client instance for making queries
             query: SQL-like query string
             options: Query options including pagination and limits
+            prefetch: Fetch the next page in the background (default: False)
         """
         self._client = client
         self._query = query
@@ -59,6 +72,8 @@ class QueryIterator:
         self._current_index = 0
         self._exhausted = False
         self._total_yielded = 0
+        self._prefetch = prefetch
+        self._next_result: Future[QueryPage] | None = None
 
     def __iter__(self) -> Iterator[Entity]:
         """Return the iterator instance."""
@@ -82,11 +97,14 @@ class QueryIterator:
         # Lazy initialization - fetch first page on first next()
         if self._current_result is None:
             logger.info(
-                f"Fetching first page for query: {self._query}, options: {self._options}"
+                "Fetching first page for query: %s, options: %s",
+                self._query,
+                self._options,
             )
             self._current_result = self._client.arkiv.query_entities_page(
                 self._query, options=self._options
             )
+            self._prefetch_next_page()
 
         # Yield from current page
         while self._current_index < len(self._current_result.entities):
@@ -105,20 +123,13 @@ class QueryIterator:
             if max_results is not None and self._total_yielded >= max_results:
                 raise StopIteration
 
-            from dataclasses import replace
-
-            options = replace(
-                self._options,
-                at_block=self._current_result.block_number,
-                cursor=self._current_result.cursor,
-            )
-            logger.info(
-                f"Fetching next page for query: {self._query}, options: {options}"
-            )
-            self._current_result = self._client.arkiv.query_entities_page(
-                query=self._query, options=options
-            )
+            if self._next_result is not None:
+                next_result, self._next_result = self._next_result, None
+                self._current_result = next_result.result()
+            else:
+                self._current_result = self._fetch_next_page(self._current_result)
             self._current_index = 0
+            self._prefetch_next_page()
 
             # Check if next page has entities
             if len(self._current_result.entities) == 0:
@@ -131,6 +142,36 @@ class QueryIterator:
         # No more entities
         raise StopIteration
 
+    def _fetch_next_page(self, result: QueryPage) -> QueryPage:
+        """Fetch the page following the given one, pinned to its block."""
+        options = replace(
+            self._options,
+            at_block=result.block_number,
+            cursor=result.cursor,
+        )
+        logger.info(
+            "Fetching next page for query: %s, options: %s", self._query, options
+        )
+        return self._client.arkiv.query_entities_page(
+            query=self._query, options=options
+        )
+
+    def _prefetch_next_page(self) -> None:
+        """Start fetching the next page in the background, if it will be needed."""
+        result = self._current_result
+        if not self._prefetch or result is None or not result.has_more():
+            return
+
+        # Skip prefetch if max_results is reached within the current page
+        max_results = self._options.max_results
+        remaining = len(result.entities) - self._current_index
+        if max_results is not None and self._total_yielded + remaining >= max_results:
+            return
+
+        self._next_result = self._client.arkiv.prefetch_executor.submit(
+            self._fetch_next_page, result
+        )
+
     @property
     def block_number(self) -> int | None:
         """
@@ -172,9 +213,18 @@ class AsyncQueryIterator:
         - The iterator maintains consistency by pinning to a specific block
         - Once exhausted, the iterator cannot be reused (create a new one)
         - All pages are fetched from the same blockchain state (block_number)
+        - With prefetch enabled, the next page is fetched in a background
+          task while the current page is consumed. Call aclose() (e.g. via
+          contextlib.aclosing) when stopping early to cancel that task
     """
 
-    def __init__(self, client: AsyncArkiv, query: str, options: QueryOptions):
+    def __init__(
+        self,
+        client: AsyncArkiv,
+        query: str,
+        options: QueryOptions,
+        prefetch: bool = False,
+    ):
         """
         Initialize the query iterator.
 
@@ -182,6 +232,7 @@ class AsyncQueryIterator:
             client: Arkiv client instance for making queries
             query: SQL-like query string
             options: Query options including pagination and limits
+            prefetch: Fetch the next page in the background (default: False)
         """
         self._client = client
         self._query = query
@@ -190,6 +241,9 @@ class AsyncQueryIterator:
         self._current_index = 0
         self._exhausted = False
         self._total_yielded = 0
+        self._prefetch = prefetch
+        self._next_result: asyncio.Task[QueryPage] | None = None
+        self._closed = False
 
     def __aiter__(self) -> AsyncQueryIterator:
         """Return the async iterator instance."""
@@ -205,6 +259,9 @@ class AsyncQueryIterator:
         Raises:
             StopAsyncIteration: When all entities have been consumed or limit reached
         """
+        if self._closed:
+            raise StopAsyncIteration
+
         # Check if we've hit the max_results limit
         max_results = self._options.max_results
         if max_results is not None and self._total_yielded >= max_results:
@@ -213,11 +270,14 @@ class AsyncQueryIterator:
         # Lazy initialization - fetch first page on first next()
         if self._current_result is None:
             logger.info(
-                f"Fetching first page for query: {self._query}, options: {self._options}"
+                "Fetching first page for query: %s, options: %s",
+                self._query,
+                self._options,
             )
             self._current_result = await self._client.arkiv.query_entities_page(
                 self._query, options=self._options
             )
+            self._prefetch_next_page()
 
         # Yield from current page
         while self._current_index < len(self._current_result.entities):
@@ -236,20 +296,13 @@ class AsyncQueryIterator:
             if max_results is not None and self._total_yielded >= max_results:
                 raise StopAsyncIteration
 
-            from dataclasses import replace
-
-            options = replace(
-                self._options,
-                at_block=self._current_result.block_number,
-                cursor=self._current_result.cursor,
-            )
-            logger.info(
-                f"Fetching next page for query: {self._query}, options: {options}"
-            )
-            self._current_result = await self._client.arkiv.query_entities_page(
-                query=self._query, options=options
-            )
+            if self._next_result is not None:
+                next_result, self._next_result = self._next_result, None
+                self._current_result = await next_result
+            else:
+                self._current_result = await self._fetch_next_page(self._current_result)
             self._current_index = 0
+            self._prefetch_next_page()
 
             # Check if next page has entities
             if len(self._current_result.entities) == 0:
@@ -262,6 +315,55 @@ class AsyncQueryIterator:
         # No more entities
         raise StopAsyncIteration
 
+    async def _fetch_next_page(self, result: QueryPage) -> QueryPage:
+        """Fetch the page following the given one, pinned to its block."""
+        options = replace(
+            self._options,
+            at_block=result.block_number,
+            cursor=result.cursor,
+        )
+        logger.info(
+            "Fetching next page for query: %s, options: %s", self._query, options
+        )
+        return await self._client.arkiv.query_entities_page(
+            query=self._query, options=options
+        )
+
+    def _prefetch_next_page(self) -> None:
+        """Start fetching the next page in a background task, if it will be needed."""
+        result = self._current_result
+        if not self._prefetch or result is None or not result.has_more():
+            return
+
+        # Skip prefetch if max_results is reached within the current page
+        max_results = self._options.max_results
+        remaining = len(result.entities) - self._current_index
+        if max_results is not None and self._total_yielded + remaining >= max_results:
+            return
+
+        task = asyncio.create_task(self._fetch_next_page(result))
+        task.add_done_callback(self._retrieve_prefetch_exception)
+        self._next_result = task
+
+    @staticmethod
+    def _retrieve_prefetch_exception(task: asyncio.Task[QueryPage]) -> None:
+        """Mark a prefetch error as retrieved, it is re-raised if the page is awaited."""
+        if not task.cancelled():
+            task.exception()
+
+    async def aclose(self) -> None:
+        """
+        Stop iterating and cancel the prefetch of the next page, if any.
+
+        Further iteration raises StopAsyncIteration.
+        """
+        self._closed = True
+        next_result, self._next_result = self._next_result, None
+        if next_result is not None and not next_result.done():
+            next_result.cancel()
+            # Wait for the cancellation without raising its CancelledError
+            await asyncio.wait([next_result])
+
     @property
     def block_number(self) -> int | None:
         """
@@ -104,7 +104,7 @@ EntityKey = NewType("EntityKey", HexStr)
 Attributes = NewType("Attributes", dict[str, str | int])
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Entity:
     """A class representing an entity.
 
@@ -203,6 +203,24 @@ class QueryPage:
 
 
 @dataclass(frozen=True)
+class EntityCacheInfo:
+    """
+    Statistics of the client side entity read cache.
+
+    Attributes:
+        hits: Number of reads answered from the cache.
+        misses: Number of cacheable reads that required an RPC call.
+        max_size: Maximum number of cached results (0 disables the cache).
+        size: Current number of cached results.
+    """
+
+    hits: int
+    misses: int
+    max_size: int
+    size: int
+
+
+@dataclass(frozen=True, slots=True)
 class CreateOp:
     """Class to represent a create operation."""
 
@@ -212,7 +230,7 @@ class CreateOp:
     expires_in: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UpdateOp:
     """Class to represent an update operation."""
 
@@ -223,14 +241,14 @@ class UpdateOp:
     expires_in: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeleteOp:
     """Class to represent a delete operation."""
 
     key: EntityKey
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExtendOp:
     """Class to represent a entity lifetime extend operation."""
 
@@ -238,7 +256,7 @@ class ExtendOp:
     extend_by: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChangeOwnerOp:
     """Class to represent a change owner operation."""
 
@@ -246,7 +264,7 @@ class ChangeOwnerOp:
     new_owner: ChecksumAddress
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Operations:
     """
     Class to represent a transaction operations.
@@ -270,11 +288,12 @@ class Operations:
         change_owners: Sequence[ChangeOwnerOp] | None = None,
     ):
         """Initialise the GolemBaseTransaction instance."""
-        object.__setattr__(self, "creates", creates or [])
-        object.__setattr__(self, "updates", updates or [])
-        object.__setattr__(self, "deletes", deletes or [])
-        object.__setattr__(self, "extensions", extensions or [])
-        object.__setattr__(self, "change_owners", change_owners or [])
+        # Unused operation kinds share the empty tuple instead of a new list
+        object.__setattr__(self, "creates", creates or ())
+        object.__setattr__(self, "updates", updates or ())
+        object.__setattr__(self, "deletes", deletes or ())
+        object.__setattr__(self, "extensions", extensions or ())
+        object.__setattr__(self, "change_owners", change_owners or ())
         if not (
             self.creates
             or self.updates
@@ -291,21 +310,21 @@ class Operations:
     change_owners: Sequence[ChangeOwnerOp]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EntityEvent:
     """Base class for events emitted when an entity is modified."""
 
     key: EntityKey
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EntityOwnerEvent(EntityEvent):
     """Base class for events emitted when an entity is modified."""
 
     owner_address: ChecksumAddress
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreateEvent(EntityOwnerEvent):
     """Event emitted when an entity is created."""
 
@@ -313,7 +332,7 @@ class CreateEvent(EntityOwnerEvent):
     cost: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UpdateEvent(EntityOwnerEvent):
     """Event emitted when an entity is updated."""
 
@@ -322,21 +341,21 @@ class UpdateEvent(EntityOwnerEvent):
     cost: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExpiryEvent(EntityOwnerEvent):
     """Event emitted when an entity is expired."""
 
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeleteEvent(EntityOwnerEvent):
     """Event emitted when an entity is deleted."""
 
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExtendEvent(EntityOwnerEvent):
     """Event emitted when an entity's lifetime is extended."""
 
@@ -345,7 +364,7 @@ class ExtendEvent(EntityOwnerEvent):
     cost: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChangeOwnerEvent(EntityEvent):
     """Event emitted when an entity's owner is changed."""
 
@@ -353,7 +372,7 @@ class ChangeOwnerEvent(EntityEvent):
     new_owner_address: ChecksumAddress
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreateEventLegacy(EntityEvent):
     """Event emitted when an entity is created (legacy)."""
 
@@ -361,7 +380,7 @@ class CreateEventLegacy(EntityEvent):
     cost: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TransactionReceipt:
     """Receipt of a transaction containing all emitted events."""
 
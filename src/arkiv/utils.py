@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import binascii
+import functools
 import logging
-from typing import Any
+import weakref
+from collections.abc import Sequence
+from typing import Any, Final, cast
 
 import brotli  # type: ignore[import-untyped]
 import rlp  # type: ignore[import-untyped]
@@ -12,7 +16,16 @@ from hexbytes import HexBytes
 from web3 import Web3
 from web3.contract import Contract
 from web3.contract.base_contract import BaseContractEvent
-from web3.types import EventData, LogReceipt, TxParams, TxReceipt
+from web3.providers import JSONBaseProvider
+from web3.types import (
+    EventData,
+    LogReceipt,
+    RPCEndpoint,
+    RPCResponse,
+    TxParams,
+    TxReceipt,
+    Wei,
+)
 
 from . import contract
 from .contract import (
@@ -40,6 +53,7 @@ from .types import (
     OP_INDEX_IN_TX,
     OWNER,
     PAYLOAD,
+    QUERY_OPTIONS_DEFAULT,
     STR,
     TX_INDEX_IN_BLOCK,
     Attributes,
@@ -67,6 +81,17 @@ from .types import (
 
 logger = logging.getLogger(__name__)
 
+# Transaction fields that are identical for every Arkiv storage transaction
+TX_PROTOTYPE: Final[TxParams] = {
+    "to": ARKIV_ADDRESS,
+    "value": Wei(0),
+}
+
+# Contract events by topic, per contract (get_event_by_topic rebuilds all events)
+_EVENTS_BY_TOPIC: weakref.WeakKeyDictionary[Contract, dict[str, BaseContractEvent]] = (
+    weakref.WeakKeyDictionary()
+)
+
 
 def to_seconds(
     seconds: int = 0, minutes: int = 0, hours: int = 0, days: int = 0
@@ -121,7 +146,7 @@ def to_entity_key(entity_key_int: int) -> EntityKey:
 
 
 def entity_key_to_bytes(entity_key: EntityKey) -> bytes:
-    return bytes.fromhex(entity_key[2:])  # Strip '0x' prefix and convert to bytes
+    return binascii.a2b_hex(entity_key[2:])  # Strip '0x' prefix and convert to bytes
 
 
 def to_create_op(
@@ -167,6 +192,10 @@ def check_and_set_entity_op_defaults(
     expires_in: int | None,
 ) -> tuple[bytes, str, Attributes, int]:
     """Check and set defaults for entity management arguments."""
+    # Fast path: all arguments provided, nothing to default
+    if payload and content_type and attributes and expires_in is not None:
+        return payload, content_type, attributes, expires_in
+
     if expires_in is None:
         raise ValueError("expires_in must be provided")
 
@@ -191,7 +220,7 @@ def check_entity_key(entity_key: Any | None, label: str | None = None) -> None:
     if label:
         prefix = f"{label}: "
 
-    logger.info(f"{prefix}Checking entity key {entity_key}")
+    logger.info("%sChecking entity key %s", prefix, entity_key)
 
     if entity_key is None:
         raise EntityKeyException("Entity key should not be None")
@@ -243,21 +272,21 @@ def to_tx_params(
         TxParams ready for Web3.py transaction sending to Arkiv storage contract
 
     Note: 'to', 'value', and 'data' from tx_params will be overridden.
+    The provided tx_params are not modified.
     """
-    if not tx_params:
-        tx_params = {}
+    # Start from a copy of the user params and overlay the static Arkiv fields
+    merged: TxParams = {**tx_params} if tx_params else {}
+    merged |= TX_PROTOTYPE
+    merged["data"] = encode_operations_data(operations)
 
-    # Merge provided tx_params with encoded transaction data
-    data = rlp_encode_transaction(operations)
-    data_compressed = brotli.compress(data)
+    return merged
 
-    tx_params |= {
-        "to": ARKIV_ADDRESS,
-        "value": Web3.to_wei(0, "ether"),
-        "data": data_compressed,
-    }
 
-    return tx_params
+def encode_operations_data(operations: Operations) -> bytes:
+    """Encode operations into the (compressed) calldata for the Arkiv contract."""
+    data = rlp_encode_transaction(operations)
+    data_compressed: bytes = brotli.compress(data)
+    return data_compressed
 
 
 def to_query_options(
@@ -280,7 +309,10 @@ def to_query_options(
     """
 
     logger.info(
-        f"max_results_per_page={max_results_per_page}, at_block={at_block}, cursor={cursor}"
+        "max_results_per_page=%s, at_block=%s, cursor=%s",
+        max_results_per_page,
+        at_block,
+        cursor,
     )
 
     # Validations
@@ -306,6 +338,26 @@ def to_query_options(
     )
 
 
+@functools.lru_cache(maxsize=64)
+def to_rpc_include_data(fields: int) -> dict[str, bool]:
+    """Convert a fields bitmask to the RPC includeData flags.
+
+    Results are cached per bitmask, callers must not modify the returned dict.
+    """
+    return {
+        "key": fields & KEY != 0,
+        "attributes": fields & ATTRIBUTES != 0,
+        "payload": fields & PAYLOAD != 0,
+        "contentType": fields & CONTENT_TYPE != 0,
+        "expiration": fields & EXPIRATION != 0,
+        "owner": fields & OWNER != 0,
+        "createdAtBlock": fields & CREATED_AT != 0,
+        "lastModifiedAtBlock": fields & LAST_MODIFIED_AT != 0,
+        "transactionIndexInBlock": fields & TX_INDEX_IN_BLOCK != 0,
+        "operationIndexInTransaction": fields & OP_INDEX_IN_TX != 0,
+    }
+
+
 def to_rpc_query_options(
     options: QueryOptions | None = None,
 ) -> dict[str, Any]:
@@ -318,27 +370,23 @@ def to_rpc_query_options(
     Returns:
         Dictionary representation of the query options
     """
-    if not options:
-        options = QueryOptions()
+    if options is None or options is QUERY_OPTIONS_DEFAULT:
+        # Default options are frozen, copy the precomputed conversion
+        return {
+            **_RPC_QUERY_OPTIONS_DEFAULT,
+            "includeData": dict(_RPC_QUERY_OPTIONS_DEFAULT["includeData"]),
+        }
+    return _to_rpc_query_options(options)
+
 
+def _to_rpc_query_options(options: QueryOptions) -> dict[str, Any]:
     # see https://github.com/Arkiv-Network/arkiv-op-geth/blob/main/eth/api_arkiv.go
     rpc_query_options: dict[str, Any] = {
-        "includeData": {
-            "key": options.attributes & KEY != 0,
-            "attributes": options.attributes & ATTRIBUTES != 0,
-            "payload": options.attributes & PAYLOAD != 0,
-            "contentType": options.attributes & CONTENT_TYPE != 0,
-            "expiration": options.attributes & EXPIRATION != 0,
-            "owner": options.attributes & OWNER != 0,
-            "createdAtBlock": options.attributes & CREATED_AT != 0,
-            "lastModifiedAtBlock": options.attributes & LAST_MODIFIED_AT != 0,
-            "transactionIndexInBlock": options.attributes & TX_INDEX_IN_BLOCK != 0,
-            "operationIndexInTransaction": options.attributes & OP_INDEX_IN_TX != 0,
-        }
+        "includeData": dict(to_rpc_include_data(options.attributes))
     }
 
     if options.at_block is not None:
-        rpc_query_options["atBlock"] = Web3.to_hex(options.at_block)
+        rpc_query_options["atBlock"] = hex(options.at_block)
     else:
         rpc_query_options["atBlock"] = None
 
@@ -349,7 +397,7 @@ def to_rpc_query_options(
         effective_page_size = min(effective_page_size, options.max_results)
 
     if effective_page_size is not None:
-        rpc_query_options["resultsPerPage"] = Web3.to_hex(effective_page_size)
+        rpc_query_options["resultsPerPage"] = hex(effective_page_size)
 
     if options.cursor is not None:
         rpc_query_options["cursor"] = options.cursor
@@ -367,10 +415,58 @@ def to_rpc_query_options(
     return rpc_query_options
 
 
+_RPC_QUERY_OPTIONS_DEFAULT: Final = _to_rpc_query_options(QUERY_OPTIONS_DEFAULT)
+
+
+def to_created_entity(
+    create_op: CreateOp,
+    create_event: CreateEvent,
+    block_number: int,
+    operation_index: int = 0,
+) -> Entity:
+    """Build the entity created by a create operation from its receipt event.
+
+    The transaction index in the block is not part of the receipt event, so
+    TX_INDEX_IN_BLOCK is not populated.
+    """
+    return Entity(
+        key=create_event.key,
+        fields=ALL & ~TX_INDEX_IN_BLOCK,
+        owner=create_event.owner_address,
+        created_at_block=block_number,
+        last_modified_at_block=block_number,
+        expires_at_block=create_event.expiration_block,
+        operation_index=operation_index,
+        payload=create_op.payload,
+        content_type=create_op.content_type,
+        attributes=Attributes(dict(create_op.attributes)),
+    )
+
+
+def to_checksum_address(address: str) -> ChecksumAddress:
+    """Convert an address to its EIP-55 checksum form.
+
+    Checksumming hashes the address (~60us), results are cached per address
+    as query results typically contain few distinct owners. Addresses are
+    lowercased first so differently cased inputs share a cache entry.
+    """
+    return _to_checksum_address(address.lower())
+
+
+@functools.lru_cache(maxsize=4096)
+def _to_checksum_address(address: str) -> ChecksumAddress:
+    return Web3.to_checksum_address(address)
+
+
+# Default of getattr() to tell absent response item fields from null ones
+_MISSING: Any = object()
+
+
 def to_entity(fields: int, response_item: dict[str, Any]) -> Entity:
     """Convert a low-level RPC query response to a high-level Entity."""
 
-    logger.debug(f"Item: {response_item}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Item: %s", response_item)
 
     # Set defaults
     entity_key: EntityKey | None = None
@@ -384,22 +480,28 @@ def to_entity(fields: int, response_item: dict[str, Any]) -> Entity:
     content_type: str | None = None
     attributes: Attributes | None = None
 
+    # Response items are AttributeDicts: a single getattr() with a sentinel
+    # default replaces the hasattr() + attribute access pair for each field.
+    # Only absent fields count as missing, present null values pass through.
     # Extract entity key if present
     if fields & KEY != 0:
-        if not hasattr(response_item, "key"):
+        key = getattr(response_item, "key", _MISSING)
+        if key is _MISSING:
             raise ValueError("RPC query response item missing 'key' field")
-        entity_key = EntityKey(response_item.key)
+        entity_key = EntityKey(key)
 
     # Extract owner if present
     if fields & OWNER != 0:
-        if not hasattr(response_item, "owner"):
+        owner_raw = getattr(response_item, "owner", _MISSING)
+        if owner_raw is _MISSING:
             raise ValueError("RPC query response item missing 'owner' field")
-        owner = Web3.to_checksum_address(response_item.owner)
+        owner = to_checksum_address(owner_raw)
 
     # Extract created_at if present
     if fields & CREATED_AT != 0:
-        if hasattr(response_item, "createdAtBlock"):
-            created_at_block = int(response_item.createdAtBlock)
+        created_at_raw = getattr(response_item, "createdAtBlock", _MISSING)
+        if created_at_raw is not _MISSING:
+            created_at_block = int(created_at_raw)
         else:
             # TODO revert to raise pattern once available
             # raise ValueError("RPC query response item missing 'createdAtBlock' field")
@@ -407,64 +509,63 @@ def to_entity(fields: int, response_item: dict[str, Any]) -> Entity:
 
     # Extract last_modified_at if present
     if fields & LAST_MODIFIED_AT != 0:
-        if not hasattr(response_item, "lastModifiedAtBlock"):
+        last_modified_raw = getattr(response_item, "lastModifiedAtBlock", _MISSING)
+        if last_modified_raw is _MISSING:
             raise ValueError(
                 "RPC query response item missing 'lastModifiedAtBlock' field"
             )
-        last_modified_at_block = int(response_item.lastModifiedAtBlock)
+        last_modified_at_block = int(last_modified_raw)
 
     # Extract expiration if present
     if fields & EXPIRATION != 0:
-        if not hasattr(response_item, "expiresAt"):
+        expires_at_raw = getattr(response_item, "expiresAt", _MISSING)
+        if expires_at_raw is _MISSING:
             raise ValueError("RPC query response item missing 'expiresAt' field")
-        expires_at_block = int(response_item.expiresAt)
+        expires_at_block = int(expires_at_raw)
 
     # Extract transaction index if present
     if fields & TX_INDEX_IN_BLOCK != 0:
-        if not hasattr(response_item, "transactionIndexInBlock"):
+        transaction_index_raw = getattr(
+            response_item, "transactionIndexInBlock", _MISSING
+        )
+        if transaction_index_raw is _MISSING:
             raise ValueError(
                 "RPC query response item missing 'transactionIndexInBlock' field"
             )
-        transaction_index = int(response_item.transactionIndexInBlock)
+        transaction_index = int(transaction_index_raw)
 
     # Extract operation index if present
     if fields & OP_INDEX_IN_TX != 0:
-        if not hasattr(response_item, "operationIndexInTransaction"):
+        operation_index_raw = getattr(
+            response_item, "operationIndexInTransaction", _MISSING
+        )
+        if operation_index_raw is _MISSING:
             raise ValueError(
                 "RPC query response item missing 'operationIndexInTransaction' field"
             )
-        operation_index = int(response_item.operationIndexInTransaction)
+        operation_index = int(operation_index_raw)
 
     # Extract payload if present
     if fields & PAYLOAD != 0:
-        if not hasattr(response_item, "value"):
+        value = getattr(response_item, "value", _MISSING)
+        if value is _MISSING:
             payload = b""
         else:
-            payload = bytes.fromhex(
-                response_item.value[2:]
-                if response_item.value.startswith("0x")
-                else response_item.value
-            )
+            # a2b_hex is the C decoder without bytes.fromhex whitespace handling
+            payload = binascii.a2b_hex(value[2:] if value.startswith("0x") else value)
 
     # Extract content type if present
     if fields & CONTENT_TYPE != 0:
-        if not hasattr(response_item, "contentType"):
+        content_type = getattr(response_item, "contentType", _MISSING)
+        if content_type is _MISSING:
             raise ValueError("RPC query response item missing 'contentType' field")
-        content_type = response_item.contentType
 
     # Extract and merge attributes if present
     if fields & ATTRIBUTES != 0:
-        string_attributes = (
-            response_item.stringAttributes
-            if hasattr(response_item, "stringAttributes")
-            else None
+        attributes = merge_attributes(
+            getattr(response_item, "stringAttributes", None),
+            getattr(response_item, "numericAttributes", None),
         )
-        numeric_attributes = (
-            response_item.numericAttributes
-            if hasattr(response_item, "numericAttributes")
-            else None
-        )
-        attributes = merge_attributes(string_attributes, numeric_attributes)
 
     entity = Entity(
         key=entity_key,
@@ -486,7 +587,8 @@ def to_entity(fields: int, response_item: dict[str, Any]) -> Entity:
 def to_query_result(fields: int, rpc_query_response: dict[str, Any]) -> QueryPage:
     """Convert a low-level RPC query response to a high-level QueryResult."""
 
-    logger.info(f"Raw query result(s): {rpc_query_response}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Raw query result(s): %s", rpc_query_response)
     if not rpc_query_response:
         raise ValueError("RPC query response is empty")
 
@@ -518,7 +620,8 @@ def to_query_result(fields: int, rpc_query_response: dict[str, Any]) -> QueryPag
         entities=entities, block_number=int(block_number, 16), cursor=cursor
     )
 
-    logger.debug(f"Query result: {query_result}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Query result: %s", query_result)
     return query_result
 
 
@@ -539,6 +642,30 @@ def to_hex_bytes(tx_hash: TxHash) -> HexBytes:
     return HexBytes(tx_hash)
 
 
+def make_batch_request(
+    w3: Web3, requests: Sequence[tuple[str, Sequence[Any]]]
+) -> list[RPCResponse] | None:
+    """
+    Send a JSON-RPC batch request and return the unformatted responses.
+
+    Unlike w3.batch_requests(), an error response for one request does not raise
+    for the whole batch, callers check each response for an "error" entry.
+
+    Returns:
+        Responses in the order of the requests, or None if the node rejected the
+        batch as a whole (connection errors are raised)
+    """
+    provider = cast(JSONBaseProvider, w3.provider)
+    request_func = provider.batch_request_func(w3, w3.middleware_onion)
+    responses = request_func(
+        [(RPCEndpoint(method), params) for method, params in requests]
+    )
+    if not isinstance(responses, list) or len(responses) != len(requests):
+        logger.warning("Batch request rejected by the node: %s", responses)
+        return None
+    return responses
+
+
 def get_tx_hash(log: LogReceipt) -> TxHash:
     """
     Extract the TxHash from a log receipt.
@@ -569,7 +696,7 @@ def to_event(
     | None
 ):
     """Convert a log receipt to event object."""
-    logger.debug(f"Log: {log}")
+    logger.debug("Log: %s", log)
 
     # Check if this is already processed EventData (has 'event' and 'args' keys)
     # or a raw log that needs processing
@@ -586,7 +713,10 @@ def to_event(
 
     entity_key: EntityKey = to_entity_key(event_args[ENTITY_KEY])
     logger.debug(
-        f"Processing event: {event_name}, entity_key: {entity_key}, owner_address: {event_args.get('ownerAddress')}"
+        "Processing event: %s, entity_key: %s, owner_address: %s",
+        event_name,
+        entity_key,
+        event_args.get("ownerAddress"),
     )
 
     match event_name:
@@ -631,20 +761,20 @@ def to_event(
             )
         # Legacy events - skip with info log
         case contract.CREATED_EVENT_LEGACY:
-            logger.debug(f"Skipping legacy event: {event_name}")
+            logger.debug("Skipping legacy event: %s", event_name)
             return None
         case contract.UPDATED_EVENT_LEGACY:
-            logger.debug(f"Skipping legacy event: {event_name}")
+            logger.debug("Skipping legacy event: %s", event_name)
             return None
         case contract.DELETED_EVENT_LEGACY:
-            logger.debug(f"Skipping legacy event: {event_name}")
+            logger.debug("Skipping legacy event: %s", event_name)
             return None
         case contract.EXTENDED_EVENT_LEGACY:
-            logger.debug(f"Skipping legacy event: {event_name}")
+            logger.debug("Skipping legacy event: %s", event_name)
             return None
         # Unknown events - return None with warning log
         case _:
-            logger.warning(f"Unknown event type: {event_name}")
+            logger.warning("Unknown event type: %s", event_name)
             return None
 
 
@@ -652,7 +782,8 @@ def to_receipt(
     contract_: Contract, tx_hash_: TxHash | HexBytes, tx_receipt: TxReceipt
 ) -> TransactionReceipt:
     """Convert a tx hash and a raw transaction receipt to a typed receipt."""
-    logger.debug(f"Transaction receipt: {tx_receipt}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Transaction receipt: %s", tx_receipt)
 
     # Extract block number
     block_number_raw = tx_receipt.get("blockNumber")
@@ -700,7 +831,7 @@ def to_receipt(
                     if isinstance(event, UpdateEvent):
                         updates.append(event)
                 case contract.EXPIRED_EVENT:
-                    logger.warning(f"Not yet implemented: {event_name}")
+                    logger.warning("Not yet implemented: %s", event_name)
                 case contract.DELETED_EVENT:
                     if isinstance(event, DeleteEvent):
                         deletes.append(event)
@@ -711,16 +842,16 @@ def to_receipt(
                     if isinstance(event, ChangeOwnerEvent):
                         change_owners.append(event)
                 case contract.CREATED_EVENT_LEGACY:
-                    logger.debug(f"Skipping legacy event: {event_name}")
+                    logger.debug("Skipping legacy event: %s", event_name)
                 case contract.UPDATED_EVENT_LEGACY:
-                    logger.debug(f"Skipping legacy event: {event_name}")
+                    logger.debug("Skipping legacy event: %s", event_name)
                 case contract.DELETED_EVENT_LEGACY:
-                    logger.debug(f"Skipping legacy event: {event_name}")
+                    logger.debug("Skipping legacy event: %s", event_name)
                 case contract.EXTENDED_EVENT_LEGACY:
-                    logger.debug(f"Skipping legacy event: {event_name}")
+                    logger.debug("Skipping legacy event: %s", event_name)
                 # Unknown events - skip with warning log
                 case _:
-                    logger.warning(f"Unknown event type: {event_name}")
+                    logger.warning("Unknown event type: %s", event_name)
         except Exception:
             # Skip logs that don't match our contract events
             continue
@@ -730,7 +861,7 @@ def to_receipt(
 
 def get_event_data(contract: Contract, log: LogReceipt) -> EventData:
     """Extract the event data from a log receipt (Web3 standard)."""
-    logger.debug(f"Log: {log}")
+    logger.debug("Log: %s", log)
 
     # Get log topic if present
     topics = log.get("topics", [])
@@ -743,9 +874,9 @@ def get_event_data(contract: Contract, log: LogReceipt) -> EventData:
             topic = topic_value.to_0x_hex()
 
         # Get event data for topic
-        event: BaseContractEvent = contract.get_event_by_topic(topic)
+        event = _get_event_by_topic(contract, topic)
         event_data: EventData = event.process_log(log)
-        logger.debug(f"Event data: {event_data}")
+        logger.debug("Event data: %s", event_data)
 
         return event_data
 
@@ -753,6 +884,20 @@ def get_event_data(contract: Contract, log: LogReceipt) -> EventData:
     raise ValueError("No topic/event data found in log")
 
 
+def _get_event_by_topic(contract: Contract, topic: str) -> BaseContractEvent:
+    """Get the contract event for a topic from a per-contract lookup table."""
+    events = _EVENTS_BY_TOPIC.get(contract)
+    if events is None:
+        events = {event.topic: event for event in contract.all_events()}
+        _EVENTS_BY_TOPIC[contract] = events
+
+    event = events.get(topic)
+    if event is None:
+        # Let web3 resolve (or reject) topics not in the table
+        event = contract.get_event_by_topic(topic)
+    return event
+
+
 def rlp_encode_transaction(tx: Operations) -> bytes:
     """Encode a transaction in RLP."""
 
@@ -823,7 +968,9 @@ def split_attributes(
             else:
                 string_attributes.append((key, value))
 
-    logger.debug(f"Split attributes into {string_attributes} and {numeric_attributes}")
+    logger.debug(
+        "Split attributes into %s and %s", string_attributes, numeric_attributes
+    )
     return string_attributes, numeric_attributes
 
 
@@ -837,31 +984,35 @@ def merge_attributes(
     if string_attributes:
         # example: [AttributeDict({'key': 'type', 'value': 'Greeting'})]
         for element in string_attributes:
-            logger.debug(f"String attribute element: {element}")
+            key = element.key
             # Filter out system attributes
-            if element.key.startswith("$"):
+            if key.startswith("$"):
                 continue
 
-            if isinstance(element.value, str):
-                attributes[element.key] = element.value
+            value = element.value
+            if isinstance(value, str):
+                attributes[key] = value
             else:
                 logger.warning(
-                    f"Unexpected string attribute, expected (str, str) but found: {element}, skipping ..."
+                    "Unexpected string attribute, expected (str, str) but found: %s, skipping ...",
+                    element,
                 )
 
     if numeric_attributes:
         # example: [AttributeDict({'key': 'version', 'value': 1})]
         for element in numeric_attributes:
-            logger.debug(f"Numeric attribute element: {element}")
+            key = element.key
             # Filter out system attributes
-            if element.key.startswith("$"):
+            if key.startswith("$"):
                 continue
 
-            if isinstance(element.value, int):
-                attributes[element.key] = element.value
+            value = element.value
+            if isinstance(value, int):
+                attributes[key] = value
             else:
                 logger.warning(
-                    f"Unexpected numeric attribute, expected (str, int) but found: {element}, skipping ..."
+                    "Unexpected numeric attribute, expected (str, int) but found: %s, skipping ...",
+                    element,
                 )
 
     return attributes
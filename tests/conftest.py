@@ -14,7 +14,7 @@ from collections.abc import AsyncGenerator, Generator
 from pathlib import Path
 
 import pytest
-from web3 import Web3
+from web3 import HTTPProvider, Web3
 
 from arkiv import Arkiv, AsyncArkiv
 from arkiv.account import NamedAccount
@@ -35,6 +35,9 @@ SLOW_LOCAL_SERVER_HOST = "127.0.0.1"
 SLOW_LOCAL_SERVER_PORT = 9876
 SLOW_LOCAL_SERVER_TIMEOUT = 5
 
+# Nothing listens on this port, requests fail immediately
+OFFLINE_RPC_URL = "http://127.0.0.1:1"
+
 ALICE = "alice"
 BOB = "bob"
 
@@ -174,6 +177,12 @@ def arkiv_client_http(arkiv_node: ArkivNode, account_1: NamedAccount) -> Arkiv:
     return client
 
 
+@pytest.fixture
+def arkiv_client_offline() -> Arkiv:
+    """Return Arkiv client without a node, for unit tests that mock node calls."""
+    return Arkiv(HTTPProvider(OFFLINE_RPC_URL))
+
+
 @pytest.fixture(scope="session")
 def web3_client_http(arkiv_node: ArkivNode) -> Web3:
     """Return Web3 client connected to HTTP endpoint."""
@@ -12,6 +12,7 @@ from arkiv import Arkiv
 from arkiv.account import NamedAccount
 from arkiv.exceptions import NamedAccountNotFoundException
 from arkiv.module import ArkivModule
+from arkiv.module_base import ArkivModuleBase
 
 logger = logging.getLogger(__name__)
 
@@ -123,6 +124,25 @@ class TestArkivClientCreation:
         _assert_arkiv_client_properties(client, None, "With kwargs")
         logger.info("Created Arkiv client with additional kwargs")
 
+    def test_create_arkiv_with_receipt_polling_config(
+        self, arkiv_client_offline: Arkiv
+    ) -> None:
+        """Test that receipt polling settings are passed from client to module."""
+        assert (
+            arkiv_client_offline.arkiv.receipt_poll_latency
+            == ArkivModuleBase.RECEIPT_POLL_LATENCY_DEFAULT
+        )
+        assert (
+            arkiv_client_offline.arkiv.receipt_timeout
+            == ArkivModuleBase.RECEIPT_TIMEOUT_DEFAULT
+        )
+
+        client = Arkiv(
+            arkiv_client_offline.provider, receipt_poll_latency=1.5, receipt_timeout=30
+        )
+        assert client.arkiv.receipt_poll_latency == 1.5
+        assert client.arkiv.receipt_timeout == 30
+
 
 class TestArkivClientAccountManagement:
     """Test account management in Arkiv client."""
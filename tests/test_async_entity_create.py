@@ -1,12 +1,20 @@
 """Tests for async entity creation functionality in AsyncArkivModule."""
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from web3.exceptions import Web3RPCError
 
 from arkiv import AsyncArkiv
-from arkiv.types import Attributes
+from arkiv.account import NamedAccount
+from arkiv.events_async import NewHeadsListener
+from arkiv.node import ArkivNode
+from arkiv.provider import ProviderBuilder
+from arkiv.types import Attributes, CreateOp, Operations
 
 from .utils import check_entity_key, check_tx_hash
 
@@ -59,6 +67,166 @@ class TestAsyncEntityCreate:
         assert len(entity_keys) == 3
         assert len(set(entity_keys)) == 3, "All entity keys should be unique"
 
+    @pytest.mark.asyncio
+    async def test_async_create_entities(
+        self, async_arkiv_client_http: AsyncArkiv
+    ) -> None:
+        """Test creating multiple entities in a single transaction with async client."""
+        create_ops = [
+            CreateOp(
+                payload=f"Async bulk entity {i}".encode(),
+                content_type="text/plain",
+                attributes=Attributes({"index": i}),
+                expires_in=1000,
+            )
+            for i in range(3)
+        ]
+
+        entity_keys, receipt = await async_arkiv_client_http.arkiv.create_entities(
+            create_ops
+        )
+
+        check_tx_hash("test_async_create_entities", receipt)
+        assert len(entity_keys) == 3
+        assert len(set(entity_keys)) == 3, "All entity keys should be unique"
+        for i, entity_key in enumerate(entity_keys):
+            check_entity_key(f"test_async_create_entities_{i}", entity_key)
+
+    @pytest.mark.asyncio
+    async def test_async_execute_many(
+        self, async_arkiv_client_http: AsyncArkiv
+    ) -> None:
+        """Test executing several transactions with concurrent receipt waits."""
+        operations_list = [
+            Operations(
+                creates=[
+                    CreateOp(
+                        payload=f"Async execute many {i}".encode(),
+                        content_type="text/plain",
+                        attributes=Attributes({"index": i}),
+                        expires_in=1000,
+                    )
+                ]
+            )
+            for i in range(3)
+        ]
+
+        receipts = await async_arkiv_client_http.arkiv.execute_many(operations_list)
+
+        assert len(receipts) == 3
+        assert len({receipt.tx_hash for receipt in receipts}) == 3
+        for i, receipt in enumerate(receipts):
+            check_tx_hash(f"test_async_execute_many_{i}", receipt)
+            assert len(receipt.creates) == 1
+            entity = await async_arkiv_client_http.arkiv.get_entity(
+                receipt.creates[0].key
+            )
+            assert entity.payload == f"Async execute many {i}".encode()
+
+    @pytest.mark.asyncio
+    async def test_async_create_entity_concurrently(
+        self, async_arkiv_client_http: AsyncArkiv
+    ) -> None:
+        """Test that concurrent creates get distinct nonces and all succeed."""
+        results = await asyncio.gather(
+            *(
+                async_arkiv_client_http.arkiv.create_entity(
+                    payload=f"Concurrent {i}".encode(), expires_in=1000
+                )
+                for i in range(3)
+            )
+        )
+
+        assert len({entity_key for entity_key, _ in results}) == 3
+        for i, (entity_key, receipt) in enumerate(results):
+            check_entity_key(f"test_async_create_entity_concurrently_{i}", entity_key)
+            check_tx_hash(f"test_async_create_entity_concurrently_{i}", receipt)
+
+
+class TestAsyncReceiptConfirmation:
+    """Test waiting for receipts via newHeads subscriptions."""
+
+    @pytest.mark.asyncio
+    async def test_async_create_entity_subscribe_ws(
+        self, arkiv_node: ArkivNode, account_1: NamedAccount
+    ) -> None:
+        """Test receipts are confirmed on new heads with a WebSocket provider."""
+        if not arkiv_node.is_external:
+            try:
+                arkiv_node.fund_account(account_1)
+            except RuntimeError as e:
+                # Account may already be funded from previous tests
+                if "account already exists" not in str(e):
+                    raise
+
+        provider = ProviderBuilder().node(arkiv_node).ws().build()
+        async with AsyncArkiv(
+            provider, account=account_1, receipt_confirmation="subscribe"
+        ) as client:
+            entity_key, receipt = await client.arkiv.create_entity(
+                payload=b"Subscribe confirmation", expires_in=1000
+            )
+            check_entity_key("test_async_create_entity_subscribe_ws", entity_key)
+            check_tx_hash("test_async_create_entity_subscribe_ws", receipt)
+
+            receipts = await client.arkiv.execute_many(
+                [
+                    Operations(creates=[CreateOp(payload=b"many", expires_in=1000)])
+                    for _ in range(2)
+                ]
+            )
+            assert len(receipts) == 2
+            assert all(len(r.creates) == 1 for r in receipts)
+
+    @pytest.mark.asyncio
+    async def test_async_create_entity_subscribe_http_falls_back(
+        self, async_arkiv_client_http: AsyncArkiv
+    ) -> None:
+        """Test subscribe confirmation falls back to polling over HTTP."""
+        async_arkiv_client_http.arkiv.receipt_confirmation = "subscribe"
+
+        entity_key, receipt = await async_arkiv_client_http.arkiv.create_entity(
+            payload=b"Subscribe fallback", expires_in=1000
+        )
+
+        check_entity_key("test_async_create_entity_subscribe_http", entity_key)
+        check_tx_hash("test_async_create_entity_subscribe_http", receipt)
+
+
+@pytest.mark.asyncio
+async def test_new_heads_listener_wakes_all_waiters() -> None:
+    """Test that concurrent waits share one newHeads subscription and reader."""
+    messages: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+
+    async def process_subscriptions() -> AsyncIterator[dict[str, Any]]:
+        while True:
+            yield await messages.get()
+
+    w3 = MagicMock()
+    w3.eth.subscribe = AsyncMock(return_value="0xsub")
+    w3.eth.unsubscribe = AsyncMock(return_value=True)
+    w3.socket.process_subscriptions = process_subscriptions
+    listener = NewHeadsListener(w3)
+
+    await listener.acquire()
+    await listener.acquire()
+    waiters = [
+        asyncio.create_task(listener.wait(listener.head_count)) for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+
+    # Messages of other subscriptions do not wake up the waiters
+    await messages.put({"subscription": "0xother", "result": {}})
+    await messages.put({"subscription": "0xsub", "result": {}})
+    await asyncio.wait_for(asyncio.gather(*waiters), timeout=1.0)
+    assert listener.head_count == 1
+
+    await listener.release()
+    w3.eth.unsubscribe.assert_not_called()
+    await listener.release()
+    w3.eth.subscribe.assert_awaited_once_with("newHeads")
+    w3.eth.unsubscribe.assert_awaited_once_with("0xsub")
+
 
 class TestAsyncEntityCreateValidation:
     """Test cases for async entity creation validation and error handling."""
@@ -1,8 +1,12 @@
 """Tests for async entity retrieval functionality in AsyncArkivModule."""
 
+import asyncio
 import logging
+from typing import Any
+from unittest.mock import patch
 
 import pytest
+from web3 import AsyncHTTPProvider
 
 from arkiv import AsyncArkiv
 from arkiv.types import (
@@ -10,6 +14,7 @@ from arkiv.types import (
     CONTENT_TYPE,
     PAYLOAD,
     Attributes,
+    Entity,
     EntityKey,
 )
 
@@ -108,8 +113,6 @@ class TestAsyncEntityGet:
         self, async_arkiv_client_http: AsyncArkiv
     ) -> None:
         """Test retrieving multiple entities concurrently using asyncio.gather."""
-        import asyncio
-
         # Create multiple entities
         entity_keys = []
         for i in range(5):
@@ -138,6 +141,78 @@ class TestAsyncEntityGet:
 
         logger.info("Successfully retrieved 5 entities concurrently")
 
+    @pytest.mark.asyncio
+    async def test_async_get_entity_concurrent_duplicates(
+        self, async_arkiv_client_http: AsyncArkiv
+    ) -> None:
+        """Test that concurrent reads of the same entity share one fetch."""
+        arkiv = async_arkiv_client_http.arkiv
+        entity_key, _ = await arkiv.create_entity(
+            payload=b"Single flight", expires_in=100
+        )
+
+        with patch.object(
+            arkiv, "_fetch_entity", wraps=arkiv._fetch_entity
+        ) as fetch_entity:
+            entities = await asyncio.gather(
+                *(arkiv.get_entity(entity_key) for _ in range(5))
+            )
+
+        assert fetch_entity.call_count == 1
+        assert all(entity == entities[0] for entity in entities)
+        assert entities[0].payload == b"Single flight"
+
+        # Errors are shared with all concurrent callers as well
+        fake_key = EntityKey("0x" + "00" * 32)
+        results = await asyncio.gather(
+            *(arkiv.get_entity(fake_key) for _ in range(3)), return_exceptions=True
+        )
+        assert all(isinstance(result, ValueError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_async_get_entity_cancelled_caller(self) -> None:
+        """Test that cancelling one caller does not cancel the shared fetch."""
+        client = AsyncArkiv(AsyncHTTPProvider("http://127.0.0.1:1"))
+        arkiv = client.arkiv
+        entity_key = EntityKey("0x" + "01" * 32)
+        release = asyncio.Event()
+
+        async def fetch_entity(*args: Any) -> Entity:
+            await release.wait()
+            return Entity(key=entity_key)
+
+        with patch.object(arkiv, "_fetch_entity", side_effect=fetch_entity):
+            first = asyncio.create_task(arkiv.get_entity(entity_key))
+            second = asyncio.create_task(arkiv.get_entity(entity_key))
+            await asyncio.sleep(0)
+
+            first.cancel()
+            await asyncio.sleep(0)
+            release.set()
+
+            assert (await second).key == entity_key
+            assert first.cancelled()
+            assert not arkiv._inflight_entities
+
+    @pytest.mark.asyncio
+    async def test_async_get_entity_shared_result_is_copied(self) -> None:
+        """Test that concurrent callers do not share one mutable entity."""
+        client = AsyncArkiv(AsyncHTTPProvider("http://127.0.0.1:1"))
+        arkiv = client.arkiv
+        entity_key = EntityKey("0x" + "01" * 32)
+
+        async def fetch_entity(*args: Any) -> Entity:
+            await asyncio.sleep(0)
+            return Entity(key=entity_key, attributes=Attributes({"type": "a"}))
+
+        with patch.object(arkiv, "_fetch_entity", side_effect=fetch_entity):
+            first, second = await asyncio.gather(
+                arkiv.get_entity(entity_key), arkiv.get_entity(entity_key)
+            )
+
+        first.attributes["type"] = "edited"  # type: ignore[index]
+        assert second.attributes == {"type": "a"}
+
     @pytest.mark.asyncio
     async def test_async_entity_exists(
         self, async_arkiv_client_http: AsyncArkiv
@@ -160,6 +235,47 @@ class TestAsyncEntityGet:
 
         logger.info("Entity existence check works correctly")
 
+    @pytest.mark.asyncio
+    async def test_async_get_entity_if_exists(
+        self, async_arkiv_client_http: AsyncArkiv
+    ) -> None:
+        """Test getting an entity or None with async client."""
+        payload = b"Async if exists check"
+        entity_key, _ = await async_arkiv_client_http.arkiv.create_entity(
+            payload=payload, expires_in=1000
+        )
+
+        entity = await async_arkiv_client_http.arkiv.get_entity_if_exists(entity_key)
+        assert entity is not None
+        assert entity.payload == payload
+
+        fake_key = EntityKey(
+            "0x0000000000000000000000000000000000000000000000000000000000000000"
+        )
+        assert (
+            await async_arkiv_client_http.arkiv.get_entity_if_exists(fake_key) is None
+        )
+
+    @pytest.mark.asyncio
+    async def test_async_get_entities(
+        self, async_arkiv_client_http: AsyncArkiv
+    ) -> None:
+        """Test retrieving multiple entities in batched queries."""
+        entity_keys = [
+            (await create_entity(async_arkiv_client_http))[0] for _ in range(3)
+        ]
+
+        entities = await async_arkiv_client_http.arkiv.get_entities(
+            entity_keys, batch_size=2
+        )
+        assert [entity.key for entity in entities] == entity_keys
+
+        missing_key = EntityKey("0x" + "00" * 32)
+        exists = await async_arkiv_client_http.arkiv.entities_exist(
+            [entity_keys[0], missing_key]
+        )
+        assert exists == [True, False]
+
 
 async def create_entity(
     arkiv_client_http: AsyncArkiv,
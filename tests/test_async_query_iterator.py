@@ -1,11 +1,27 @@
 """Tests for query entity iterator (auto-pagination)."""
 
+import asyncio
+import gc
 import uuid
+from typing import Any
+from unittest.mock import patch
 
 import pytest
+from web3 import AsyncHTTPProvider
 
 from arkiv import AsyncArkiv
-from arkiv.types import ATTRIBUTES, KEY, Attributes, CreateOp, Operations, QueryOptions
+from arkiv.types import (
+    ATTRIBUTES,
+    KEY,
+    Attributes,
+    CreateOp,
+    Cursor,
+    Entity,
+    EntityKey,
+    Operations,
+    QueryOptions,
+    QueryPage,
+)
 
 EXPIRES_IN = 100
 CONTENT_TYPE = "text/plain"
@@ -140,3 +156,96 @@ class TestAsyncQueryIterator:
         for entity in entities:
             assert entity.attributes is not None
             assert entity.attributes["batch_id"] == batch_id
+
+    @pytest.mark.asyncio
+    async def test_async_iterate_entities_prefetch(
+        self, async_arkiv_client_http: AsyncArkiv
+    ) -> None:
+        """Test prefetching iteration yields the same entities as plain iteration."""
+        # Create 10 entities
+        num_entities = 10
+        batch_id, expected_keys = await create_test_entities(
+            async_arkiv_client_http, num_entities
+        )
+
+        query = f'batch_id = "{batch_id}"'
+        options = QueryOptions(attributes=KEY | ATTRIBUTES, max_results_per_page=3)
+
+        prefetched_keys = [
+            entity.key
+            async for entity in async_arkiv_client_http.arkiv.query_entities(
+                query=query, options=options, prefetch=True
+            )
+        ]
+        plain_keys = [
+            entity.key
+            async for entity in async_arkiv_client_http.arkiv.query_entities(
+                query=query, options=options
+            )
+        ]
+
+        assert len(prefetched_keys) == num_entities
+        assert prefetched_keys == plain_keys
+        assert set(prefetched_keys) == set(expected_keys)
+
+    @pytest.mark.asyncio
+    async def test_async_iterate_entities_abandoned_prefetch(self) -> None:
+        """Test that a failed prefetch of an abandoned iterator is not reported."""
+        client = AsyncArkiv(AsyncHTTPProvider("http://127.0.0.1:1"))
+        first_page = QueryPage(
+            entities=[Entity(key=EntityKey("0x01")), Entity(key=EntityKey("0x02"))],
+            block_number=1,
+            cursor=Cursor("next"),
+        )
+        errors: list[dict[str, Any]] = []
+        asyncio.get_running_loop().set_exception_handler(
+            lambda loop, context: errors.append(context)
+        )
+
+        with patch.object(
+            client.arkiv,
+            "query_entities_page",
+            side_effect=[first_page, ValueError("node error")],
+        ):
+            iterator = client.arkiv.query_entities("$all", prefetch=True)
+            assert (await iterator.__anext__()).key == "0x01"
+            await asyncio.sleep(0.01)  # Let the prefetch fail
+
+        # Stop iterating without consuming the failed page
+        del iterator
+        gc.collect()
+        assert errors == []
+
+    @pytest.mark.asyncio
+    async def test_async_iterate_entities_aclose(self) -> None:
+        """Test that aclose cancels the prefetch of an iterator stopped early."""
+        client = AsyncArkiv(AsyncHTTPProvider("http://127.0.0.1:1"))
+        first_page = QueryPage(
+            entities=[Entity(key=EntityKey("0x01")), Entity(key=EntityKey("0x02"))],
+            block_number=1,
+            cursor=Cursor("next"),
+        )
+        started, cancelled = asyncio.Event(), asyncio.Event()
+
+        async def query_entities_page(query: str, options: QueryOptions) -> QueryPage:
+            if options.cursor is None:
+                return first_page
+            started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            raise AssertionError("Prefetch should be cancelled")
+
+        with patch.object(
+            client.arkiv, "query_entities_page", side_effect=query_entities_page
+        ):
+            iterator = client.arkiv.query_entities("$all", prefetch=True)
+            assert (await iterator.__anext__()).key == "0x01"
+            await started.wait()
+
+            await iterator.aclose()
+            assert cancelled.is_set()
+            with pytest.raises(StopAsyncIteration):
+                await iterator.__anext__()
@@ -1,9 +1,11 @@
 """Tests for batch operations."""
 
+from unittest.mock import patch
+
 import pytest
 
 from arkiv.batch import AsyncBatchBuilder, BatchBuilder
-from arkiv.types import EntityKey
+from arkiv.types import CreateEvent, EntityKey, TransactionReceipt, TxHash
 
 
 class TestBatchBuilderBase:
@@ -139,6 +141,40 @@ class TestBatchBuilder:
         with pytest.raises(RuntimeError, match="Cannot execute empty batch"):
             batch.execute()
 
+    def test_batch_execute_checks_receipt_operations(self, arkiv_client_offline):
+        """Test that the receipt must contain one event per batch operation."""
+        key = EntityKey("0x" + "ab" * 32)
+        receipt = TransactionReceipt(
+            block_number=1,
+            tx_hash=TxHash("0x" + "cd" * 32),
+            creates=[
+                CreateEvent(
+                    key=key,
+                    owner_address="0x" + "12" * 20,
+                    expiration_block=100,
+                    cost=0,
+                )
+            ],
+            updates=[],
+            extensions=[],
+            deletes=[],
+            change_owners=[],
+        )
+
+        with patch.object(arkiv_client_offline.arkiv, "execute", return_value=receipt):
+            # Matching counts pass
+            batch = BatchBuilder(arkiv_client_offline.arkiv)
+            batch.create_entity(payload=b"data", expires_in=100)
+            assert batch.execute() is receipt
+
+            # Missing delete event raises
+            batch = BatchBuilder(arkiv_client_offline.arkiv)
+            batch.delete_entity(key)
+            with pytest.raises(
+                RuntimeError, match="Expected 0 'create' operations but got 1"
+            ):
+                batch.execute()
+
     def test_batch_execute_single_create(self, arkiv_client_http):
         """Test executing a batch with a single create operation."""
         batch = BatchBuilder(arkiv_client_http.arkiv)
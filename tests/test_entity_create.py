@@ -1,6 +1,8 @@
 """Tests for entity creation functionality in ArkivModule."""
 
 import logging
+from dataclasses import replace
+from unittest.mock import patch
 
 import pytest
 from hexbytes import HexBytes
@@ -270,6 +272,58 @@ class TestEntityCreate:
         )
         logger.info(f"{label}: Entity creation and retrieval successful")
 
+    def test_create_entities(self, arkiv_client_http: Arkiv) -> None:
+        """Test create_entities creates all entities in a single transaction."""
+        create_ops = [
+            CreateOp(
+                payload=f"Bulk entity {i}".encode(),
+                content_type="text/plain",
+                attributes=Attributes({"type": "bulk", "index": i}),
+                expires_in=60,
+            )
+            for i in range(3)
+        ]
+
+        entity_keys, tx_receipt = arkiv_client_http.arkiv.create_entities(create_ops)
+
+        label = "test_create_entities"
+        check_tx_hash(label, tx_receipt)
+        assert len(entity_keys) == 3, f"{label}: Should return one key per create"
+        assert len(set(entity_keys)) == 3, f"{label}: Entity keys should be unique"
+
+        for i, entity_key in enumerate(entity_keys):
+            check_entity_key(entity_key, label)
+            entity = arkiv_client_http.arkiv.get_entity(entity_key)
+            assert entity.payload == f"Bulk entity {i}".encode(), (
+                f"{label}: Entity payload should match input order"
+            )
+            assert get_custom_attributes(entity) == create_ops[i].attributes, (
+                f"{label}: Entity attributes should match"
+            )
+
+    def test_create_entity_with_result(self, arkiv_client_http: Arkiv) -> None:
+        """Test create_entity_with_result builds the same entity as get_entity returns."""
+        entity, tx_receipt = arkiv_client_http.arkiv.create_entity_with_result(
+            payload=b"Hello fetch",
+            content_type="text/plain",
+            attributes=Attributes({"type": "fetch", "version": 1}),
+            expires_in=60,
+        )
+
+        label = "test_create_entity_with_result"
+        check_tx_hash(label, tx_receipt)
+        assert entity.key == tx_receipt.creates[0].key
+
+        fetched = arkiv_client_http.arkiv.get_entity(entity.key)
+        assert (
+            replace(fetched, fields=entity.fields, transaction_index=None) == entity
+        ), f"{label}: Entity should match the entity read from the node"
+
+    def test_create_entities_empty(self, arkiv_client_http: Arkiv) -> None:
+        """Test create_entities rejects an empty list of creates."""
+        with pytest.raises(ValueError):
+            arkiv_client_http.arkiv.create_entities([])
+
 
 class TestEntityCreateValidation:
     """Test cases for entity creation validation and error handling."""
@@ -291,3 +345,59 @@ class TestEntityCreateValidation:
 
         with pytest.raises(Web3RPCError, match="insufficient funds"):
             client.arkiv.create_entity(payload=b"test", expires_in=1000)
+
+
+class TestTransferEth:
+    """Test cases for transfer_eth transaction parameters."""
+
+    TO = "0x" + "12" * 20
+    TX_HASH = HexBytes("0x" + "cd" * 32)
+
+    def test_transfer_eth_tx_params(self, arkiv_client_offline: Arkiv) -> None:
+        """Test that transfers send the wei amount as is."""
+        with patch.object(
+            arkiv_client_offline.eth, "send_transaction", return_value=self.TX_HASH
+        ) as send_transaction:
+            tx_hash = arkiv_client_offline.arkiv.transfer_eth(
+                self.TO,  # type: ignore[arg-type]
+                42,
+                wait_for_confirmation=False,
+            )
+
+        assert tx_hash == self.TX_HASH.to_0x_hex()
+        send_transaction.assert_called_once_with(
+            {"to": self.TO, "value": 42, "gas": 21000}
+        )
+
+    def test_transfer_eth_int_like_amount(self, arkiv_client_offline: Arkiv) -> None:
+        """Test that integer-like amounts are converted to int."""
+
+        class IntLike:
+            def __index__(self) -> int:
+                return 7
+
+        with patch.object(
+            arkiv_client_offline.eth, "send_transaction", return_value=self.TX_HASH
+        ) as send_transaction:
+            arkiv_client_offline.arkiv.transfer_eth(
+                self.TO,  # type: ignore[arg-type]
+                IntLike(),  # type: ignore[arg-type]
+                wait_for_confirmation=False,
+            )
+
+        value = send_transaction.call_args.args[0]["value"]
+        assert value == 7
+        assert type(value) is int
+
+    def test_transfer_eth_invalid_amount(self, arkiv_client_offline: Arkiv) -> None:
+        """Test that invalid amounts are rejected before sending."""
+        with patch.object(
+            arkiv_client_offline.eth, "send_transaction"
+        ) as send_transaction:
+            with pytest.raises(TypeError, match="amount_wei must be an int"):
+                arkiv_client_offline.arkiv.transfer_eth(self.TO, 1.5)  # type: ignore[arg-type]
+
+            with pytest.raises(ValueError, match="amount_wei cannot be negative"):
+                arkiv_client_offline.arkiv.transfer_eth(self.TO, -1)  # type: ignore[arg-type]
+
+        send_transaction.assert_not_called()
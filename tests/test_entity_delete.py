@@ -137,6 +137,27 @@ class TestEntityDelete:
 
         logger.info("Deletion of bulk-created entities successful")
 
+    def test_delete_entities(self, arkiv_client_http: Arkiv) -> None:
+        """Test delete_entities deletes all entities in a single transaction."""
+        create_ops = [
+            CreateOp(
+                payload=f"Entity {i}".encode(),
+                content_type="text/plain",
+                attributes=Attributes({"index": i}),
+                expires_in=100,
+            )
+            for i in range(2)
+        ]
+        entity_keys = bulk_create_entities(arkiv_client_http, create_ops)
+
+        delete_ops = [DeleteOp(key=key) for key in entity_keys]
+        receipt = arkiv_client_http.arkiv.delete_entities(delete_ops)
+
+        check_tx_hash("test_delete_entities", receipt)
+        assert [d.key for d in receipt.deletes] == entity_keys
+        for entity_key in entity_keys:
+            assert not arkiv_client_http.arkiv.entity_exists(entity_key)
+
     def test_delete_nonexistent_entity_behavior(self, arkiv_client_http: Arkiv) -> None:
         """Test that deleting a non-existent entity raises an exception."""
         from eth_typing import HexStr
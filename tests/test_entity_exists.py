@@ -1,6 +1,10 @@
 """Tests for entity_exists functionality."""
 
 import logging
+from unittest.mock import patch
+
+import pytest
+import requests
 
 from arkiv import Arkiv
 from arkiv.types import Attributes, EntityKey
@@ -123,6 +127,36 @@ class TestEntityExists:
         assert entity.payload == payload
         assert entity.attributes == attributes
 
+    def test_get_entity_if_exists(self, arkiv_client_http: Arkiv) -> None:
+        """Test get_entity_if_exists returns the entity or None."""
+        payload = b"if exists test"
+        entity_key, receipt = arkiv_client_http.arkiv.create_entity(
+            payload=payload, expires_in=1000
+        )
+
+        entity = arkiv_client_http.arkiv.get_entity_if_exists(entity_key)
+        assert entity is not None
+        assert entity.key == entity_key
+        assert entity.payload == payload
+
+        fake_key = EntityKey(
+            "0x0000000000000000000000000000000000000000000000000000000000000999"
+        )
+        assert arkiv_client_http.arkiv.get_entity_if_exists(fake_key) is None
+        assert (
+            arkiv_client_http.arkiv.get_entity_if_exists(EntityKey("0xinvalid")) is None
+        )
+
+        # A result at a fixed block is shared with get_entity and entity_exists
+        at_block = receipt.block_number
+        entity = arkiv_client_http.arkiv.get_entity_if_exists(
+            entity_key, at_block=at_block
+        )
+        assert entity is arkiv_client_http.arkiv.get_entity(
+            entity_key, at_block=at_block
+        )
+        assert arkiv_client_http.arkiv.entity_exists(entity_key, at_block=at_block)
+
     def test_entity_exists_with_bulk_created_entities(
         self, arkiv_client_http: Arkiv
     ) -> None:
@@ -146,3 +180,49 @@ class TestEntityExists:
         # Verify all exist
         for entity_key in entity_keys:
             assert arkiv_client_http.arkiv.entity_exists(entity_key) is True
+
+
+class TestEntityExistsOffline:
+    """Test entity existence checks against mocked node responses."""
+
+    ENTITY_KEY = EntityKey("0x" + "aa" * 32)
+
+    def test_entity_exists_requests_no_data(self, arkiv_client_offline: Arkiv) -> None:
+        """Test that entity_exists asks for a single result without data."""
+        with patch.object(
+            arkiv_client_offline.eth, "query", return_value={"data": [{"key": "0x1"}]}
+        ) as query:
+            assert arkiv_client_offline.arkiv.entity_exists(self.ENTITY_KEY)
+
+        rpc_options = query.call_args.args[1]
+        assert rpc_options["resultsPerPage"] == "0x1"
+        assert rpc_options["atBlock"] is None
+        assert not any(rpc_options["includeData"].values())
+
+        for raw_results in [{"data": []}, None]:
+            with patch.object(
+                arkiv_client_offline.eth, "query", return_value=raw_results
+            ):
+                assert not arkiv_client_offline.arkiv.entity_exists(self.ENTITY_KEY)
+
+    def test_entity_exists_at_block_is_cached(
+        self, arkiv_client_offline: Arkiv
+    ) -> None:
+        """Test that existence checks pinned to a block are only queried once."""
+        with patch.object(
+            arkiv_client_offline.eth, "query", return_value={"data": [{"key": "0x1"}]}
+        ) as query:
+            assert arkiv_client_offline.arkiv.entity_exists(self.ENTITY_KEY, 16)
+            assert arkiv_client_offline.arkiv.entity_exists(
+                EntityKey(self.ENTITY_KEY.upper().replace("0X", "0x")), 16
+            )
+
+        assert query.call_count == 1
+        assert query.call_args.args[1]["atBlock"] == "0x10"
+
+    def test_entity_exists_raises_connection_errors(
+        self, arkiv_client_offline: Arkiv
+    ) -> None:
+        """Test that entity_exists only maps node errors to False, not transport ones."""
+        with pytest.raises(requests.exceptions.ConnectionError):
+            arkiv_client_offline.arkiv.entity_exists(self.ENTITY_KEY)
@@ -152,6 +152,35 @@ class TestEntityExtend:
 
         logger.info("Bulk extension of entities successful")
 
+    def test_extend_entities(self, arkiv_client_http: Arkiv) -> None:
+        """Test extend_entities extends all entities in a single transaction."""
+        create_ops = [
+            CreateOp(
+                payload=f"Entity {i}".encode(),
+                content_type="text/plain",
+                attributes=Attributes({"index": i}),
+                expires_in=100,
+            )
+            for i in range(2)
+        ]
+        entity_keys = bulk_create_entities(arkiv_client_http, create_ops)
+        initial_expirations = [
+            arkiv_client_http.arkiv.get_entity(key).expires_at_block
+            for key in entity_keys
+        ]
+
+        seconds = 200
+        extend_ops = [ExtendOp(key=key, extend_by=seconds) for key in entity_keys]
+        receipt = arkiv_client_http.arkiv.extend_entities(extend_ops)
+
+        check_tx_hash("test_extend_entities", receipt)
+        assert [e.key for e in receipt.extensions] == entity_keys
+        extend_blocks = arkiv_client_http.arkiv.to_blocks(seconds)
+        for entity_key, initial in zip(entity_keys, initial_expirations, strict=True):
+            entity = arkiv_client_http.arkiv.get_entity(entity_key)
+            assert initial is not None
+            assert entity.expires_at_block == initial + extend_blocks
+
     def test_extend_nonexistent_entity_behavior(self, arkiv_client_http: Arkiv) -> None:
         """Test that extending a non-existent entity raises an exception."""
         from arkiv.types import EntityKey
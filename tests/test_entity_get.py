@@ -1,9 +1,23 @@
 """Tests for entity retrieval functionality in ArkivModule."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from eth_typing import HexStr
 
 from arkiv.client import Arkiv
-from arkiv.types import ALL, KEY, NONE, Attributes, EntityKey
+from arkiv.types import (
+    ALL,
+    KEY,
+    NONE,
+    Attributes,
+    Entity,
+    EntityKey,
+    QueryOptions,
+    QueryPage,
+)
 from arkiv.utils import check_entity_key
 
 from .utils import get_custom_attributes
@@ -114,6 +128,226 @@ class TestEntityGetProjections:
         )
 
 
+class TestEntityGetCache:
+    """Test suite for caching of reads pinned to a block."""
+
+    def test_get_entity_at_block_is_cached(self, arkiv_client_http: Arkiv) -> None:
+        """Test get_entity with at_block returns the cached entity on repeat."""
+        entity_key, _, _, _ = create_entity(arkiv_client_http)
+        block = arkiv_client_http.eth.block_number
+
+        entity = arkiv_client_http.arkiv.get_entity(entity_key, at_block=block)
+        hits = arkiv_client_http.arkiv.entity_cache_info().hits
+        assert arkiv_client_http.arkiv.get_entity(entity_key, at_block=block) == entity
+        assert arkiv_client_http.arkiv.entity_cache_info().hits == hits + 1
+
+        arkiv_client_http.arkiv.clear_entity_cache()
+        refetched = arkiv_client_http.arkiv.get_entity(entity_key, at_block=block)
+        assert arkiv_client_http.arkiv.entity_cache_info().hits == 0
+        assert refetched == entity
+
+    def test_get_entity_latest_is_not_cached(self, arkiv_client_http: Arkiv) -> None:
+        """Test get_entity without at_block always queries the node."""
+        entity_key, _, _, _ = create_entity(arkiv_client_http)
+
+        entity = arkiv_client_http.arkiv.get_entity(entity_key)
+        assert arkiv_client_http.arkiv.get_entity(entity_key) is not entity
+
+    def test_entity_exists_at_block_is_cached(self, arkiv_client_http: Arkiv) -> None:
+        """Test entity_exists with at_block caches existence per block."""
+        entity_key, _, _, _ = create_entity(arkiv_client_http)
+        block = arkiv_client_http.eth.block_number
+
+        assert arkiv_client_http.arkiv.entity_exists(entity_key, at_block=block)
+        arkiv_client_http.arkiv.delete_entity(entity_key)
+
+        # Still exists at the earlier block, now served from cache
+        assert arkiv_client_http.arkiv.entity_exists(entity_key, at_block=block)
+        assert not arkiv_client_http.arkiv.entity_exists(entity_key)
+
+
+class TestEntityGetMany:
+    """Test suite for bulk entity retrieval."""
+
+    def test_get_entities_in_key_order(self, arkiv_client_http: Arkiv) -> None:
+        """Test get_entities returns entities in the order of the provided keys."""
+        entity_keys = [create_entity(arkiv_client_http)[0] for _ in range(3)]
+        requested_keys = list(reversed(entity_keys))
+
+        # Use a small batch size to span multiple queries
+        entities = arkiv_client_http.arkiv.get_entities(requested_keys, batch_size=2)
+
+        assert [entity.key for entity in entities] == requested_keys
+        for entity in entities:
+            assert entity.payload == b"Test entity data", "Payload should match"
+            assert get_custom_attributes(entity) == {"type": "test", "version": 1}
+
+    def test_get_entities_always_includes_key(self, arkiv_client_http: Arkiv) -> None:
+        """Test get_entities populates keys even when not requested."""
+        entity_key, _, _, _ = create_entity(arkiv_client_http)
+
+        entities = arkiv_client_http.arkiv.get_entities([entity_key], fields=NONE)
+
+        assert len(entities) == 1
+        assert entities[0].key == entity_key, "Entity key should be populated"
+        assert entities[0].payload is None, "Payload should not be populated"
+
+    def test_get_entities_missing_entity(self, arkiv_client_http: Arkiv) -> None:
+        """Test get_entities raises when an entity does not exist."""
+        entity_key, _, _, _ = create_entity(arkiv_client_http)
+        missing_key = EntityKey("0x" + "00" * 32)
+
+        with pytest.raises(ValueError, match="Entity not found"):
+            arkiv_client_http.arkiv.get_entities([entity_key, missing_key])
+
+    def test_entities_exist(self, arkiv_client_http: Arkiv) -> None:
+        """Test entities_exist reports existence per provided key."""
+        entity_key, _, _, _ = create_entity(arkiv_client_http)
+        missing_key = EntityKey("0x" + "00" * 32)
+
+        exists = arkiv_client_http.arkiv.entities_exist([missing_key, entity_key])
+
+        assert exists == [False, True]
+        assert arkiv_client_http.arkiv.entities_exist([]) == []
+
+
+class TestEntityGetCacheOffline:
+    """Test suite for the entity cache against mocked node queries."""
+
+    def test_get_entity_cache_lru(self, arkiv_client_offline: Arkiv) -> None:
+        """Test that the least recently used reads are evicted from the cache."""
+        module = arkiv_client_offline.arkiv
+        module.entity_cache_size = 2
+        key_a, key_b, key_c = (entity_key(i) for i in range(3))
+
+        with patch.object(
+            module, "query_entities_page", side_effect=query_entities_page
+        ) as query:
+            module.get_entity(key_a, at_block=1)
+            module.get_entity(key_b, at_block=1)
+            module.get_entity(key_a, at_block=1)  # a is now most recent
+            module.get_entity(key_c, at_block=1)  # evicts b
+            assert query.call_count == 3
+            assert query.call_args.args[0] == f"$key = {key_c}"
+
+            module.get_entity(key_a, at_block=1)
+            assert query.call_count == 3
+            module.get_entity(key_b, at_block=1)
+            assert query.call_count == 4, "b should be evicted"
+
+            info = module.entity_cache_info()
+            assert (info.hits, info.misses, info.max_size, info.size) == (2, 4, 2, 2)
+
+            module.clear_entity_cache()
+            info = module.entity_cache_info()
+            assert (info.hits, info.misses, info.size) == (0, 0, 0)
+            module.get_entity(key_a, at_block=1)
+            assert query.call_count == 5
+
+            # Reads of the latest block are not cached
+            module.get_entity(key_a)
+            module.get_entity(key_a)
+            assert query.call_count == 7
+
+            module.entity_cache_size = 0
+            module.get_entity(key_b, at_block=1)
+            module.get_entity(key_b, at_block=1)
+            assert query.call_count == 9, "Cache should be off"
+
+    def test_get_entity_cache_returns_copies(self, arkiv_client_offline: Arkiv) -> None:
+        """Test that editing a returned entity does not change cached reads."""
+        module = arkiv_client_offline.arkiv
+        key_a = entity_key(0xAA)
+        page = QueryPage(
+            entities=[Entity(key=key_a, attributes=Attributes({"type": "a"}))],
+            block_number=1,
+        )
+
+        with patch.object(module, "query_entities_page", return_value=page):
+            entity = module.get_entity(key_a, at_block=1)
+            entity.attributes["type"] = "edited"  # type: ignore[index]
+            cached = module.get_entity(key_a, at_block=1)
+            assert cached.attributes == {"type": "a"}
+            cached.attributes["type"] = "edited"  # type: ignore[index]
+            assert module.get_entity(key_a, at_block=1).attributes == {"type": "a"}
+
+            entities = module.get_entities([key_a], at_block=1)
+            entities[0].attributes["type"] = "edited"  # type: ignore[index]
+            assert module.get_entities([key_a], at_block=1)[0].attributes == {
+                "type": "a"
+            }
+
+    def test_get_entity_cache_threads(self, arkiv_client_offline: Arkiv) -> None:
+        """Test concurrent reads and evicting writes on the entity cache."""
+        module = arkiv_client_offline.arkiv
+        module.entity_cache_size = 4
+        entity_keys = [entity_key(i) for i in range(10)]
+
+        def worker(offset: int) -> None:
+            for i in range(200):
+                key = entity_keys[(i + offset) % len(entity_keys)]
+                assert module.get_entity(key, at_block=1).key == key
+
+        with (
+            patch.object(
+                module, "query_entities_page", side_effect=query_entities_page
+            ),
+            ThreadPoolExecutor(max_workers=8) as executor,
+        ):
+            # result() re-raises errors of the workers, e.g. a KeyError on eviction
+            for future in [executor.submit(worker, n) for n in range(8)]:
+                future.result()
+
+        info = module.entity_cache_info()
+        assert info.size == 4
+        assert info.hits + info.misses == 8 * 200
+
+    def test_get_entities_cache(self, arkiv_client_offline: Arkiv) -> None:
+        """Test that bulk reads at a fixed block only fetch uncached keys."""
+        module = arkiv_client_offline.arkiv
+        key_a, key_b = entity_key(0xAA), entity_key(0xBB)
+
+        with patch.object(
+            module, "query_entities_pages", side_effect=query_entities_pages
+        ) as query:
+            module.get_entities([key_a], KEY, at_block=10)
+            assert query.call_count == 1
+
+            # Keys are case insensitive, only b is fetched
+            entities = module.get_entities(
+                [EntityKey(HexStr(key_a.upper().replace("0X", "0x"))), key_b],
+                KEY,
+                at_block=10,
+            )
+            assert [e.key for e in entities] == [key_a, key_b]
+            assert query.call_args.args[0][0][0] == f"$key = {key_b}"
+
+            # Other fields or blocks are separate cache entries
+            module.get_entities([key_a], ALL, at_block=10)
+            module.get_entities([key_a], KEY, at_block=11)
+            assert query.call_count == 4
+
+    def test_get_entities_key_batches(self, arkiv_client_offline: Arkiv) -> None:
+        """Test that bulk reads combine the keys of a batch into a single query."""
+        module = arkiv_client_offline.arkiv
+        entity_keys = [entity_key(i) for i in range(5)]
+
+        with patch.object(
+            module, "query_entities_pages", side_effect=query_entities_pages
+        ) as query:
+            entities = module.get_entities(entity_keys, at_block=10, batch_size=2)
+
+        assert [e.key for e in entities] == entity_keys
+        assert [q for q, _ in query.call_args.args[0]] == [
+            f"$key = {entity_keys[0]} OR $key = {entity_keys[1]}",
+            f"$key = {entity_keys[2]} OR $key = {entity_keys[3]}",
+            f"$key = {entity_keys[4]}",
+        ]
+
+        with pytest.raises(ValueError, match="Batch size must be positive"):
+            module.get_entities(entity_keys, at_block=10, batch_size=0)
+
+
 def create_entity(
     arkiv_client_http: Arkiv,
 ) -> tuple[EntityKey, bytes, str, Attributes]:
@@ -131,3 +365,22 @@ def create_entity(
     )
 
     return entity_key, payload, content_type, attributes
+
+
+def entity_key(i: int) -> EntityKey:
+    return EntityKey(HexStr(f"0x{i:064x}"))
+
+
+def query_entities_page(query: str, options: QueryOptions) -> QueryPage:
+    """Answer an entity key query without a node, one entity per key."""
+    entities = [
+        Entity(key=EntityKey(HexStr(key_query.removeprefix("$key = "))))
+        for key_query in query.split(" OR ")
+    ]
+    return QueryPage(entities=entities, block_number=options.at_block or 0)
+
+
+def query_entities_pages(
+    queries: list[tuple[str, QueryOptions]],
+) -> list[QueryPage]:
+    return [query_entities_page(query, options) for query, options in queries]
@@ -5,7 +5,7 @@ import uuid
 import pytest
 
 from arkiv import Arkiv
-from arkiv.types import ALL, Attributes
+from arkiv.types import ALL, KEY, Attributes, QueryOptions
 from arkiv.utils import to_query_options
 
 
@@ -92,3 +92,35 @@ class TestQueryEntitiesBasic:
         result_keys = {entity.key for entity in result.entities}
         expected_keys = set(entity_keys)
         assert result_keys == expected_keys
+
+
+class TestQueryEntitiesPages:
+    """Test running several queries in JSON-RPC batch requests."""
+
+    def test_query_entities_pages(self, arkiv_client_http: Arkiv) -> None:
+        """Test query_entities_pages returns one page per query, in query order."""
+        shared_id = str(uuid.uuid4()).replace("-", "")
+        entity_keys = []
+        for i in range(3):
+            entity_key, _ = arkiv_client_http.arkiv.create_entity(
+                payload=f"Entity {i}".encode(),
+                content_type="text/plain",
+                attributes=Attributes({"id": shared_id, "index": i}),
+                expires_in=1000,
+            )
+            entity_keys.append(entity_key)
+
+        options = QueryOptions(attributes=KEY)
+        queries = [(f'id = "{shared_id}" AND index = {i}', options) for i in range(3)]
+        queries.append(('id = "no-such-id"', options))
+
+        # Batch size 2 sends two batch requests
+        pages = arkiv_client_http.arkiv.query_entities_pages(queries, batch_size=2)
+
+        assert len(pages) == 4
+        assert [page.entities[0].key for page in pages[:3]] == entity_keys
+        assert not pages[3]
+
+    def test_query_entities_pages_empty(self, arkiv_client_http: Arkiv) -> None:
+        """Test query_entities_pages without queries returns no pages."""
+        assert arkiv_client_http.arkiv.query_entities_pages([]) == []
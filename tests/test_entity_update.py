@@ -196,6 +196,37 @@ class TestEntityUpdate:
 
     # TODO re-enable test once arkiv node supports empty payloads
     @pytest.mark.skip("setting/updating payload to b'' does not currently work")
+    def test_update_entities(self, arkiv_client_http: Arkiv) -> None:
+        """Test update_entities updates all entities in a single transaction."""
+        create_ops = [
+            CreateOp(
+                payload=f"Original {i}".encode(),
+                content_type="text/plain",
+                attributes=Attributes({"index": i}),
+                expires_in=100,
+            )
+            for i in range(2)
+        ]
+        entity_keys = bulk_create_entities(arkiv_client_http, create_ops)
+
+        update_ops = [
+            UpdateOp(
+                key=entity_key,
+                payload=f"Updated {i}".encode(),
+                content_type="text/plain",
+                attributes=Attributes({"index": i, "status": "updated"}),
+                expires_in=100,
+            )
+            for i, entity_key in enumerate(entity_keys)
+        ]
+        receipt = arkiv_client_http.arkiv.update_entities(update_ops)
+
+        check_tx_hash("test_update_entities", receipt)
+        assert [u.key for u in receipt.updates] == entity_keys
+        for i, entity_key in enumerate(entity_keys):
+            entity = arkiv_client_http.arkiv.get_entity(entity_key)
+            assert entity.payload == f"Updated {i}".encode()
+
     def test_update_entity_to_empty_payload(self, arkiv_client_http: Arkiv) -> None:
         """Test updating an entity with an empty payload."""
         # Create an entity with some payload
@@ -1,6 +1,12 @@
 """Tests for automatic filter cleanup on context exit."""
 
+import gc
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from unittest.mock import patch
+
+from web3._utils.filters import LogFilter
 
 from arkiv import Arkiv
 from arkiv.account import NamedAccount
@@ -134,3 +140,90 @@ def test_filter_cleanup_with_manual_uninstall(arkiv_client_http):
     assert not filter1.is_running
     assert not filter2.is_running
     assert len(arkiv_client_http.arkiv.active_filters) == 0
+
+
+@contextmanager
+def installed_filters(client: Arkiv, *filter_ids: str) -> Iterator[None]:
+    """Install filters with the given ids on a mocked node, without new changes."""
+    ids = iter(filter_ids)
+    with (
+        patch.object(
+            client.eth,
+            "filter",
+            side_effect=lambda params: LogFilter(next(ids), eth_module=client.eth),
+        ),
+        patch.object(client.eth, "get_filter_changes", return_value=[]),
+        patch("arkiv.events.make_batch_request", return_value=None),
+    ):
+        yield
+
+
+def test_cleanup_filters_uninstalls_dropped_filters(arkiv_client_offline):
+    """Test that filters dropped by the caller are still uninstalled on cleanup."""
+    client = arkiv_client_offline
+    with installed_filters(client, "0x1", "0x2"):
+        kept = client.arkiv.watch_entity_created(lambda e, t: None)
+        client.arkiv.watch_entity_deleted(lambda e, t: None)
+        gc.collect()
+
+        assert kept.filter_id == "0x1"
+        assert len(client.arkiv.active_filters) == 2
+        assert client.arkiv.active_filter_count == 2
+
+        # One failing uninstall in the batch does not skip the others
+        responses = [
+            {"jsonrpc": "2.0", "id": 0, "error": {"code": -32000, "message": "gone"}},
+            {"jsonrpc": "2.0", "id": 1, "result": True},
+        ]
+        with patch(
+            "arkiv.module.make_batch_request", return_value=responses
+        ) as batch_request:
+            client.arkiv.cleanup_filters()
+
+    requests = batch_request.call_args.args[1]
+    assert sorted(requests) == [
+        ("eth_uninstallFilter", ("0x1",)),
+        ("eth_uninstallFilter", ("0x2",)),
+    ]
+    assert not kept.is_running
+    assert kept.filter_id is None
+    assert client.arkiv.active_filters == ()
+    assert client.arkiv.active_filter_count == 0
+
+
+def test_cleanup_filters_one_by_one_on_batch_error(arkiv_client_offline):
+    """Test that node filters are uninstalled one by one if the batch fails."""
+    client = arkiv_client_offline
+    with installed_filters(client, "0x1", "0x2"):
+        client.arkiv.watch_entity_created(lambda e, t: None)
+        client.arkiv.watch_entity_deleted(lambda e, t: None)
+
+        with (
+            patch(
+                "arkiv.module.make_batch_request",
+                side_effect=ValueError("batch failed"),
+            ),
+            patch.object(
+                client.eth, "uninstall_filter", side_effect=[ValueError("gone"), True]
+            ) as uninstall_filter,
+        ):
+            client.arkiv.cleanup_filters()
+
+    assert sorted(c.args for c in uninstall_filter.call_args_list) == [
+        ("0x1",),
+        ("0x2",),
+    ]
+    assert client.arkiv.active_filter_count == 0
+
+
+def test_event_filter_detach(arkiv_client_offline):
+    """Test that detach stops a filter and leaves its uninstall to the caller."""
+    client = arkiv_client_offline
+    with installed_filters(client, "0x1"):
+        event_filter = client.arkiv.watch_entity_created(lambda e, t: None)
+        with patch.object(client.eth, "uninstall_filter") as uninstall_filter:
+            assert event_filter.detach() == "0x1"
+            assert event_filter.detach() is None
+
+    assert not event_filter.is_running
+    uninstall_filter.assert_not_called()
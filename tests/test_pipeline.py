@@ -0,0 +1,153 @@
+"""Tests for pipelined transaction submission."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from hexbytes import HexBytes
+from web3.exceptions import TimeExhausted
+
+from arkiv import Arkiv
+from arkiv.pipeline import TxPipeline
+from arkiv.types import CreateOp, ExtendOp, Operations
+
+
+def _create_operations(index: int) -> Operations:
+    return Operations(
+        creates=[
+            CreateOp(
+                payload=f"pipeline {index}".encode(),
+                content_type="text/plain",
+                attributes={"type": "pipeline", "index": index},
+                expires_in=3600,
+            )
+        ]
+    )
+
+
+class TestTxPipeline:
+    """Tests for TxPipeline."""
+
+    def test_pipeline_initial_state(self, arkiv_client_http):
+        """Test that a new pipeline has no transactions."""
+        pipeline = arkiv_client_http.arkiv.pipeline()
+
+        assert isinstance(pipeline, TxPipeline)
+        assert pipeline.tx_hashes == []
+        assert pipeline.receipts == []
+        assert pipeline.wait() == []
+
+    def test_pipeline_send_operations(self, arkiv_client_http):
+        """Test that pipelined operation transactions are all confirmed."""
+        with arkiv_client_http.arkiv.pipeline() as pipeline:
+            for i in range(3):
+                pipeline.send_operations(_create_operations(i))
+
+        assert len(pipeline.tx_hashes) == 3
+        assert len(set(pipeline.tx_hashes)) == 3
+        assert [r.tx_hash for r in pipeline.receipts] == pipeline.tx_hashes
+        for i, receipt in enumerate(pipeline.receipts):
+            assert len(receipt.creates) == 1
+            entity = arkiv_client_http.arkiv.get_entity(receipt.creates[0].key)
+            assert entity.payload == f"pipeline {i}".encode()
+
+    def test_pipeline_assigns_consecutive_nonces(self, arkiv_client_http):
+        """Test that the pipeline assigns consecutive nonces to transactions."""
+        eth = arkiv_client_http.eth
+        nonce = eth.get_transaction_count(eth.default_account, "pending")
+
+        with arkiv_client_http.arkiv.pipeline() as pipeline:
+            for i in range(2):
+                pipeline.send_operations(_create_operations(i))
+
+        nonces = [eth.get_transaction(h)["nonce"] for h in pipeline.tx_hashes]
+        assert nonces == [nonce, nonce + 1]
+
+    def test_pipeline_resolves_fees_once(self, arkiv_client_http):
+        """Test that all pipeline transactions share the fees resolved on first send."""
+        eth = arkiv_client_http.eth
+
+        with arkiv_client_http.arkiv.pipeline() as pipeline:
+            for i in range(2):
+                pipeline.send_operations(_create_operations(i))
+
+        txs = [eth.get_transaction(h) for h in pipeline.tx_hashes]
+        assert txs[0]["chainId"] == txs[1]["chainId"] == eth.chain_id
+        if "maxFeePerGas" in txs[0]:
+            assert txs[0]["maxFeePerGas"] == txs[1]["maxFeePerGas"]
+
+    def test_pipeline_mixed_operations(self, arkiv_client_http):
+        """Test pipelining dependent-free operations on existing entities."""
+        entity_key, _ = arkiv_client_http.arkiv.create_entity(
+            payload=b"extend me", expires_in=3600
+        )
+
+        with arkiv_client_http.arkiv.pipeline() as pipeline:
+            pipeline.send_operations(_create_operations(0))
+            pipeline.send_operations(
+                Operations(extensions=[ExtendOp(key=entity_key, extend_by=600)])
+            )
+
+        assert len(pipeline.receipts) == 2
+        assert len(pipeline.receipts[0].creates) == 1
+        assert len(pipeline.receipts[1].extensions) == 1
+        assert pipeline.receipts[1].extensions[0].key == entity_key
+
+    def test_pipeline_no_wait_on_exception(self, arkiv_client_http):
+        """Test that the context manager does not wait when an exception occurs."""
+        pipeline = arkiv_client_http.arkiv.pipeline()
+        try:
+            with pipeline:
+                pipeline.send_operations(_create_operations(0))
+                raise ValueError("boom")
+        except ValueError:
+            pass
+
+        assert len(pipeline.tx_hashes) == 1
+        assert pipeline.receipts == []
+
+    def test_execute_many(self, arkiv_client_http):
+        """Test that execute_many returns one receipt per operations entry."""
+        receipts = arkiv_client_http.arkiv.execute_many(
+            [_create_operations(i) for i in range(3)]
+        )
+
+        assert len(receipts) == 3
+        assert len({r.tx_hash for r in receipts}) == 3
+        for i, receipt in enumerate(receipts):
+            entity = arkiv_client_http.arkiv.get_entity(receipt.creates[0].key)
+            assert entity.payload == f"pipeline {i}".encode()
+
+        assert arkiv_client_http.arkiv.execute_many([]) == []
+
+
+def test_pipeline_send_requires_account(arkiv_client_offline: Arkiv) -> None:
+    """Test that plain transactions also require a configured account."""
+    with pytest.raises(ValueError, match="No account configured"):
+        arkiv_client_offline.arkiv.pipeline().send({"to": "0x" + "00" * 20, "value": 1})
+
+
+def test_pipeline_wait_keeps_unconfirmed_transactions() -> None:
+    """Test that transactions stay pending when waiting for a receipt fails."""
+    module = MagicMock()
+    eth = module.client.eth
+    eth.send_transaction.side_effect = [HexBytes(b"\x01"), HexBytes(b"\x02")]
+    eth.get_transaction_count.return_value = 0
+    pipeline = TxPipeline(module)
+    pipeline.send({"gasPrice": 1})
+    pipeline.send({"gasPrice": 1})
+
+    eth.wait_for_transaction_receipt.side_effect = [
+        TimeExhausted("timeout"),
+        {"status": 1},
+        {"status": 0},
+    ]
+    with pytest.raises(TimeExhausted):
+        pipeline.wait()
+
+    # The failed second transaction is confirmed and no longer pending
+    with pytest.raises(RuntimeError, match="failed"):
+        pipeline.wait()
+    assert pipeline.wait() == []
+
+    waited = [c.args[0] for c in eth.wait_for_transaction_receipt.call_args_list]
+    assert waited == [HexBytes(b"\x01"), HexBytes(b"\x01"), HexBytes(b"\x02")]
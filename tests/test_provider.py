@@ -1,7 +1,9 @@
 """Tests for provider builder functionality."""
 
+import json
 import logging
 import time
+from types import SimpleNamespace
 
 import aiohttp
 import pytest
@@ -9,6 +11,7 @@ from web3.providers import AsyncHTTPProvider, HTTPProvider, WebSocketProvider
 from web3.providers.async_base import AsyncBaseProvider
 from web3.providers.base import BaseProvider
 
+from arkiv import provider as provider_module
 from arkiv.client import Arkiv, AsyncArkiv
 from arkiv.node import ArkivNode
 from arkiv.provider import (
@@ -18,6 +21,8 @@ from arkiv.provider import (
     LOCALHOST,
     NETWORK_URL,
     WS,
+    ArkivHTTPProvider,
+    AsyncArkivHTTPProvider,
     ProviderBuilder,
     TransportType,
 )
@@ -603,3 +608,83 @@ class TestProviderBuilderAsyncMode:
         async with AsyncArkiv(provider) as client:
             with pytest.raises(aiohttp.ClientConnectorDNSError):
                 await client.eth.block_number
+
+
+class TestArkivHTTPProvider:
+    """Test response decoding of the providers built by ProviderBuilder."""
+
+    def test_provider_builds_arkiv_http_providers(self) -> None:
+        """Test that HTTP transports build the Arkiv provider subclasses."""
+        assert isinstance(ProviderBuilder().build(), ArkivHTTPProvider)
+        assert isinstance(
+            ProviderBuilder().async_mode().build(), AsyncArkivHTTPProvider
+        )
+
+    @pytest.mark.parametrize(
+        "provider_class", [ArkivHTTPProvider, AsyncArkivHTTPProvider]
+    )
+    def test_decode_rpc_response(self, provider_class: type[HTTPProvider]) -> None:
+        """Test decoding matches the standard decoder, also for large integers."""
+        raw_responses = [
+            b'{"jsonrpc":"2.0","id":1,"result":{"data":[{"key":"0x01"}]}}',
+            b'{"jsonrpc":"2.0","id":2,"result":' + str(2**200).encode() + b"}",
+            b'[{"jsonrpc":"2.0","id":3,"result":"0x1"}]',
+        ]
+        for raw_response in raw_responses:
+            assert provider_class.decode_rpc_response(
+                raw_response
+            ) == HTTPProvider.decode_rpc_response(raw_response)
+
+    def test_orjson_decode_rpc_response(self) -> None:
+        """Test the orjson decoder and its fallback for responses it cannot decode."""
+        orjson = pytest.importorskip("orjson")
+        assert provider_module.orjson is orjson
+
+        raw_response = b'{"jsonrpc":"2.0","id":1,"result":{"data":[{"key":"0x01"}]}}'
+        assert provider_module._orjson_decode_rpc_response(raw_response) == json.loads(
+            raw_response
+        )
+
+        # Big integers, non-JSON and partial responses are left to the standard decoder
+        big_int = b'{"jsonrpc":"2.0","id":2,"result":' + str(2**200).encode() + b"}"
+        small_int = b'{"jsonrpc":"2.0","id":3,"result":[' + str(-(2**63) - 1).encode()
+        small_int += b"]}"
+        for raw_response in [
+            big_int,
+            small_int,
+            b"<html>Bad Gateway</html>",
+            b'{"jsonrpc":',
+        ]:
+            assert provider_module._orjson_decode_rpc_response(raw_response) is None
+        assert ArkivHTTPProvider.decode_rpc_response(big_int)["result"] == 2**200
+        assert ArkivHTTPProvider.decode_rpc_response(small_int)["result"] == [
+            -(2**63) - 1
+        ]
+        with pytest.raises(json.JSONDecodeError):
+            ArkivHTTPProvider.decode_rpc_response(b"<html>Bad Gateway</html>")
+        with pytest.raises(json.JSONDecodeError):
+            AsyncArkivHTTPProvider.decode_rpc_response(b'{"jsonrpc":')
+
+    @pytest.mark.parametrize(
+        "provider_class", [ArkivHTTPProvider, AsyncArkivHTTPProvider]
+    )
+    def test_decode_rpc_response_uses_orjson(
+        self, provider_class: type[HTTPProvider], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the providers decode with orjson when it is installed."""
+        decoded = {"jsonrpc": "2.0", "id": 1, "result": "0x1"}
+
+        def loads(raw_response: bytes) -> dict[str, str]:
+            if raw_response == b"orjson":
+                return decoded
+            raise json.JSONDecodeError("unsupported", "", 0)
+
+        stub = SimpleNamespace(loads=loads, JSONDecodeError=json.JSONDecodeError)
+        monkeypatch.setattr(provider_module, "orjson", stub)
+
+        assert provider_class.decode_rpc_response(b"orjson") is decoded
+        # Falls back to the standard decoder if orjson fails
+        raw_response = b'{"jsonrpc":"2.0","id":2,"result":"0x2"}'
+        assert provider_class.decode_rpc_response(raw_response) == json.loads(
+            raw_response
+        )
@@ -1,9 +1,21 @@
 """Tests for query entity iterator (auto-pagination)."""
 
 import uuid
+from unittest.mock import patch
 
 from arkiv import Arkiv
-from arkiv.types import ATTRIBUTES, KEY, Attributes, CreateOp, Operations, QueryOptions
+from arkiv.types import (
+    ATTRIBUTES,
+    KEY,
+    Attributes,
+    CreateOp,
+    Cursor,
+    Entity,
+    EntityKey,
+    Operations,
+    QueryOptions,
+    QueryPage,
+)
 
 EXPIRES_IN = 100
 CONTENT_TYPE = "text/plain"
@@ -314,3 +326,52 @@ class TestQueryIterator:
 
         # Should return no entities
         assert len(entities) == 0
+
+    def test_iterate_entities_prefetch(self, arkiv_client_http: Arkiv) -> None:
+        """Test prefetching iteration yields the same entities as plain iteration."""
+        # Create 10 entities
+        num_entities = 10
+        batch_id, expected_keys = create_test_entities(arkiv_client_http, num_entities)
+
+        query = f'batch_id = "{batch_id}"'
+        options = QueryOptions(attributes=KEY | ATTRIBUTES, max_results_per_page=3)
+
+        iterator = arkiv_client_http.arkiv.query_entities(
+            query=query, options=options, prefetch=True
+        )
+        prefetched_keys = [entity.key for entity in iterator]
+        plain_keys = [
+            entity.key
+            for entity in arkiv_client_http.arkiv.query_entities(
+                query=query, options=options
+            )
+        ]
+
+        assert len(prefetched_keys) == num_entities
+        assert prefetched_keys == plain_keys
+        assert set(prefetched_keys) == set(expected_keys)
+
+    def test_iterate_entities_prefetch_executor(
+        self, arkiv_client_offline: Arkiv
+    ) -> None:
+        """Test that prefetching iterators share the module's prefetch executor."""
+        module = arkiv_client_offline.arkiv
+        pages = [
+            QueryPage(
+                entities=[Entity(key=EntityKey(f"0x0{i}"))],
+                block_number=1,
+                cursor=Cursor(f"{i + 1}") if i < 2 else None,
+            )
+            for i in range(3)
+        ]
+
+        executor = module.prefetch_executor
+        assert module.prefetch_executor is executor
+        with (
+            patch.object(module, "query_entities_page", side_effect=pages),
+            patch.object(executor, "submit", wraps=executor.submit) as submit,
+        ):
+            keys = [e.key for e in module.query_entities("$all", prefetch=True)]
+
+        assert keys == ["0x00", "0x01", "0x02"]
+        assert submit.call_count == 2
@@ -4,15 +4,23 @@ import logging
 
 import pytest
 from eth_typing import HexStr
+from hexbytes import HexBytes
 from web3 import Web3
+from web3.datastructures import AttributeDict
 from web3.types import Nonce, TxParams, Wei
 
-from arkiv.contract import ARKIV_ADDRESS
+from arkiv.contract import ARKIV_ADDRESS, DELETED_EVENT_LEGACY, EVENTS_ABI
 from arkiv.exceptions import AttributeException, EntityKeyException
 from arkiv.types import (
     ALL,
+    ATTRIBUTES,
+    CONTENT_TYPE,
+    KEY,
     MAX_RESULTS_PER_PAGE_DEFAULT,
+    QUERY_OPTIONS_DEFAULT,
+    TX_INDEX_IN_BLOCK,
     Attributes,
+    CreateEvent,
     CreateOp,
     DeleteOp,
     EntityKey,
@@ -22,10 +30,18 @@ from arkiv.types import (
     UpdateOp,
 )
 from arkiv.utils import (
+    _to_checksum_address,
+    check_and_set_entity_op_defaults,
     check_entity_key,
+    encode_operations_data,
     entity_key_to_bytes,
+    get_event_data,
+    merge_attributes,
     rlp_encode_transaction,
     split_attributes,
+    to_checksum_address,
+    to_created_entity,
+    to_entity,
     to_entity_key,
     to_rpc_query_options,
     to_tx_params,
@@ -172,6 +188,37 @@ class TestToCreateOperation:
         assert op.attributes == attributes
 
 
+class TestCheckAndSetEntityOpDefaults:
+    """Test cases for check_and_set_entity_op_defaults function."""
+
+    def test_all_arguments_provided(self) -> None:
+        """Test that provided arguments are returned unchanged."""
+        attributes = Attributes({"type": "test"})
+
+        result = check_and_set_entity_op_defaults(
+            b"data", "application/json", attributes, 100
+        )
+
+        assert result == (b"data", "application/json", attributes, 100)
+        assert result[2] is attributes
+
+    def test_defaults_applied(self) -> None:
+        """Test that missing arguments are replaced by defaults."""
+        payload, content_type, attributes, expires_in = (
+            check_and_set_entity_op_defaults(None, None, None, 100)
+        )
+
+        assert payload == b""
+        assert content_type == "application/octet-stream"
+        assert attributes == Attributes({})
+        assert expires_in == 100
+
+    def test_missing_expires_in(self) -> None:
+        """Test that a missing expires_in raises ValueError."""
+        with pytest.raises(ValueError, match="expires_in must be provided"):
+            check_and_set_entity_op_defaults(b"data", "text/plain", None, None)
+
+
 class TestToTxParams:
     """Test cases for to_tx_params function."""
 
@@ -280,6 +327,37 @@ class TestToTxParams:
         assert tx_params["value"] == 0
         assert "data" in tx_params
 
+    def test_to_tx_params_does_not_modify_input(self) -> None:
+        """Test that to_tx_params leaves the provided tx_params untouched."""
+        create_op = CreateOp(
+            payload=b"test",
+            content_type="text/plain",
+            expires_in=0,
+            attributes=Attributes({}),
+        )
+        operations = Operations(creates=[create_op])
+        user_params: TxParams = {"gas": 50000}
+
+        tx_params = to_tx_params(operations, user_params)
+
+        assert user_params == {"gas": 50000}
+        assert tx_params["gas"] == 50000
+        assert tx_params["to"] == ARKIV_ADDRESS
+
+    def test_to_tx_params_data_matches_encoded_operations(self) -> None:
+        """Test that the tx data is the encoded operations payload."""
+        create_op = CreateOp(
+            payload=b"test",
+            content_type="text/plain",
+            expires_in=100,
+            attributes=Attributes({"name": "test"}),
+        )
+        operations = Operations(creates=[create_op])
+
+        tx_params = to_tx_params(operations)
+
+        assert tx_params["data"] == encode_operations_data(operations)
+
 
 class TestRlpEncodeTransaction:
     """Test cases for rlp_encode_transaction function."""
@@ -579,3 +657,209 @@ class TestToRpcQueryOptions:
         rpc_options = to_rpc_query_options(options)
 
         assert int(rpc_options["resultsPerPage"], 16) == max_results_per_page
+
+    def test_include_data_not_shared(self) -> None:
+        """Test that modifying returned includeData does not affect later calls."""
+        rpc_options = to_rpc_query_options(QueryOptions(attributes=KEY))
+        rpc_options["includeData"]["payload"] = True
+
+        rpc_options = to_rpc_query_options(QueryOptions(attributes=KEY))
+        assert rpc_options["includeData"]["key"] is True
+        assert rpc_options["includeData"]["payload"] is False
+
+    def test_default_options_not_shared(self) -> None:
+        """Test that modifying the returned default options does not affect later calls."""
+        rpc_options = to_rpc_query_options(QUERY_OPTIONS_DEFAULT)
+        assert rpc_options == to_rpc_query_options(QueryOptions())
+        rpc_options["atBlock"] = "0x1"
+        rpc_options["includeData"]["payload"] = False
+
+        rpc_options = to_rpc_query_options()
+        assert rpc_options["atBlock"] is None
+        assert rpc_options["includeData"]["payload"] is True
+
+    def test_at_block_hex(self) -> None:
+        """Test that at_block is encoded as hex quantity."""
+        rpc_options = to_rpc_query_options(QueryOptions(at_block=255))
+        assert rpc_options["atBlock"] == "0xff"
+
+
+class TestMergeAttributes:
+    """Test cases for merge_attributes function."""
+
+    def test_merge_attributes_none(self) -> None:
+        """Test merge_attributes with no attributes."""
+        assert merge_attributes(None, None) == {}
+
+    def test_merge_attributes_mixed(self) -> None:
+        """Test merging string and numeric attributes, skipping system attributes."""
+        string_attributes = [
+            AttributeDict({"key": "type", "value": "greeting"}),
+            AttributeDict({"key": "$owner", "value": "0x1234"}),
+        ]
+        numeric_attributes = [
+            AttributeDict({"key": "version", "value": 2}),
+            AttributeDict({"key": "$expiration", "value": 100}),
+        ]
+
+        attributes = merge_attributes(string_attributes, numeric_attributes)  # type: ignore[arg-type]
+
+        assert attributes == {"type": "greeting", "version": 2}
+
+    def test_merge_attributes_skips_mistyped_values(self) -> None:
+        """Test that values with unexpected types are skipped."""
+        string_attributes = [AttributeDict({"key": "type", "value": 1})]
+        numeric_attributes = [AttributeDict({"key": "version", "value": "2"})]
+
+        attributes = merge_attributes(string_attributes, numeric_attributes)  # type: ignore[arg-type]
+
+        assert attributes == {}
+
+
+class TestToEntity:
+    """Test cases for to_entity function."""
+
+    KEY_HEX = "0x" + "ab" * 32
+
+    def test_to_entity_all_fields(self) -> None:
+        """Test conversion of a response item with all fields."""
+        item = AttributeDict(
+            {
+                "key": self.KEY_HEX,
+                "value": "0x68656c6c6f",
+                "contentType": "text/plain",
+                "expiresAt": 100,
+                "owner": "0x" + "cd" * 20,
+                "createdAtBlock": 1,
+                "lastModifiedAtBlock": 2,
+                "transactionIndexInBlock": 3,
+                "operationIndexInTransaction": 4,
+                "stringAttributes": [AttributeDict({"key": "type", "value": "a"})],
+                "numericAttributes": [AttributeDict({"key": "version", "value": 1})],
+            }
+        )
+
+        entity = to_entity(ALL, item)  # type: ignore[arg-type]
+
+        assert entity.key == self.KEY_HEX
+        assert entity.payload == b"hello"
+        assert entity.content_type == "text/plain"
+        assert entity.expires_at_block == 100
+        assert entity.owner == Web3.to_checksum_address("0x" + "cd" * 20)
+        assert entity.created_at_block == 1
+        assert entity.last_modified_at_block == 2
+        assert entity.transaction_index == 3
+        assert entity.operation_index == 4
+        assert entity.attributes == {"type": "a", "version": 1}
+
+    def test_to_entity_selected_fields(self) -> None:
+        """Test that only requested fields are populated."""
+        item = AttributeDict({"key": self.KEY_HEX, "value": "0x00"})
+
+        entity = to_entity(KEY | ATTRIBUTES, item)  # type: ignore[arg-type]
+
+        assert entity.key == self.KEY_HEX
+        assert entity.payload is None
+        assert entity.attributes == {}
+
+    def test_to_entity_missing_required_field(self) -> None:
+        """Test that a missing requested field raises ValueError."""
+        item = AttributeDict({"value": "0x00"})
+
+        with pytest.raises(ValueError, match="missing 'key' field"):
+            to_entity(KEY, item)  # type: ignore[arg-type]
+
+        with pytest.raises(ValueError, match="missing 'contentType' field"):
+            to_entity(KEY | CONTENT_TYPE, AttributeDict({"key": self.KEY_HEX}))  # type: ignore[arg-type]
+
+    def test_to_entity_null_content_type(self) -> None:
+        """Test that a present but null content type is returned as None."""
+        item = AttributeDict({"key": self.KEY_HEX, "contentType": None})
+
+        entity = to_entity(KEY | CONTENT_TYPE, item)  # type: ignore[arg-type]
+
+        assert entity.key == self.KEY_HEX
+        assert entity.content_type is None
+
+    def test_to_checksum_address(self) -> None:
+        """Test that owner addresses are checksummed, also when cached."""
+        address = "0x" + "cd" * 20
+        expected = Web3.to_checksum_address(address)
+
+        assert to_checksum_address(address) == expected
+        hits = _to_checksum_address.cache_info().hits
+        assert to_checksum_address(address) == expected
+        assert to_checksum_address(expected) == expected
+        assert to_checksum_address(address.upper().replace("0X", "0x")) == expected
+        assert _to_checksum_address.cache_info().hits == hits + 3
+        with pytest.raises(ValueError):
+            to_checksum_address("0x1234")
+
+
+class TestToCreatedEntity:
+    """Test cases for to_created_entity function."""
+
+    def test_to_created_entity(self) -> None:
+        """Test building the created entity from create op and receipt event."""
+        key = EntityKey(HexStr("0x" + "ab" * 32))
+        owner = Web3.to_checksum_address("0x" + "cd" * 20)
+        create_op = CreateOp(
+            payload=b"hello",
+            content_type="text/plain",
+            attributes=Attributes({"type": "greeting"}),
+            expires_in=100,
+        )
+        create_event = CreateEvent(
+            key=key, owner_address=owner, expiration_block=150, cost=0
+        )
+
+        entity = to_created_entity(create_op, create_event, 42)
+
+        assert entity.key == key
+        assert entity.owner == owner
+        assert entity.created_at_block == 42
+        assert entity.last_modified_at_block == 42
+        assert entity.expires_at_block == 150
+        assert entity.operation_index == 0
+        assert entity.transaction_index is None
+        assert entity.fields == ALL & ~TX_INDEX_IN_BLOCK
+        assert entity.payload == b"hello"
+        assert entity.content_type == "text/plain"
+        assert entity.attributes == {"type": "greeting"}
+        assert entity.attributes is not create_op.attributes
+
+
+class TestGetEventData:
+    """Test cases for get_event_data function."""
+
+    def _log(self, topic: HexBytes) -> AttributeDict:
+        return AttributeDict(
+            {
+                "address": ARKIV_ADDRESS,
+                "topics": [topic, HexBytes((42).to_bytes(32, "big"))],
+                "data": HexBytes(b""),
+                "blockHash": HexBytes(b"\x01" * 32),
+                "blockNumber": 7,
+                "transactionHash": HexBytes(b"\x02" * 32),
+                "transactionIndex": 0,
+                "logIndex": 0,
+            }
+        )
+
+    def test_event_by_topic(self) -> None:
+        """Test that logs are decoded with the event matching their topic."""
+        contract_ = Web3().eth.contract(address=ARKIV_ADDRESS, abi=EVENTS_ABI)
+        topic = HexBytes(contract_.events[DELETED_EVENT_LEGACY].topic)
+
+        # Repeated lookups are served from the per-contract topic table
+        for _ in range(2):
+            event_data = get_event_data(contract_, self._log(topic))  # type: ignore[arg-type]
+            assert event_data["event"] == DELETED_EVENT_LEGACY
+            assert event_data["args"]["entityKey"] == 42
+
+    def test_unknown_topic(self) -> None:
+        """Test that logs with an unknown topic are rejected."""
+        contract_ = Web3().eth.contract(address=ARKIV_ADDRESS, abi=EVENTS_ABI)
+
+        with pytest.raises(ValueError, match="matching topic"):
+            get_event_data(contract_, self._log(HexBytes(b"\x03" * 32)))  # type: ignore[arg-type]
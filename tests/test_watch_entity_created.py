@@ -2,9 +2,12 @@
 
 import time
 from threading import Event as ThreadEvent
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from arkiv import Arkiv
+from arkiv.events import FilterPoller
 from arkiv.types import Attributes, CreateEvent, CreateOp, TxHash
 
 from .utils import create_entities
@@ -56,6 +59,44 @@ class TestWatchEntityCreated:
             # Cleanup: stop and uninstall the filter
             event_filter.uninstall()
 
+    def test_watch_entity_created_shared_poller(self, arkiv_client_http):
+        """Test that several filters are polled by one shared poller thread."""
+        received: list[tuple[str, str]] = []
+
+        def on_create(name: str):
+            def callback(event: CreateEvent, tx_hash: TxHash) -> None:
+                received.append((name, event.key))
+
+            return callback
+
+        poller = arkiv_client_http.arkiv._filter_poller
+        filter_1 = arkiv_client_http.arkiv.watch_entity_created(on_create("1"))
+        filter_2 = arkiv_client_http.arkiv.watch_entity_created(on_create("2"))
+
+        try:
+            assert poller.is_running
+            assert filter_1._thread is None and filter_2._thread is None
+
+            entity_key, _ = arkiv_client_http.arkiv.create_entity(
+                payload=b"shared poller", expires_in=100
+            )
+
+            # Both filters must receive the event
+            deadline = time.monotonic() + 10.0
+            while time.monotonic() < deadline:
+                receivers = {name for name, key in received if key == entity_key}
+                if receivers == {"1", "2"}:
+                    break
+                time.sleep(0.1)
+            else:
+                pytest.fail("Callbacks were not triggered within timeout")
+
+        finally:
+            filter_1.uninstall()
+            filter_2.uninstall()
+
+        assert not poller.is_running
+
     def test_watch_entity_created_multiple_events(self, arkiv_client_http):
         """Test watching multiple create events."""
         callback_triggered = ThreadEvent()
@@ -292,3 +333,35 @@ class TestWatchEntityCreated:
 
         finally:
             event_filter.uninstall()
+
+
+def test_filter_poller_isolates_filter_errors(arkiv_client_offline: Arkiv) -> None:
+    """Test that an error for one filter does not drop the changes of the others."""
+    poller = FilterPoller(arkiv_client_offline)
+    broken, working = MagicMock(), MagicMock()
+    broken.filter_id = "0x1"
+    working.filter_id = "0x2"
+
+    responses = [
+        {"jsonrpc": "2.0", "id": 0, "error": {"code": -32000, "message": "not found"}},
+        {"jsonrpc": "2.0", "id": 1, "result": []},
+    ]
+    with patch("arkiv.events.make_batch_request", return_value=responses):
+        poller._poll([broken, working])
+
+    broken._process_filter_changes.assert_not_called()
+    working._process_filter_changes.assert_called_once_with([])
+
+    # A batch rejected as a whole falls back to one request per filter
+    with (
+        patch("arkiv.events.make_batch_request", return_value=None),
+        patch.object(
+            poller._w3.eth,
+            "get_filter_changes",
+            side_effect=[ValueError("filter not found"), []],
+        ),
+    ):
+        poller._poll([broken, working])
+
+    broken._process_filter_changes.assert_not_called()
+    assert working._process_filter_changes.call_count == 2